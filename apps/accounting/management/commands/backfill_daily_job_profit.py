@@ -0,0 +1,80 @@
+import logging
+from datetime import date, datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from apps.accounting.services import DailyJobProfitService
+from apps.job.models import AdjustmentEntry, MaterialEntry
+from apps.timesheet.models import TimeEntry
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise CommandError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily job profits from the reality entries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            help="First day to rebuild (YYYY-MM-DD), defaults to the earliest entry",
+        )
+        parser.add_argument(
+            "--end",
+            help="Last day to rebuild (YYYY-MM-DD), defaults to the latest entry",
+        )
+
+    def _get_entry_dates(self):
+        dates = []
+        for model, field in [
+            (TimeEntry, "date"),
+            (MaterialEntry, "accounting_date"),
+            (AdjustmentEntry, "accounting_date"),
+        ]:
+            bounds = model.objects.aggregate(first=Min(field), last=Max(field))
+            dates += [day for day in bounds.values() if day is not None]
+        return dates
+
+    def handle(self, *args, **options):
+        entry_dates = []
+        if not options["start"] or not options["end"]:
+            entry_dates = self._get_entry_dates()
+            if not entry_dates:
+                self.stdout.write("No entries to rebuild daily job profits from")
+                return
+
+        start = (
+            _parse_date(options["start"]) if options["start"] else min(entry_dates)
+        )
+        end = _parse_date(options["end"]) if options["end"] else max(entry_dates)
+        if start > end:
+            raise CommandError("--start must not be after --end")
+
+        start_time = timezone.now()
+        written = 0
+        # A month at a time, so no single transaction holds the whole table
+        month_start = start
+        while month_start <= end:
+            next_month = (month_start.replace(day=1) + timedelta(days=32)).replace(
+                day=1
+            )
+            month_end = min(next_month - timedelta(days=1), end)
+            written += DailyJobProfitService.rebuild(month_start, month_end)
+            month_start = next_month
+
+        duration = (timezone.now() - start_time).total_seconds()
+        logger.info(f"Backfilled {written} daily job profits from {start} to {end}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {written} daily job profits from {start} to {end} "
+                f"in {duration:.2f} seconds"
+            )
+        )
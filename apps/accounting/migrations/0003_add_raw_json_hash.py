@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounting", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bill",
+            name="raw_json_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="creditnote",
+            name="raw_json_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="invoice",
+            name="raw_json_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="quote",
+            name="raw_json_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+    ]
@@ -0,0 +1,184 @@
+# Generated by Django 5.2 on 2026-10-16 21:08
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, DecimalField, F, Sum, Value, When
+
+ZERO = Decimal("0")
+
+
+def build_daily_job_profits(apps, schema_editor):
+    """Copy of DailyJobProfitService._build_facts as it was for this migration"""
+    DailyJobProfit = apps.get_model("accounting", "DailyJobProfit")
+    TimeEntry = apps.get_model("timesheet", "TimeEntry")
+    MaterialEntry = apps.get_model("job", "MaterialEntry")
+    AdjustmentEntry = apps.get_model("job", "AdjustmentEntry")
+
+    money_field = DecimalField(max_digits=14, decimal_places=4)
+    zero = Value(0, output_field=money_field)
+    reality = {"job_pricing__pricing_stage": "reality"}
+    facts = {}
+
+    def get_fact(day, job_id, staff_id=None):
+        key = (day, job_id, staff_id)
+        if key not in facts:
+            facts[key] = DailyJobProfit(date=day, job_id=job_id, staff_id=staff_id)
+        return facts[key]
+
+    time_rows = (
+        TimeEntry.objects.filter(date__isnull=False, **reality)
+        .values("date", "staff_id", job_id=F("job_pricing__job_id"))
+        .annotate(
+            total_hours=Sum("hours"),
+            total_billable_hours=Sum(
+                Case(When(is_billable=True, then="hours"), default=zero),
+                output_field=money_field,
+            ),
+            total_revenue=Sum(
+                Case(
+                    When(is_billable=True, then=F("hours") * F("charge_out_rate")),
+                    default=zero,
+                ),
+                output_field=money_field,
+            ),
+            total_cost=Sum(F("hours") * F("wage_rate"), output_field=money_field),
+        )
+        .order_by()
+    )
+    for row in time_rows:
+        fact = get_fact(row["date"], row["job_id"], row["staff_id"])
+        fact.hours = row["total_hours"] or ZERO
+        fact.billable_hours = row["total_billable_hours"] or ZERO
+        fact.time_revenue = row["total_revenue"] or ZERO
+        fact.time_cost = row["total_cost"] or ZERO
+
+    material_rows = (
+        MaterialEntry.objects.filter(**reality)
+        .values("accounting_date", job_id=F("job_pricing__job_id"))
+        .annotate(
+            revenue=Sum(F("unit_revenue") * F("quantity"), output_field=money_field),
+            cost=Sum(F("unit_cost") * F("quantity"), output_field=money_field),
+        )
+        .order_by()
+    )
+    for row in material_rows:
+        fact = get_fact(row["accounting_date"], row["job_id"])
+        fact.material_revenue = row["revenue"] or ZERO
+        fact.material_cost = row["cost"] or ZERO
+
+    adjustment_rows = (
+        AdjustmentEntry.objects.filter(**reality)
+        .values("accounting_date", job_id=F("job_pricing__job_id"))
+        .annotate(revenue=Sum("price_adjustment"), cost=Sum("cost_adjustment"))
+        .order_by()
+    )
+    for row in adjustment_rows:
+        fact = get_fact(row["accounting_date"], row["job_id"])
+        fact.adjustment_revenue = row["revenue"] or ZERO
+        fact.adjustment_cost = row["cost"] or ZERO
+
+    DailyJobProfit.objects.bulk_create(facts.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounting", "0003_add_raw_json_hash"),
+        ("job", "0024_month_end_run"),
+        ("timesheet", "0002_alter_timeentry_job_pricing_fk"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyJobProfit",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                (
+                    "hours",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0"), max_digits=12
+                    ),
+                ),
+                (
+                    "billable_hours",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0"), max_digits=12
+                    ),
+                ),
+                (
+                    "time_revenue",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=Decimal("0"),
+                        help_text="Charge-out value of the billable hours",
+                        max_digits=14,
+                    ),
+                ),
+                (
+                    "time_cost",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0"), max_digits=14
+                    ),
+                ),
+                (
+                    "material_revenue",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0"), max_digits=14
+                    ),
+                ),
+                (
+                    "material_cost",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0"), max_digits=14
+                    ),
+                ),
+                (
+                    "adjustment_revenue",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0"), max_digits=12
+                    ),
+                ),
+                (
+                    "adjustment_cost",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0"), max_digits=12
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_profits",
+                        to="job.job",
+                    ),
+                ),
+                (
+                    "staff",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_job_profits",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date", "job"],
+                "indexes": [
+                    models.Index(
+                        fields=["date", "job"], name="daily_job_profit_date_idx"
+                    ),
+                    models.Index(
+                        fields=["job", "date"], name="daily_job_profit_job_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(build_daily_job_profits, migrations.RunPython.noop),
+    ]
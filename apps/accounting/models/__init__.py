@@ -1,9 +1,11 @@
 # This file is autogenerated by update_init.py script
 
+from .daily_job_profit import DailyJobProfit
 from .invoice import BaseXeroInvoiceDocument, BaseLineItem, Invoice, Bill, CreditNote, InvoiceLineItem, BillLineItem, CreditNoteLineItem
 from .quote import Quote
 
 __all__ = [
+    'DailyJobProfit',
     'BaseXeroInvoiceDocument',
     'BaseLineItem',
     'Invoice',
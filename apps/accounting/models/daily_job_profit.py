@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+from django.db import models
+
+
+class DailyJobProfit(models.Model):
+    """
+    The reality time, material and adjustment entries of a job summed per
+    day and staff member, for KPI and profitability reports.
+
+    Rows are derived data: DailyJobProfitService rebuilds the rows of a day
+    and job whenever an entry dated that day changes, and the
+    backfill_daily_job_profit command rebuilds any range of days. Material
+    and adjustment entries, and time entries without a staff member, are on
+    the row with no staff.
+
+    Billable hours and revenue count every billable time entry, shop jobs
+    included; reports leave the shop's out by the job's client.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    date = models.DateField()
+    job = models.ForeignKey(
+        "job.Job", on_delete=models.CASCADE, related_name="daily_profits"
+    )
+    staff = models.ForeignKey(
+        "accounts.Staff",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="daily_job_profits",
+    )
+
+    hours = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0"))
+    billable_hours = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0")
+    )
+    time_revenue = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        default=Decimal("0"),
+        help_text="Charge-out value of the billable hours",
+    )
+    time_cost = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0")
+    )
+    material_revenue = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0")
+    )
+    material_cost = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0")
+    )
+    adjustment_revenue = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0")
+    )
+    adjustment_cost = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0")
+    )
+
+    class Meta:
+        ordering = ["date", "job"]
+        indexes = [
+            models.Index(fields=["date", "job"], name="daily_job_profit_date_idx"),
+            models.Index(fields=["job", "date"], name="daily_job_profit_job_idx"),
+        ]
+
+    def __str__(self):
+        return f"Job {self.job_id} on {self.date}"
+
+    @property
+    def revenue(self) -> Decimal:
+        return self.time_revenue + self.material_revenue + self.adjustment_revenue
+
+    @property
+    def cost(self) -> Decimal:
+        return self.time_cost + self.material_cost + self.adjustment_cost
@@ -36,6 +36,8 @@ class BaseXeroInvoiceDocument(models.Model):
     xero_last_modified = models.DateTimeField()
     xero_last_synced = models.DateTimeField(null=True, blank=True, default=timezone.now)
     raw_json = models.JSONField()
+    # Digest of raw_json, so syncs can skip records Xero sends back unchanged
+    raw_json_hash = models.CharField(max_length=32, null=True, blank=True)
     django_created_at = models.DateTimeField(auto_now_add=True)
     django_updated_at = models.DateTimeField(auto_now=True)
 
@@ -26,6 +26,8 @@ class Quote(models.Model):
     xero_last_synced = models.DateTimeField(default=timezone.now)
     online_url = models.URLField(null=True, blank=True)
     raw_json = models.JSONField(null=True, blank=True)
+    # Digest of raw_json, so syncs can skip records Xero sends back unchanged
+    raw_json_hash = models.CharField(max_length=32, null=True, blank=True)
 
     def __str__(self):
         return f"Quote ({self.status}) for Job {self.job.job_number}"
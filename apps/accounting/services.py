@@ -2,7 +2,9 @@ import datetime
 
 import calendar
 
-import holidays
+import hashlib
+
+from collections import defaultdict
 
 from decimal import Decimal
 
@@ -10,27 +12,212 @@ from typing import List, Dict, Any, Tuple
 
 from datetime import date, timedelta
 
-from django.db.models import Sum, Case, When, F, DecimalField, Value, Q
+from django.core.cache import cache
+
+from django.db import transaction
 
-from django.db.models.functions import TruncDate
+from django.db.models import Sum, Case, When, F, DecimalField, Value, Q, Count, Max
 
-from django.utils import timezone
+from django.db.models.functions import TruncMonth
 
 from logging import getLogger
 
 from apps.workflow.models import CompanyDefaults
-from apps.accounting.utils import get_nz_tz
+from apps.accounting.models import DailyJobProfit
+from apps.accounting.utils import get_nz_holidays, get_nz_tz
 
 from apps.accounts.utils import get_excluded_staff
 
 from apps.timesheet.models import TimeEntry
 
-from apps.job.models import AdjustmentEntry, MaterialEntry
+from apps.job.models import AdjustmentEntry, JobPricing, MaterialEntry
 from apps.client.models import Client
 from apps.job.enums import JobPricingStage
 
 logger = getLogger(__name__)
 
+# Ended months are cached under a fingerprint of their entries, so an entry
+# changing gives its month a new key rather than needing to clear the old one
+MONTH_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+THRESHOLDS_CACHE_KEY = "kpi_company_thresholds"
+THRESHOLDS_CACHE_TIMEOUT = 60 * 5
+
+# Daily sums of the time entries
+TIME_SUMS = (
+    "total_hours",
+    "billable_hours",
+    "time_revenue",
+    "shop_hours",
+    "staff_cost",
+)
+
+
+class DailyJobProfitService:
+    """
+    Keeps the DailyJobProfit facts in step with the reality entries.
+
+    Facts are always rebuilt from the entries for whole days of a job,
+    never adjusted in place, so refreshing the same day twice is harmless.
+    """
+
+    @staticmethod
+    def _get_entries(model, date_field: str, job_ids=None, dates=None, date_range=None):
+        entries = model.objects.filter(
+            job_pricing__pricing_stage=JobPricingStage.REALITY,
+            **{f"{date_field}__isnull": False},
+        )
+        if job_ids is not None:
+            entries = entries.filter(job_pricing__job_id__in=job_ids)
+        if dates is not None:
+            entries = entries.filter(**{f"{date_field}__in": dates})
+        if date_range is not None:
+            entries = entries.filter(**{f"{date_field}__range": date_range})
+        return entries.order_by()
+
+    @classmethod
+    def _build_facts(cls, **filters) -> List[DailyJobProfit]:
+        """Sums the reality entries matching filters into facts, unsaved"""
+        money_field = DecimalField(max_digits=14, decimal_places=4)
+        zero = Value(0, output_field=money_field)
+        facts = {}
+
+        def get_fact(day, job_id, staff_id=None):
+            key = (day, job_id, staff_id)
+            if key not in facts:
+                facts[key] = DailyJobProfit(date=day, job_id=job_id, staff_id=staff_id)
+            return facts[key]
+
+        time_rows = (
+            cls._get_entries(TimeEntry, "date", **filters)
+            .values("date", "staff_id", job_id=F("job_pricing__job_id"))
+            .annotate(
+                total_hours=Sum("hours"),
+                total_billable_hours=Sum(
+                    Case(When(is_billable=True, then="hours"), default=zero),
+                    output_field=money_field,
+                ),
+                total_revenue=Sum(
+                    Case(
+                        When(is_billable=True, then=F("hours") * F("charge_out_rate")),
+                        default=zero,
+                    ),
+                    output_field=money_field,
+                ),
+                total_cost=Sum(F("hours") * F("wage_rate"), output_field=money_field),
+            )
+        )
+        for row in time_rows:
+            fact = get_fact(row["date"], row["job_id"], row["staff_id"])
+            fact.hours = row["total_hours"] or 0
+            fact.billable_hours = row["total_billable_hours"] or 0
+            fact.time_revenue = row["total_revenue"] or 0
+            fact.time_cost = row["total_cost"] or 0
+
+        material_rows = (
+            cls._get_entries(MaterialEntry, "accounting_date", **filters)
+            .values("accounting_date", job_id=F("job_pricing__job_id"))
+            .annotate(
+                revenue=Sum(
+                    F("unit_revenue") * F("quantity"), output_field=money_field
+                ),
+                cost=Sum(F("unit_cost") * F("quantity"), output_field=money_field),
+            )
+        )
+        for row in material_rows:
+            fact = get_fact(row["accounting_date"], row["job_id"])
+            fact.material_revenue = row["revenue"] or 0
+            fact.material_cost = row["cost"] or 0
+
+        adjustment_rows = (
+            cls._get_entries(AdjustmentEntry, "accounting_date", **filters)
+            .values("accounting_date", job_id=F("job_pricing__job_id"))
+            .annotate(revenue=Sum("price_adjustment"), cost=Sum("cost_adjustment"))
+        )
+        for row in adjustment_rows:
+            fact = get_fact(row["accounting_date"], row["job_id"])
+            fact.adjustment_revenue = row["revenue"] or 0
+            fact.adjustment_cost = row["cost"] or 0
+
+        return list(facts.values())
+
+    @classmethod
+    def refresh(cls, dates, job_ids) -> int:
+        """
+        Rebuilds the facts of the given jobs on the given days.
+
+        Returns:
+            The number of facts written
+        """
+        dates, job_ids = set(dates), set(job_ids)
+        if not dates or not job_ids:
+            return 0
+        with transaction.atomic():
+            DailyJobProfit.objects.filter(date__in=dates, job_id__in=job_ids).delete()
+            facts = cls._build_facts(dates=dates, job_ids=job_ids)
+            DailyJobProfit.objects.bulk_create(facts, batch_size=1000)
+        return len(facts)
+
+    @classmethod
+    def refresh_for_entries(cls, report_keys) -> int:
+        """
+        Rebuilds the facts entries count towards, given the (date,
+        job_pricing_id) of each entry both before and after it changed.
+        Entries of estimates and quotes have no facts.
+        """
+        report_keys = {key for key in report_keys if key and all(key)}
+        if not report_keys:
+            return 0
+        job_ids = dict(
+            JobPricing.objects.filter(
+                pk__in={pricing_id for _, pricing_id in report_keys},
+                pricing_stage=JobPricingStage.REALITY,
+            ).values_list("pk", "job_id")
+        )
+        return cls.refresh_days(
+            {
+                (day, job_ids[pricing_id])
+                for day, pricing_id in report_keys
+                if pricing_id in job_ids
+            }
+        )
+
+    @classmethod
+    def get_entry_days(cls, model, date_field: str, **filters) -> set:
+        """
+        The (date, job_id) of the facts the reality entries of model matching
+        filters count towards. For deletes, which must read these first.
+        """
+        return set(
+            cls._get_entries(model, date_field)
+            .filter(**filters)
+            .values_list(date_field, "job_pricing__job_id")
+            .distinct()
+        )
+
+    @classmethod
+    def refresh_days(cls, days) -> int:
+        """Rebuilds the facts of the given (date, job_id) pairs."""
+        # Every job for every day is rebuilt, a few more than changed when
+        # several jobs and days did, but never fewer
+        return cls.refresh({day for day, _ in days}, {job_id for _, job_id in days})
+
+    @classmethod
+    def rebuild(cls, start_date: date, end_date: date) -> int:
+        """
+        Rebuilds every fact from start_date to end_date inclusive.
+
+        Returns:
+            The number of facts written
+        """
+        with transaction.atomic():
+            DailyJobProfit.objects.filter(date__range=[start_date, end_date]).delete()
+            facts = cls._build_facts(date_range=[start_date, end_date])
+            DailyJobProfit.objects.bulk_create(facts, batch_size=1000)
+        logger.info(
+            f"Rebuilt {len(facts)} daily job profits from {start_date} to {end_date}"
+        )
+        return len(facts)
+
 
 class KPIService:
     """
@@ -55,6 +242,10 @@ class KPIService:
         Returns:
             Dict containing thresholds for KPI metrics
         """
+        thresholds = cache.get(THRESHOLDS_CACHE_KEY)
+        if thresholds is not None:
+            return thresholds
+
         logger.info("Retrieving company thresholds for KPI calculations")
         try:
             company_defaults: CompanyDefaults = CompanyDefaults.objects.first()
@@ -71,26 +262,16 @@ class KPIService:
                 ),
             }
             logger.debug(f"Retrieved thresholds: {thresholds}")
+            cache.set(THRESHOLDS_CACHE_KEY, thresholds, THRESHOLDS_CACHE_TIMEOUT)
             return thresholds
         except Exception as e:
             logger.error(f"Error retrieving company defaults: {str(e)}")
             raise
 
     @staticmethod
-    def _process_entries(
-        entries: Dict, revenue_key="revenue", cost_key="cost"
-    ) -> Dict[datetime.date, Dict]:
-        """
-        Segregates entries by date based on the provided Dict
-        """
-        entries_by_date = {
-            entry["local_date"]: {
-                "revenue": entry.get(revenue_key) or 0,
-                "cost": entry.get(cost_key) or 0,
-            }
-            for entry in entries
-        }
-        return entries_by_date
+    def clear_company_thresholds() -> None:
+        """Drops the cached thresholds, for when CompanyDefaults change"""
+        cache.delete(THRESHOLDS_CACHE_KEY)
 
     @classmethod
     def _get_holidays(cls, year, month=None):
@@ -104,7 +285,7 @@ class KPIService:
         Returns:
             Set of dates that are holidays
         """
-        nz_holidays = holidays.country_holidays("NZ", years=year)
+        nz_holidays = get_nz_holidays(year)
 
         if month:
             return {
@@ -144,125 +325,165 @@ class KPIService:
             return "amber"
         return "red"
 
+    @classmethod
+    def _get_daily_figures(
+        cls, start_date: date, end_date: date, excluded_staff_ids: List[str]
+    ) -> Dict[date, Dict[str, Dict]]:
+        """
+        Sums the daily job profits within a range, by day and by job.
+
+        Everything the calendar shows for a day, its job breakdown included,
+        comes from this one query grouped by day and job, however many days
+        the range covers.
+
+        Returns:
+            Dict of date to the day's "time", "material" and "adjustment" sums
+            and its "jobs", the figures of each job worked on that day. Days
+            without entries are left out.
+        """
+        decimal_field = DecimalField(max_digits=14, decimal_places=4)
+        zero = Value(0, output_field=decimal_field)
+        is_shop = Q(job__client_id=cls.shop_client_id)
+
+        figures = defaultdict(
+            lambda: {"time": {}, "material": {}, "adjustment": {}, "jobs": {}}
+        )
+
+        rows = (
+            DailyJobProfit.objects.filter(date__range=[start_date, end_date])
+            .exclude(staff_id__in=excluded_staff_ids)
+            .values("date", job_number=F("job__job_number"))
+            .annotate(
+                total_hours=Sum("hours"),
+                # Time on shop jobs is never billable
+                billable_hours=Sum(
+                    Case(When(~is_shop, then="billable_hours"), default=zero),
+                    output_field=decimal_field,
+                ),
+                time_revenue=Sum(
+                    Case(When(~is_shop, then="time_revenue"), default=zero),
+                    output_field=decimal_field,
+                ),
+                shop_hours=Sum(
+                    Case(When(is_shop, then="hours"), default=zero),
+                    output_field=decimal_field,
+                ),
+                staff_cost=Sum("time_cost"),
+                revenue_material=Sum("material_revenue"),
+                cost_material=Sum("material_cost"),
+                revenue_adjustment=Sum("adjustment_revenue"),
+                cost_adjustment=Sum("adjustment_cost"),
+            )
+            .order_by()
+        )
+        for row in rows:
+            day = figures[row["date"]]
+            cls._add_sums(day["time"], row, TIME_SUMS)
+            day["material"]["revenue"] = (
+                day["material"].get("revenue", 0) + row["revenue_material"]
+            )
+            day["material"]["cost"] = (
+                day["material"].get("cost", 0) + row["cost_material"]
+            )
+            day["adjustment"]["revenue"] = (
+                day["adjustment"].get("revenue", 0) + row["revenue_adjustment"]
+            )
+            day["adjustment"]["cost"] = (
+                day["adjustment"].get("cost", 0) + row["cost_adjustment"]
+            )
+            day["jobs"][row["job_number"]] = {
+                "labour_revenue": float(row["time_revenue"]),
+                "labour_cost": float(row["staff_cost"]),
+                "material_revenue": float(row["revenue_material"]),
+                "material_cost": float(row["cost_material"]),
+                "adjustment_revenue": float(row["revenue_adjustment"]),
+                "adjustment_cost": float(row["cost_adjustment"]),
+            }
+
+        logger.debug(
+            f"Retrieved data for {len(figures)} days from {start_date} to {end_date}"
+        )
+        return figures
+
+    @staticmethod
+    def _add_sums(totals: Dict, row: Dict, names) -> None:
+        for name in names:
+            totals[name] = totals.get(name, 0) + (row[name] or 0)
+
+    @staticmethod
+    def _get_job_breakdown(jobs: Dict[int, Dict[str, float]]) -> List[Dict[str, Any]]:
+        """Profit of each job worked on in a day, most profitable first"""
+        result = []
+        for job_number, data in jobs.items():
+            labour_profit = data["labour_revenue"] - data["labour_cost"]
+            material_profit = data["material_revenue"] - data["material_cost"]
+            adjustment_profit = data["adjustment_revenue"] - data["adjustment_cost"]
+            result.append(
+                {
+                    "job_number": job_number,
+                    "labour_profit": labour_profit,
+                    "material_profit": material_profit,
+                    "adjustment_profit": adjustment_profit,
+                    "total_profit": labour_profit + material_profit + adjustment_profit,
+                }
+            )
+
+        # Sort by total profit descending
+        result.sort(key=lambda x: x["total_profit"], reverse=True)
+        return result
+
     @classmethod
     def get_job_breakdown_for_date(cls, target_date: date) -> List[Dict[str, Any]]:
         """
         Get job-level profit breakdown for a specific date
-        
+
         Args:
             target_date: The date to get job breakdown for
-            
+
         Returns:
             List of job breakdowns with profit details
         """
-        from apps.job.models import Job
-        
         cls._ensure_shop_client_id()
-        excluded_staff_ids = get_excluded_staff()
-        # Get time entries for the date
-        time_entries = TimeEntry.objects.filter(
-            date=target_date,
-            job_pricing__pricing_stage=JobPricingStage.REALITY
-        ).exclude(staff_id__in=excluded_staff_ids).select_related('job_pricing__job')
-        
-        # Get material entries for the date
-        aware_start = timezone.make_aware(
-            datetime.datetime.combine(target_date, datetime.time.min), cls.nz_timezone
+        figures = cls._get_daily_figures(
+            target_date, target_date, get_excluded_staff()
         )
-        aware_end = timezone.make_aware(
-            datetime.datetime.combine(target_date, datetime.time.max), cls.nz_timezone
+        return cls._get_job_breakdown(figures.get(target_date, {}).get("jobs", {}))
+
+    @staticmethod
+    def _get_month_stamps(start_date: date, end_date: date) -> Dict[date, Tuple]:
+        """
+        Fingerprints the daily job profits of each month of a range, by how
+        many there are and the newest of them. They are rewritten with new ids
+        whenever an entry dated that day changes, so the fingerprint of its
+        month changes with it.
+
+        Returns:
+            Dict of the first day of each month to its fingerprint
+        """
+        rows = (
+            DailyJobProfit.objects.filter(date__range=[start_date, end_date])
+            .annotate(month=TruncMonth("date"))
+            .values("month")
+            .annotate(count=Count("id"), latest=Max("id"))
+            .order_by()
         )
-        
-        material_entries = MaterialEntry.objects.filter(
-            accounting_date=target_date,
-            job_pricing__pricing_stage=JobPricingStage.REALITY
-        ).select_related('job_pricing__job')
-        
-        adjustment_entries = AdjustmentEntry.objects.filter(
-            accounting_date=target_date,
-            job_pricing__pricing_stage=JobPricingStage.REALITY
-        ).select_related('job_pricing__job')
-        
-        # Group by job
-        job_data = {}
-        
-        # Process time entries
-        for entry in time_entries:
-            job = entry.job_pricing.job
-            job_number = job.job_number
-            
-            if job_number not in job_data:
-                job_data[job_number] = {
-                    'job_number': job_number,
-                    'labour_revenue': 0,
-                    'labour_cost': 0,
-                    'material_revenue': 0,
-                    'material_cost': 0,
-                    'adjustment_revenue': 0,
-                    'adjustment_cost': 0,
-                }
-            
-            if entry.is_billable and str(job.client_id) != cls.shop_client_id:
-                job_data[job_number]['labour_revenue'] += float(entry.hours * entry.charge_out_rate)
-            job_data[job_number]['labour_cost'] += float(entry.hours * entry.wage_rate)
-        
-        # Process material entries
-        for entry in material_entries:
-            job = entry.job_pricing.job
-            job_number = job.job_number
-            
-            if job_number not in job_data:
-                job_data[job_number] = {
-                    'job_number': job_number,
-                    'labour_revenue': 0,
-                    'labour_cost': 0,
-                    'material_revenue': 0,
-                    'material_cost': 0,
-                    'adjustment_revenue': 0,
-                    'adjustment_cost': 0,
-                }
-            
-            job_data[job_number]['material_revenue'] += float(entry.unit_revenue * entry.quantity)
-            job_data[job_number]['material_cost'] += float(entry.unit_cost * entry.quantity)
-        
-        # Process adjustment entries
-        for entry in adjustment_entries:
-            job = entry.job_pricing.job
-            job_number = job.job_number
-            
-            if job_number not in job_data:
-                job_data[job_number] = {
-                    'job_number': job_number,
-                    'labour_revenue': 0,
-                    'labour_cost': 0,
-                    'material_revenue': 0,
-                    'material_cost': 0,
-                    'adjustment_revenue': 0,
-                    'adjustment_cost': 0,
-                }
-            
-            job_data[job_number]['adjustment_revenue'] += float(entry.price_adjustment or 0)
-            job_data[job_number]['adjustment_cost'] += float(entry.cost_adjustment or 0)
-        
-        # Calculate profits and return sorted list
-        result = []
-        for job_number, data in job_data.items():
-            labour_profit = data['labour_revenue'] - data['labour_cost']
-            material_profit = data['material_revenue'] - data['material_cost']
-            adjustment_profit = data['adjustment_revenue'] - data['adjustment_cost']
-            total_profit = labour_profit + material_profit + adjustment_profit
-            
-            result.append({
-                'job_number': job_number,
-                'labour_profit': labour_profit,
-                'material_profit': material_profit,
-                'adjustment_profit': adjustment_profit,
-                'total_profit': total_profit
-            })
-        
-        # Sort by total profit descending
-        result.sort(key=lambda x: x['total_profit'], reverse=True)
-        return result
+        return {row["month"]: (row["count"], row["latest"]) for row in rows}
+
+    @staticmethod
+    def _get_month_cache_key(year: int, month: int, stamp: Tuple, context) -> str:
+        digest = hashlib.sha1(repr((stamp, context)).encode()).hexdigest()
+        return f"kpi_calendar:{year}-{month:02d}:{digest}"
+
+    @staticmethod
+    def _get_months(
+        start_year: int, start_month: int, end_year: int, end_month: int
+    ) -> List[Tuple[int, int]]:
+        months = []
+        year, month = start_year, start_month
+        while (year, month) <= (end_year, end_month):
+            months.append((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return months
 
     @classmethod
     def get_calendar_data(cls, year: int, month: int) -> Dict[str, Any]:
@@ -277,16 +498,91 @@ class KPIService:
             Dict containing calendar data, monthly totals and threshold informations
         """
         logger.info(f"Generating KPI calendar data for {year}-{month}")
+        return cls.get_calendar_range_data(year, month, year, month)[0]
+
+    @classmethod
+    def get_calendar_range_data(
+        cls, start_year: int, start_month: int, end_year: int, end_month: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets all KPI data for each month of a range, as get_calendar_data does
+        for one.
+
+        Months that have ended are cached until an entry dated in them changes.
+        The others are computed from one set of grouped queries spanning them
+        all, rather than month by month.
+
+        Returns:
+            List of the months' calendar data, in order
+        """
+        months = cls._get_months(start_year, start_month, end_year, end_month)
+        logger.info(f"Generating KPI calendar data for {len(months)} months")
 
         cls._ensure_shop_client_id()
         thresholds = cls.get_company_thresholds()
         logger.debug(
             f"Using thresholds: green={thresholds['billable_threshold_green']}, amber={thresholds['billable_threshold_amber']}"
         )
-
-        start_date, end_date, _ = cls.get_month_days_range(year, month)
         excluded_staff_ids = get_excluded_staff()
         logger.debug(f"Excluded staff IDs: {excluded_staff_ids}")
+        today = datetime.date.today()
+
+        # Everything besides the entries that a month's figures depend on
+        context = (
+            cls.shop_client_id,
+            sorted(excluded_staff_ids),
+            sorted(thresholds.items()),
+        )
+        results = {}
+        cache_keys = {}
+        finalised = [
+            (year, month)
+            for year, month in months
+            if cls.get_month_days_range(year, month)[1] < today
+        ]
+        if finalised:
+            stamps = cls._get_month_stamps(
+                date(*finalised[0], 1), cls.get_month_days_range(*finalised[-1])[1]
+            )
+            for year, month in finalised:
+                stamp = stamps.get(date(year, month, 1))
+                cache_keys[(year, month)] = cls._get_month_cache_key(
+                    year, month, stamp, context
+                )
+            cached = cache.get_many(cache_keys.values())
+            for key, cache_key in cache_keys.items():
+                if cache_key in cached:
+                    results[key] = cached[cache_key]
+            logger.debug(f"{len(results)} of {len(finalised)} ended months cached")
+
+        missing = [key for key in months if key not in results]
+        if missing:
+            start_date = date(*missing[0], 1)
+            _, end_date, _ = cls.get_month_days_range(*missing[-1])
+            figures = cls._get_daily_figures(start_date, end_date, excluded_staff_ids)
+            for year, month in missing:
+                month_data = cls._build_month_data(
+                    year, month, thresholds, figures, today
+                )
+                results[(year, month)] = month_data
+                if (year, month) in cache_keys:
+                    cache.set(
+                        cache_keys[(year, month)], month_data, MONTH_CACHE_TIMEOUT
+                    )
+
+        return [results[key] for key in months]
+
+    @classmethod
+    def _build_month_data(
+        cls,
+        year: int,
+        month: int,
+        thresholds: Dict[str, float],
+        figures: Dict[date, Dict[str, Dict]],
+        today: date,
+    ) -> Dict[str, Any]:
+        """Walks the days of a month, building its calendar and totals"""
+        start_date, end_date, _ = cls.get_month_days_range(year, month)
 
         calendar_data = {}
         monthly_totals: Dict[str, float] = {
@@ -317,101 +613,11 @@ class KPIService:
             "adjustment_profit": 0,
         }
 
-        decimal_field = DecimalField(max_digits=10, decimal_places=2)
-        # Process data of the day - ONLY reality entries
-        time_entries_by_date = {
-            entry["date"]: entry
-            for entry in TimeEntry.objects.filter(
-                date__range=[start_date, end_date],
-                job_pricing__pricing_stage=JobPricingStage.REALITY
-            )
-            .exclude(staff_id__in=excluded_staff_ids)
-            .values("date")
-            .annotate(
-                total_hours=Sum("hours", output_field=decimal_field),
-                billable_hours=Sum(
-                    Case(
-                        When(
-                            is_billable=True,
-                            then=Case(
-                                When(job_pricing__job__client_id=cls.shop_client_id, then=Value(0, output_field=decimal_field)),
-                                default="hours"
-                            )
-                        ),
-                        default=Value(0, output_field=decimal_field),
-                    ),
-                    output_field=decimal_field,
-                ),
-                time_revenue=Sum(
-                    Case(
-                        When(
-                            is_billable=True,
-                            then=Case(
-                                When(job_pricing__job__client_id=cls.shop_client_id, then=Value(0, output_field=decimal_field)),
-                                default=F("hours") * F("charge_out_rate")
-                            )
-                        ),
-                        default=Value(0, output_field=decimal_field),
-                    ),
-                    output_field=decimal_field,
-                ),
-                shop_hours=Sum(
-                    Case(
-                        When(job_pricing__job__client_id=cls.shop_client_id, then="hours"),
-                        default=Value(0, output_field=decimal_field),
-                    ),
-                    output_field=decimal_field,
-                ),
-                staff_cost=Sum(F("hours") * F("wage_rate"), output_field=decimal_field),
-            )
-        }
-
-        aware_start = timezone.make_aware(
-            datetime.datetime.combine(start_date, datetime.time.min), cls.nz_timezone
-        )
-        aware_end = timezone.make_aware(
-            datetime.datetime.combine(end_date, datetime.time.max), cls.nz_timezone
-        )
-
-        material_entries = (
-            MaterialEntry.objects.filter(
-                accounting_date__range=[start_date, end_date],
-                job_pricing__pricing_stage=JobPricingStage.REALITY
-            )
-            .annotate(local_date=F("accounting_date"))
-            .values("local_date")
-            .annotate(
-                revenue=Sum(
-                    F("unit_revenue") * F("quantity"), output_field=decimal_field
-                ),
-                cost=Sum(F("unit_cost") * F("quantity"), output_field=decimal_field),
-            )
-        )
-
-        adjustment_entries = (
-            AdjustmentEntry.objects.filter(
-                accounting_date__range=[start_date, end_date],
-                job_pricing__pricing_stage=JobPricingStage.REALITY
-            )
-            .annotate(local_date=F("accounting_date"))
-            .values("local_date")
-            .annotate(
-                revenue=Sum(F("price_adjustment")), cost=Sum(F("cost_adjustment"))
-            )
-        )
-
-        material_by_date = cls._process_entries(material_entries)
-
-        adjustment_by_date = cls._process_entries(adjustment_entries)
-
-        logger.debug(f"Retrieved data for {len(time_entries_by_date)} days")
-
         holiday_dates = cls._get_holidays(year, month)
         logger.debug(f"Holidays in {year}-{month}: {holiday_dates}")
 
         # For each day of the month
         current_date = start_date
-        current_date_system = datetime.date.today()
         while current_date <= end_date:
             # Skip weekends (5=Saturday, 6=Sunday)
             if current_date.weekday() >= 5:
@@ -429,7 +635,7 @@ class KPIService:
 
             # Count all weekdays (including holidays) as working days
             monthly_totals["working_days"] += 1
-            if current_date <= current_date_system:
+            if current_date <= today:
                 monthly_totals["elapsed_workdays"] += 1
 
             if is_holiday:
@@ -440,26 +646,10 @@ class KPIService:
 
             logger.debug(f"Processing data for day: {current_date}")
 
-            time_entry = time_entries_by_date.get(
-                current_date,
-                {
-                    "total_hours": 0,
-                    "billable_hours": 0,
-                    "shop_hours": 0,
-                    "time_revenue": 0,
-                    "staff_cost": 0,
-                    "material_revenue": 0,
-                    "material_cost": 0,
-                },
-            )
-
-            material_entry = material_by_date.get(
-                current_date, {"revenue": 0, "cost": 0}
-            )
-
-            adjustment_entry = adjustment_by_date.get(
-                current_date, {"revenue": 0, "cost": 0}
-            )
+            day_figures = figures.get(current_date, {})
+            time_entry = day_figures.get("time", {})
+            material_entry = day_figures.get("material", {})
+            adjustment_entry = day_figures.get("adjustment", {})
 
             billable_hours = time_entry.get("billable_hours") or 0
             total_hours = time_entry.get("total_hours") or 0
@@ -551,7 +741,9 @@ class KPIService:
                                 adjustment_revenue - adjustment_cost
                             ),
                         },
-                        "job_breakdown": cls.get_job_breakdown_for_date(current_date),
+                        "job_breakdown": cls._get_job_breakdown(
+                            day_figures.get("jobs", {})
+                        ),
                     },
                 }
             )
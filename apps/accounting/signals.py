@@ -0,0 +1,48 @@
+"""
+Deleting a staff member or a job pricing cascades to their entries in the
+database collector, which skips the entry delete paths that refresh the
+daily job profits. These handlers refresh the facts of the days the entries
+were on instead.
+"""
+
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import receiver
+
+from apps.accounting.services import DailyJobProfitService
+from apps.accounts.models import Staff
+from apps.job.models import AdjustmentEntry, JobPricing, MaterialEntry
+from apps.timesheet.models import TimeEntry
+
+ENTRY_DATE_FIELDS = (
+    (TimeEntry, "date"),
+    (MaterialEntry, "accounting_date"),
+    (AdjustmentEntry, "accounting_date"),
+)
+
+
+@receiver(pre_delete, sender=Staff)
+def remember_staff_days(sender, instance, **kwargs):
+    # Read while the entries and their pricings are still there
+    instance._daily_job_profit_days = DailyJobProfitService.get_entry_days(
+        TimeEntry, "date", staff=instance
+    )
+
+
+@receiver(pre_delete, sender=JobPricing)
+def remember_pricing_days(sender, instance, **kwargs):
+    instance._daily_job_profit_days = set().union(
+        *(
+            DailyJobProfitService.get_entry_days(
+                model, date_field, job_pricing=instance
+            )
+            for model, date_field in ENTRY_DATE_FIELDS
+        )
+    )
+
+
+@receiver(post_delete, sender=Staff)
+@receiver(post_delete, sender=JobPricing)
+def refresh_deleted_days(sender, instance, **kwargs):
+    DailyJobProfitService.refresh_days(
+        getattr(instance, "_daily_job_profit_days", set())
+    )
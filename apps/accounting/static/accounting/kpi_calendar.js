@@ -671,6 +671,32 @@ class CalendarDataService {
     }
   }
 
+  /**
+   * Fetches the calendar data of every month from start to end in one call, for trend views
+   *
+   * @param {String} start First month of the range, as YYYY-MM
+   * @param {String} end Last month of the range, as YYYY-MM
+   * @returns {Array<Object>} The data of each month, validated, in order
+   */
+  async fetchCalendarRangeData(start, end) {
+    try {
+      const response = await fetch(
+        `${this.apiBaseUrl}/range/?start=${start}&end=${end}`,
+      );
+
+      if (!response.ok) {
+        throw new Error(`API responded with status ${response.status}`);
+      }
+
+      const data = await response.json();
+
+      return data.months.map((month) => this.#validateData(month));
+    } catch (error) {
+      console.error("Error fetching calendar range data:", error);
+      throw error;
+    }
+  }
+
   /**
    * Validates the data received from the back-end, falling back for fallback values or throwing an error if it's in an invalid format
    *
@@ -1,7 +1,11 @@
 from django.urls import path
 
 from apps.accounting.views import generate_quote_pdf, send_quote_email
-from apps.accounting.views.kpi_view import KPICalendarTemplateView, KPICalendarAPIView
+from apps.accounting.views.kpi_view import (
+    KPICalendarTemplateView,
+    KPICalendarAPIView,
+    KPICalendarRangeAPIView,
+)
 
 app_name = "accounting"
 
@@ -22,6 +26,11 @@ urlpatterns = [
         KPICalendarAPIView.as_view(),
         name="api_kpi_calendar",
     ),
+    path(
+        "api/reports/calendar/range/",
+        KPICalendarRangeAPIView.as_view(),
+        name="api_kpi_calendar_range",
+    ),
     path(
         "reports/calendar/",
         KPICalendarTemplateView.as_view(),
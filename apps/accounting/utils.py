@@ -1,6 +1,11 @@
-from datetime import timezone
+from datetime import date, timezone
+from functools import lru_cache
+from typing import Dict
 from zoneinfo import ZoneInfo
 
+import holidays
+
+
 def get_nz_tz() -> timezone | ZoneInfo:
     """
     Gets the New Zealand timezone object using either zoneinfo or pytz.
@@ -18,3 +23,9 @@ def get_nz_tz() -> timezone | ZoneInfo:
 
         nz_timezone = pytz.timezone("Pacific/Auckland")
     return nz_timezone
+
+
+@lru_cache(maxsize=None)
+def get_nz_holidays(year: int) -> Dict[date, str]:
+    """New Zealand holidays of a year, worked out once per process"""
+    return dict(holidays.country_holidays("NZ", years=year))
@@ -61,3 +61,61 @@ class KPICalendarAPIView(APIView):
                 {"error": f"Error obtaining calendar data: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class KPICalendarRangeAPIView(APIView):
+    """
+    API Endpoint to provide KPI data for every month of a range, for trend
+    views. Takes either 'year' for a whole year or 'start' and 'end' months
+    as YYYY-MM.
+    """
+
+    MAX_MONTHS = 36
+
+    @staticmethod
+    def _parse_month(value: str):
+        year, _, month = value.partition("-")
+        if not year.isdigit() or not month.isdigit():
+            raise ValueError(f"'{value}' is not a month in the format YYYY-MM")
+        year, month = int(year), int(month)
+        if not 1 <= month <= 12 or not 2000 <= year <= 2100:
+            raise ValueError(f"Month '{value}' out of valid range")
+        return year, month
+
+    def get(self, request, *args, **kwargs):
+        try:
+            year = request.query_params.get("year")
+            if year is not None:
+                start = self._parse_month(f"{year}-1")
+                end = self._parse_month(f"{year}-12")
+            else:
+                today = date.today()
+                start = self._parse_month(
+                    request.query_params.get("start", f"{today.year}-1")
+                )
+                end = self._parse_month(
+                    request.query_params.get("end", f"{today.year}-{today.month}")
+                )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        month_count = (end[0] - start[0]) * 12 + end[1] - start[1] + 1
+        if not 1 <= month_count <= self.MAX_MONTHS:
+            return Response(
+                {
+                    "error": f"The range must cover between 1 and {self.MAX_MONTHS} months, ending no earlier than it starts."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            months = KPIService.get_calendar_range_data(*start, *end)
+            return Response({"months": months}, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(
+                "KPI Calendar Range API Error: %s\n%s", str(e), traceback.format_exc()
+            )
+            return Response(
+                {"error": f"Error obtaining calendar data: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -95,12 +95,38 @@ class Staff(AbstractBaseUser, PermissionsMixin):
         verbose_name = "Staff Member"
         verbose_name_plural = "Staff Members"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() can tell whether job search needs reindexing
+        instance._saved_names = instance._get_indexed_names()
+        return instance
+
+    def _get_indexed_names(self):
+        return tuple(
+            self.__dict__.get(field)
+            for field in ("first_name", "last_name", "preferred_name")
+        )
+
     def save(self, *args, **kwargs):
+        from apps.job.services.job_search_service import (
+            update_search_documents_for_staff,
+        )
+
+        names_changed = not self._state.adding and self._get_indexed_names() != (
+            getattr(self, "_saved_names", self._get_indexed_names())
+        )
         # We have to do this because fixtures don't have updated_at,
         # so auto_now_add doesn't work
         self.updated_at = timezone_now()
         super().save(*args, **kwargs)
 
+        if names_changed:
+            # Kanban cards show assigned staff by name
+            self.assigned_jobs.update(updated_at=timezone_now())
+            update_search_documents_for_staff(self)
+        self._saved_names = self._get_indexed_names()
+
     def __str__(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
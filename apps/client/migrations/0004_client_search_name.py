@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:13
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+FULLTEXT_INDEX = "workflow_client_search_name_ft"
+
+
+def _normalise_client_name(name):
+    """Copy of services.normalise_client_name as it was for this migration"""
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.findall(r"\w+", stripped.lower()))
+
+
+def populate_search_names(apps, schema_editor):
+    Client = apps.get_model("client", "Client")
+    clients = []
+    for pk, name in Client.objects.order_by("pk").values_list("pk", "name"):
+        clients.append(Client(pk=pk, search_name=_normalise_client_name(name)))
+    Client.objects.bulk_update(clients, ["search_name"], batch_size=500)
+
+
+def add_fulltext_index(apps, schema_editor):
+    """FULLTEXT indexes are MariaDB/MySQL only; elsewhere search falls back to LIKE"""
+    if schema_editor.connection.vendor != "mysql":
+        return
+    table = schema_editor.quote_name("workflow_client")
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD FULLTEXT INDEX "
+        f"{schema_editor.quote_name(FULLTEXT_INDEX)} (search_name)"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    table = schema_editor.quote_name("workflow_client")
+    schema_editor.execute(
+        f"ALTER TABLE {table} DROP INDEX {schema_editor.quote_name(FULLTEXT_INDEX)}"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client", "0003_client_raw_json_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="client",
+            name="search_name",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=255
+            ),
+        ),
+        migrations.RunPython(populate_search_names, migrations.RunPython.noop),
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+    ]
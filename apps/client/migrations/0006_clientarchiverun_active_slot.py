@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client", "0005_client_archive_run"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clientarchiverun",
+            name="active_slot",
+            field=models.BooleanField(
+                blank=True, editable=False, null=True, unique=True
+            ),
+        ),
+    ]
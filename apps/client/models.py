@@ -4,6 +4,8 @@ import uuid
 from django.db import models
 from django.utils import timezone
 
+from apps.workflow.models import BackgroundRun
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,10 @@ class Client(models.Model):
     )  # For reference only - we are not fully multi-tenant yet
     # Optional because not all prospects are synced to Xero
     name = models.CharField(max_length=255)
+    # name as searched, see apps.client.services.normalise_client_name
+    search_name = models.CharField(
+        max_length=255, blank=True, default="", db_index=True
+    )
     email = models.EmailField(null=True, blank=True)
     phone = models.CharField(max_length=50, null=True, blank=True)
     address = models.TextField(null=True, blank=True)
@@ -30,6 +36,8 @@ class Client(models.Model):
     raw_json = models.JSONField(
         null=True, blank=True
     )  # For debugging, stores the raw JSON from Xero
+    # Digest of raw_json, so syncs can skip records Xero sends back unchanged
+    raw_json_hash = models.CharField(max_length=32, null=True, blank=True)
 
     # Fields for the primary contact person
     primary_contact_name = models.CharField(max_length=255, null=True, blank=True)
@@ -53,6 +61,33 @@ class Client(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() can tell whether job search needs reindexing
+        instance._saved_name = instance.__dict__.get("name")
+        return instance
+
+    def save(self, *args, **kwargs):
+        from apps.client.services import normalise_client_name
+        from apps.job.services.job_search_service import update_search_documents
+
+        name_changed = not self._state.adding and self.name != getattr(
+            self, "_saved_name", self.name
+        )
+        self.search_name = normalise_client_name(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "search_name"}
+        super().save(*args, **kwargs)
+
+        if name_changed:
+            # Kanban cards show the client name, and the board's version
+            # stamp follows the jobs' updated_at
+            self.jobs.update(updated_at=timezone.now())
+            update_search_documents(self.jobs.all())
+        self._saved_name = self.name
+
     def validate_for_xero(self):
         """
         Validate if the client data is sufficient to sync to Xero.
@@ -218,7 +253,19 @@ class ClientContact(models.Model):
     def __str__(self):
         return f"{self.name} ({self.client.name})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() can tell whether job search needs reindexing
+        instance._saved_name = instance.__dict__.get("name")
+        return instance
+
     def save(self, *args, **kwargs):
+        from apps.job.services.job_search_service import update_search_documents
+
+        name_changed = not self._state.adding and self.name != getattr(
+            self, "_saved_name", self.name
+        )
         # If this contact is being set as primary, ensure no other contacts
         # for this client are marked as primary
         if self.is_primary:
@@ -228,6 +275,10 @@ class ClientContact(models.Model):
             ).exclude(id=self.id).update(is_primary=False)
         super().save(*args, **kwargs)
 
+        if name_changed:
+            update_search_documents(self.jobs.all())
+        self._saved_name = self.name
+
 
 class Supplier(Client):
     """
@@ -236,3 +287,34 @@ class Supplier(Client):
 
     class Meta:
         proxy = True
+
+
+class ClientArchiveRun(BackgroundRun):
+    """
+    A run archiving unused clients in Xero and deleting them here, processed
+    in the background by ClientArchiveService.
+    """
+
+    PROGRESS_FIELDS = ("total_clients", "processed_clients", "deleted_clients")
+
+    client_ids = models.JSONField(
+        default=list, help_text="Clients selected for the run"
+    )
+    total_clients = models.PositiveIntegerField(default=0)
+    processed_clients = models.PositiveIntegerField(default=0)
+    deleted_clients = models.PositiveIntegerField(
+        default=0, help_text="Processed clients still unused, so deleted"
+    )
+    started_by = models.ForeignKey(
+        "accounts.Staff",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="client_archive_runs",
+    )
+
+    def __str__(self):
+        return (
+            f"Client archive run {self.id}: {self.processed_clients}/"
+            f"{self.total_clients} clients ({self.status})"
+        )
@@ -0,0 +1,334 @@
+"""
+Client lookup for the autocompletes, listing every client, and clearing
+out the clients nothing uses.
+
+Each client keeps its name normalised in search_name (lowercase, accents and
+punctuation removed), which carries an ordinary index for whole-name prefix
+matches and, on MariaDB/MySQL, a FULLTEXT index for matching the start of
+any word. The invoice figures shown beside each match are annotated as
+subqueries of the same query.
+
+Listings page through clients by (name, id) rather than by offset, and full
+exports stream the same keyset pages one after another, so neither holds the
+whole contact list in memory.
+
+Unused clients are found with one anti-join query the database can count
+and page itself. ClientArchiveService archives a selection of them in Xero
+and deletes them as a background run, recording progress on a
+ClientArchiveRun.
+"""
+
+import base64
+import json
+import logging
+import re
+import unicodedata
+from decimal import Decimal
+from uuid import UUID
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import (
+    Case,
+    DecimalField,
+    Exists,
+    F,
+    FloatField,
+    IntegerField,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from apps.accounting.models import Bill, Invoice
+from apps.client.models import Client, ClientArchiveRun
+from apps.job.models import Job
+from apps.job.services.job_search_service import (
+    MIN_INDEXED_TERM_LENGTH,
+    FullTextMatch,
+    MatchAgainst,
+)
+from apps.workflow.api.xero.sync import archive_clients_in_xero
+from apps.workflow.services.background_run_service import start_background_run
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_LIMIT = 10
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+EXPORT_CHUNK_SIZE = 2000
+
+# What searches, listings and exports return; raw_json is only read when
+# asked for
+CLIENT_FIELDS = (
+    "id",
+    "name",
+    "email",
+    "phone",
+    "address",
+    "is_account_customer",
+    "xero_contact_id",
+)
+
+# Listing order; id breaks ties between clients of the same name
+LIST_ORDERING = ("name", "id")
+
+# InnoDB's default stopwords aren't indexed, so can't be required in a MATCH
+INNODB_STOPWORDS = {
+    "a",
+    "about",
+    "an",
+    "are",
+    "as",
+    "at",
+    "be",
+    "by",
+    "com",
+    "de",
+    "en",
+    "for",
+    "from",
+    "how",
+    "i",
+    "in",
+    "is",
+    "it",
+    "la",
+    "of",
+    "on",
+    "or",
+    "that",
+    "the",
+    "this",
+    "to",
+    "was",
+    "what",
+    "when",
+    "where",
+    "who",
+    "will",
+    "with",
+    "und",
+    "www",
+}
+
+
+def normalise_client_name(name: str) -> str:
+    """
+    A client name as it is searched: lowercase, without accents, and with
+    each run of punctuation and spaces turned into a single space.
+    """
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.findall(r"\w+", stripped.lower()))
+
+
+def with_invoice_summary(clients):
+    """
+    Annotate clients with last_invoice_date and total_spend (the sum of
+    their invoices excluding tax, 0 if none), without a query per client.
+    """
+    invoices = Invoice.objects.filter(client=OuterRef("pk")).order_by().values(
+        "client"
+    )
+    return clients.annotate(
+        last_invoice_date=Subquery(
+            invoices.annotate(last_date=Max("date")).values("last_date")
+        ),
+        total_spend=Coalesce(
+            Subquery(invoices.annotate(total=Sum("total_excl_tax")).values("total")),
+            Value(Decimal(0)),
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        ),
+    )
+
+
+def search_clients(
+    query: str, limit: int = DEFAULT_SEARCH_LIMIT, include_raw_json: bool = False
+):
+    """
+    The clients whose name has a word starting with each word of query,
+    with their invoice summary (see with_invoice_summary).
+
+    Names starting with the whole query come first, then the best matches.
+    Words the FULLTEXT index can't serve (short words and stopwords), and
+    every word on databases without FULLTEXT support, are matched anywhere
+    in the name instead.
+    """
+    normalised = normalise_client_name(query)
+    terms = normalised.split()
+    if not terms:
+        return Client.objects.none()
+
+    fields = [*CLIENT_FIELDS, "raw_json"] if include_raw_json else CLIENT_FIELDS
+    clients = Client.objects.only(*fields)
+
+    indexed_terms = [
+        term
+        for term in terms
+        if len(term) >= MIN_INDEXED_TERM_LENGTH and term not in INNODB_STOPWORDS
+    ]
+    if connection.vendor == "mysql" and indexed_terms:
+        boolean_query = " ".join(f"+{term}*" for term in indexed_terms)
+        clients = clients.filter(
+            FullTextMatch(F("search_name"), boolean_query)
+        ).annotate(search_rank=MatchAgainst(F("search_name"), boolean_query))
+        substring_terms = [term for term in terms if term not in indexed_terms]
+    else:
+        clients = clients.annotate(search_rank=Value(0.0, output_field=FloatField()))
+        substring_terms = terms
+
+    for term in substring_terms:
+        clients = clients.filter(search_name__contains=term)
+
+    clients = clients.annotate(
+        prefix_match=Case(
+            When(search_name__startswith=normalised, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    ).order_by("-prefix_match", "-search_rank", "name")
+    return with_invoice_summary(clients)[:limit]
+
+
+def _encode_cursor(row: dict) -> str:
+    position = [row["name"], str(row["id"])]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def _after_cursor(clients, cursor: str):
+    """Restrict clients (in LIST_ORDERING) to those after the cursor's client."""
+    try:
+        name, client_id = json.loads(base64.urlsafe_b64decode(cursor))
+        name = str(name)
+        client_id = UUID(client_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    return clients.filter(Q(name__gt=name) | Q(name=name, id__gt=client_id))
+
+
+def get_client_page(cursor: str = None, page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    A page of clients in name order, as dicts of CLIENT_FIELDS.
+
+    Args:
+        cursor: The next_cursor of the previous page, None for the first
+        page_size: Clients per page, clamped to 1..MAX_PAGE_SIZE
+
+    Raises:
+        ValueError: If the cursor can't be read
+
+    Returns:
+        (rows, next_cursor), where next_cursor is None on the last page
+    """
+    return _read_client_page(cursor, max(1, min(page_size, MAX_PAGE_SIZE)))
+
+
+def _read_client_page(cursor: str, page_size: int):
+    clients = Client.objects.order_by(*LIST_ORDERING)
+    if cursor:
+        clients = _after_cursor(clients, cursor)
+
+    # One extra row tells us whether there is another page
+    rows = list(clients.values(*CLIENT_FIELDS)[: page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = _encode_cursor(rows[-1])
+    return rows, next_cursor
+
+
+def iter_clients_ndjson(chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    Every client as a line of JSON (CLIENT_FIELDS), in name order.
+
+    Reads chunk_size rows at a time by keyset, one query per chunk.
+    QuerySet.iterator() wouldn't do: mysqlclient fetches the whole result
+    set into memory whatever the chunk size.
+    """
+    cursor = None
+    while True:
+        rows, cursor = _read_client_page(cursor, chunk_size)
+        for row in rows:
+            yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+        if cursor is None:
+            return
+
+
+def get_unused_clients():
+    """
+    Clients with no jobs, invoices or bills, oldest first.
+
+    NOT EXISTS subqueries keep this one query, so paging it or filtering it
+    further happens in the database.
+    """
+    return Client.objects.filter(
+        ~Exists(Job.objects.filter(client=OuterRef("pk"))),
+        ~Exists(Invoice.objects.filter(client=OuterRef("pk"))),
+        ~Exists(Bill.objects.filter(client=OuterRef("pk"))),
+    ).order_by("django_created_at")
+
+
+class ClientArchiveService:
+    """
+    Archives unused clients in Xero and deletes them here, as a background
+    process.
+
+    Clients are processed BATCH_SIZE at a time, one Xero request per batch.
+    A batch's clients are only deleted once Xero has archived them, and only
+    if still unused by then. A batch that fails stops the run; batches
+    already done stay done. Only one run is active at a time.
+    """
+
+    BATCH_SIZE = 50
+
+    @staticmethod
+    def get_active_run():
+        return ClientArchiveRun.get_active_run()
+
+    @staticmethod
+    def start_run(client_ids, staff=None):
+        """
+        Start archiving the given clients.
+        Returns a tuple of (run, is_new), where is_new is False if a run was
+        already in progress, which is returned instead.
+        """
+        client_ids = [str(client_id) for client_id in dict.fromkeys(client_ids)]
+        return start_background_run(
+            ClientArchiveRun,
+            ClientArchiveService.process,
+            client_ids=client_ids,
+            total_clients=len(client_ids),
+            started_by=staff,
+        )
+
+    @staticmethod
+    def process(run):
+        """Archive and delete the clients of a run, batch by batch."""
+        deleted = 0
+        batch_size = ClientArchiveService.BATCH_SIZE
+        for start in range(0, len(run.client_ids), batch_size):
+            batch = run.client_ids[start : start + batch_size]
+            clients = list(get_unused_clients().filter(pk__in=batch))
+
+            _, error_count = archive_clients_in_xero(clients, batch_size)
+            if error_count > 0:
+                raise Exception(f"Failed to archive {error_count} clients in Xero")
+
+            # Anything that started using a client meanwhile keeps it
+            _, deleted_by_model = (
+                get_unused_clients()
+                .filter(pk__in=[client.pk for client in clients])
+                .delete()
+            )
+            deleted += deleted_by_model.get(Client._meta.label, 0)
+            run.record_progress(
+                processed_clients=start + len(batch), deleted_clients=deleted
+            )
@@ -22,7 +22,7 @@ function initializeSimilarClientsTable() {
   // Function to search for similar clients
   function searchSimilarClients(query) {
     if (query && query.length >= 3) {
-      fetch(`/api/client-search/?q=${encodeURIComponent(query)}`)
+      fetch(`/clients/api/search/?q=${encodeURIComponent(query)}`)
         .then((response) => response.json())
         .then((data) => {
           similarClientsList.innerHTML = "";
@@ -71,9 +71,18 @@ function initializeSimilarClientsTable() {
       xeroContactIdInput.value = client.xero_contact_id;
     }
 
-    // Set raw_json field directly from client data
-    if (rawJsonInput && client.raw_json) {
-      rawJsonInput.value = JSON.stringify(client.raw_json);
+    // Search results leave out raw_json, so fetch it for the chosen client
+    if (rawJsonInput) {
+      fetch(`/clients/api/detail/?id=${encodeURIComponent(client.id)}`)
+        .then((response) => response.json())
+        .then((data) => {
+          if (data.client && data.client.raw_json) {
+            rawJsonInput.value = JSON.stringify(data.client.raw_json);
+          }
+        })
+        .catch((error) => {
+          console.error("Error fetching client details:", error);
+        });
     }
 
     // Update the window-scoped selectedClientId
@@ -4,22 +4,68 @@ document.addEventListener("DOMContentLoaded", function () {
   const selectAllCheckbox = document.getElementById("selectAll");
   const clientCheckboxes = document.querySelectorAll(".client-checkbox");
   const selectedCountSpan = document.getElementById("selectedCount");
-  const totalCountElement = document.querySelector(".text-muted");
 
   function updateSelectedCount() {
     const selectedCount = document.querySelectorAll(
       ".client-checkbox:checked",
     ).length;
     selectedCountSpan.textContent = selectedCount;
-    deleteButton.disabled = selectedCount === 0;
+    deleteButton.disabled =
+      selectedCount === 0 || progress.dataset.finished === "false";
   }
 
-  function updateTotalCount(deletedCount) {
-    const currentTotal = parseInt(
-      totalCountElement.textContent.match(/\d+/)[0],
-    );
-    const newTotal = currentTotal - deletedCount;
-    totalCountElement.textContent = `Total unused clients: ${newTotal}`;
+  // Follow an archive run until it finishes
+  const progress = document.getElementById("archiveProgress");
+  const POLL_INTERVAL_MS = 2000;
+
+  function showRunStatus(run) {
+    const percent = run.total_clients
+      ? Math.round((run.processed_clients / run.total_clients) * 100)
+      : 100;
+    document.getElementById("archiveProgressBar").style.width = `${percent}%`;
+    document.getElementById("archiveProgressText").textContent =
+      `Processed ${run.processed_clients} of ${run.total_clients} clients, ` +
+      `${run.deleted_clients} deleted (${run.status})`;
+
+    const errorBox = document.getElementById("archiveProgressError");
+    errorBox.textContent = run.error;
+    errorBox.classList.toggle("d-none", !run.error);
+  }
+
+  function pollRunStatus() {
+    fetch(progress.dataset.statusUrl)
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error(`Status request failed: ${response.status}`);
+        }
+        return response.json();
+      })
+      .then((run) => {
+        showRunStatus(run);
+        if (run.is_finished) {
+          progress.dataset.finished = "true";
+          // Reload for the clients still unused
+          if (run.status === "completed") {
+            window.location.reload();
+          } else {
+            updateSelectedCount();
+          }
+          return;
+        }
+        setTimeout(pollRunStatus, POLL_INTERVAL_MS);
+      })
+      .catch((error) => {
+        console.error("Error fetching archive progress:", error);
+        setTimeout(pollRunStatus, POLL_INTERVAL_MS * 5);
+      });
+  }
+
+  function followRun(statusUrl) {
+    progress.dataset.statusUrl = statusUrl;
+    progress.dataset.finished = "false";
+    progress.classList.remove("d-none");
+    deleteButton.disabled = true;
+    pollRunStatus();
   }
 
   selectAllCheckbox.addEventListener("change", function () {
@@ -50,9 +96,6 @@ document.addEventListener("DOMContentLoaded", function () {
     }
 
     const formData = new FormData(form);
-    const selectedCheckboxes = document.querySelectorAll(
-      ".client-checkbox:checked",
-    );
 
     fetch("", {
       method: "POST",
@@ -63,30 +106,12 @@ document.addEventListener("DOMContentLoaded", function () {
     })
       .then((response) => response.json())
       .then((data) => {
-        if (data.success) {
-          // Remove deleted rows from the table
-          selectedCheckboxes.forEach((checkbox) => {
-            checkbox.closest("tr").remove();
-          });
-
-          // Update counts
-          updateTotalCount(data.deleted_count);
-          updateSelectedCount();
-
-          // Reset select all checkbox
-          selectAllCheckbox.checked = false;
-
-          // Show success message
-          alert(data.message);
-
-          // If no clients left on current page and there are other pages,
-          // reload to show the next page
-          if (
-            document.querySelectorAll(".client-checkbox").length === 0 &&
-            document.querySelector(".pagination")
-          ) {
-            location.reload();
+        if (data.status_url) {
+          // Started, or another run is already going: follow it either way
+          if (!data.success) {
+            alert("Error: " + data.error);
           }
+          followRun(data.status_url);
         } else {
           alert("Error: " + data.error);
         }
@@ -95,4 +120,8 @@ document.addEventListener("DOMContentLoaded", function () {
         alert("Error: " + error);
       });
   });
+
+  if (progress.dataset.finished === "false") {
+    followRun(progress.dataset.statusUrl);
+  }
 });
@@ -28,6 +28,7 @@ urlpatterns = [
         name="api_get_client_phones",
     ),
     path("api/all/", client_view.get_all_clients_api, name="api_clients_all"),
+    path("api/export/", client_view.all_clients, name="api_clients_export"),
     path(
         "api/search/",
         client_view.ClientSearch,
@@ -64,4 +65,9 @@ urlpatterns = [
         client_view.UnusedClientsView.as_view(),
         name="xero_unused_clients",
     ),
+    path(
+        "xero/unused/archive/<uuid:run_id>/",
+        client_view.client_archive_status,
+        name="xero_unused_clients_archive_status",
+    ),
 ]
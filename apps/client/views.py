@@ -3,16 +3,15 @@ import logging
 from typing import Dict, Any
 
 from django.contrib import messages
-from django.db.models import Q
-from django.http import JsonResponse
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import redirect, render, get_object_or_404
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.views.generic import UpdateView, TemplateView
 from django_tables2 import SingleTableView
 from django.core.paginator import Paginator
 from django.views.decorators.http import require_POST
 from django.utils.decorators import method_decorator
-from django.db import transaction
 from django.utils import timezone
 
 from xero_python.accounting import AccountingApi
@@ -24,16 +23,20 @@ from apps.workflow.api.xero.sync import (
     sync_clients,
     sync_xero_clients_only,
     delete_clients_from_xero,
-    archive_clients_in_xero,
 )
 from apps.workflow.api.xero.xero import get_valid_token, api_client, get_tenant_id
-from apps.accounting.models import Invoice, Bill
 
-from apps.client.models import Client, ClientContact
+from apps.client.models import Client, ClientArchiveRun, ClientContact
 from apps.client.forms import ClientForm
 from apps.client.serializers import ClientContactSerializer
-
-from apps.job.models import Job
+from apps.client.services import (
+    DEFAULT_PAGE_SIZE,
+    ClientArchiveService,
+    get_client_page,
+    get_unused_clients,
+    iter_clients_ndjson,
+    search_clients,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -153,32 +156,38 @@ def get_client_phones(request, client_id):
 
 def get_all_clients_api(request):
     """
-    API endpoint to retrieve all clients.
-    Returns a list of clients with their ID and name.
+    API endpoint to page through all clients in name order.
+
+    Query Parameters:
+        cursor: next_cursor of the previous page, omitted for the first
+        limit: Clients per page (see get_client_page)
+
+    Returns:
+        {"results": [...], "next_cursor": ...}, next_cursor being null on
+        the last page
     """
     try:
-        clients = Client.objects.all().order_by("name")
-        clients_data = []
-        for client in clients:
-            clients_data.append(
-                {
-                    "id": str(client.id),  # Convert UUID to string
-                    "name": client.name,
-                    "xero_contact_id": client.xero_contact_id,  # Might be useful
-                }
-            )
-        logger.info(f"Successfully retrieved {len(clients_data)} clients for API.")
-        return JsonResponse(clients_data, safe=False)
+        page_size = int(request.GET.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        page_size = DEFAULT_PAGE_SIZE
+
+    try:
+        clients, next_cursor = get_client_page(request.GET.get("cursor"), page_size)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
     except Exception as e:
         logger.error(f"Error fetching all clients for API: {str(e)}", exc_info=True)
         return JsonResponse(
             {"error": "Failed to retrieve clients", "details": str(e)}, status=500
         )
 
+    return JsonResponse({"results": clients, "next_cursor": next_cursor})
+
 
 class ClientListView(SingleTableView):
     model = Client
-    template_name = "clients/list_clients.html"
+    paginate_by = 50
+    template_name = "client/list_clients.html"
     # table_class = ClientTable
     # context_object_name = "clients"
 
@@ -213,11 +222,17 @@ class ClientUpdateView(UpdateView):
 
 
 def ClientSearch(request):
+    """
+    Autocomplete search on client names (see search_clients). raw_json is
+    left out unless include_raw_json=1 is passed.
+    """
     query = request.GET.get("q", "")
+    include_raw_json = request.GET.get("include_raw_json") in ("1", "true")
     if query and len(query) >= 3:  # Only search when the query is 3+ characters
-        clients = Client.objects.filter(Q(name__icontains=query))[:10]
-        results = [
-            {
+        clients = search_clients(query, include_raw_json=include_raw_json)
+        results = []
+        for client in clients:
+            result = {
                 "id": client.id,
                 "name": client.name,
                 "email": client.email or "",
@@ -226,15 +241,15 @@ def ClientSearch(request):
                 "is_account_customer": client.is_account_customer,
                 "xero_contact_id": client.xero_contact_id or "",
                 "last_invoice_date": (
-                    client.get_last_invoice_date().strftime("%d/%m/%Y")
-                    if client.get_last_invoice_date()
+                    client.last_invoice_date.strftime("%d/%m/%Y")
+                    if client.last_invoice_date
                     else ""
                 ),
-                "total_spend": f"${client.get_total_spend():,.2f}",
-                "raw_json": client.raw_json,
+                "total_spend": f"${client.total_spend:,.2f}",
             }
-            for client in clients
-        ]
+            if include_raw_json:
+                result["raw_json"] = client.raw_json
+            results.append(result)
     else:
         results = []
 
@@ -271,12 +286,14 @@ def client_detail(request):
 
 def all_clients(request):
     """
-    API endpoint to return all clients as JSON for AJAX table population.
+    API endpoint to export every client as newline-delimited JSON, one
+    client per line, streamed so memory stays flat however many there are.
     """
-    clients = Client.objects.values(
-        "id", "name", "email", "phone", "address", "is_account_customer"
+    response = StreamingHttpResponse(
+        iter_clients_ndjson(), content_type="application/x-ndjson"
     )
-    return JsonResponse(list(clients), safe=False)
+    response["Content-Disposition"] = 'attachment; filename="clients.ndjson"'
+    return response
 
 
 def AddClient(request):
@@ -460,7 +477,8 @@ def AddClient(request):
 class UnusedClientsView(TemplateView):
     """
     View for managing unused Xero clients.
-    Lists and allows bulk deletion of clients that have no invoices or bills.
+    Lists clients with no jobs, invoices or bills, and starts background
+    runs archiving selected ones in Xero and deleting them.
     """
 
     template_name = "client/unused_clients.html"
@@ -468,41 +486,22 @@ class UnusedClientsView(TemplateView):
 
     def get_unused_clients(self):
         """
-        Get queryset of clients with no jobs, invoices, or bills.
-        Excludes clients that are already archived in Xero.
-        Returns clients ordered by creation date.
-
-        Note: We use set operations instead of exclude(Q()) because:
-        1. Foreign key fields (client_id) might contain NULL values
-        2. SQL exclude with OR conditions can behave unexpectedly with NULLs
-        3. Set operations on actual IDs are more reliable for this use case
+        Get queryset of clients with no jobs, invoices, or bills, ordered
+        by creation date (see services.get_unused_clients).
         """
-        clients_with_invoices = set(
-            Invoice.objects.values_list("client_id", flat=True).distinct()
-        )
-        clients_with_bills = set(
-            Bill.objects.values_list("client_id", flat=True).distinct()
+        return get_unused_clients().only(
+            "id", "name", "email", "phone", "django_created_at"
         )
-        clients_with_jobs = set(
-            Job.objects.values_list("client_id", flat=True).distinct()
-        )
-
-        logger.debug(f"Found {len(clients_with_invoices)} clients with invoices")
-        logger.debug(f"Found {len(clients_with_bills)} clients with bills")
-        logger.debug(f"Found {len(clients_with_jobs)} clients with jobs")
-
-        # Get all client IDs
-        all_client_ids = set(Client.objects.values_list("id", flat=True))
-        logger.debug(f"Total clients: {len(all_client_ids)}")
 
-        # Find clients that don't appear in any of the above sets
-        used_client_ids = clients_with_invoices | clients_with_bills | clients_with_jobs
-        unused_client_ids = all_client_ids - used_client_ids
-        logger.debug(f"Found {len(unused_client_ids)} unused clients")
-
-        return Client.objects.filter(id__in=unused_client_ids).order_by(
-            "django_created_at"
-        )
+    def get_archive_run(self):
+        """The run given by ?run=, or else the one in progress, if any."""
+        run_id = self.request.GET.get("run")
+        if run_id:
+            try:
+                return ClientArchiveRun.objects.filter(pk=run_id).first()
+            except ValidationError:
+                return None
+        return ClientArchiveService.get_active_run()
 
     def get_context_data(self, **kwargs) -> Dict[str, Any]:
         """
@@ -534,6 +533,7 @@ class UnusedClientsView(TemplateView):
                 "page_obj": page_obj,
                 "total_count": paginator.count,
                 "items_per_page": self.items_per_page,
+                "archive_run": self.get_archive_run(),
             }
         )
         return context
@@ -541,8 +541,8 @@ class UnusedClientsView(TemplateView):
     @method_decorator(require_POST)
     def post(self, request, *args, **kwargs) -> JsonResponse:
         """
-        Handle bulk deletion of unused clients.
-        Archives the contacts in Xero and deletes them from our database.
+        Start archiving the selected unused clients in Xero and deleting them
+        from our database, in the background. Poll status_url for progress.
         """
         try:
             client_ids = request.POST.getlist("client_ids[]")
@@ -551,48 +551,41 @@ class UnusedClientsView(TemplateView):
                     {"success": False, "error": "No clients selected"}, status=400
                 )
 
-            clients_to_delete = self.get_unused_clients().filter(id__in=client_ids)
-            deletion_count = clients_to_delete.count()
-
-            with transaction.atomic():
-                try:
-                    # Archive in Xero first
-                    success_count, error_count = archive_clients_in_xero(
-                        clients_to_delete
-                    )
-                    if error_count > 0:
-                        raise Exception(
-                            f"Failed to archive {error_count} clients in Xero"
-                        )
-
-                    # If archiving succeeded, delete from our database
-                    clients_to_delete.delete()
-                except Exception as e:
-                    logger.error(f"Failed to archive/delete clients: {str(e)}")
-                    return JsonResponse(
-                        {
-                            "success": False,
-                            "error": f"Failed to archive/delete clients: {str(e)}",
-                        },
-                        status=500,
-                    )
-
-            logger.info(
-                f"Successfully archived and deleted {deletion_count} unused clients"
-            )
-            return JsonResponse(
-                {
-                    "success": True,
-                    "message": f"Successfully archived and deleted {deletion_count} clients",
-                    "deleted_count": deletion_count,
-                }
+            client_ids = list(
+                self.get_unused_clients()
+                .filter(id__in=client_ids)
+                .values_list("id", flat=True)
             )
+            if not client_ids:
+                return JsonResponse(
+                    {"success": False, "error": "None of the clients are unused"},
+                    status=400,
+                )
+
+            run, is_new = ClientArchiveService.start_run(client_ids, request.user)
+            response = {
+                "success": is_new,
+                "run_id": str(run.id),
+                "status_url": reverse(
+                    "clients:xero_unused_clients_archive_status", args=[run.id]
+                ),
+                "error": (
+                    None if is_new else "Clients are already being archived."
+                ),
+            }
+            return JsonResponse(response, status=202 if is_new else 409)
 
         except Exception as e:
             logger.error(f"Error in bulk client deletion: {str(e)}")
             return JsonResponse({"success": False, "error": str(e)}, status=500)
 
 
+def client_archive_status(request, run_id):
+    """Progress of a client archive run, polled by the unused clients page."""
+    run = get_object_or_404(ClientArchiveRun, pk=run_id)
+    return JsonResponse(run.get_progress())
+
+
 # API views for ClientContact management
 from rest_framework import status
 from rest_framework.decorators import api_view
@@ -0,0 +1,44 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from apps.job.models import Job
+from apps.job.services.kanban_rank_service import (
+    RANK_COMPACT_LENGTH,
+    compact_column,
+    get_statuses_to_compact,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Respace the kanban ranks of columns holding long ranks "
+        "(normally done by the scheduler every night)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Compact every column, whatever the length of its ranks",
+        )
+        parser.add_argument(
+            "--max-length",
+            type=int,
+            default=RANK_COMPACT_LENGTH,
+            help="Compact columns holding a rank longer than this",
+        )
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            statuses = [key for key, _ in Job.JOB_STATUS_CHOICES]
+        else:
+            statuses = get_statuses_to_compact(options["max_length"])
+
+        for status in statuses:
+            count = compact_column(status)
+            self.stdout.write(f"Compacted {count} jobs in {status}")
+
+        self.stdout.write(self.style.SUCCESS(f"Compacted {len(statuses)} columns"))
@@ -0,0 +1,47 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.job.models import Job
+from apps.job.services.job_search_service import update_search_documents
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search document of every job"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Jobs rebuilt per batch",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        start_time = timezone.now()
+        updated = 0
+        pks = Job.objects.order_by("pk").values_list("pk", flat=True)
+        last_pk = None
+        while True:
+            chunk = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            updated += update_search_documents(chunk)
+            last_pk = chunk[-1]
+
+        duration = (timezone.now() - start_time).total_seconds()
+        logger.info(f"Rebuilt search documents for {updated} jobs")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt search documents for {updated} jobs "
+                f"in {duration:.2f} seconds"
+            )
+        )
@@ -0,0 +1,78 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.job.models import JobPricing
+from apps.job.models.job_pricing import TOTAL_FIELDS
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the stored totals on every JobPricing from its time, material "
+        "and adjustment entries"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report pricings whose stored totals are wrong",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Pricings updated per query",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        if options["check"]:
+            self._check()
+            return
+
+        start_time = timezone.now()
+        updated = 0
+        pks = JobPricing.objects.order_by("pk").values_list("pk", flat=True)
+        last_pk = None
+        while True:
+            chunk = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            updated += JobPricing.recalculate_totals(chunk)
+            last_pk = chunk[-1]
+
+        duration = (timezone.now() - start_time).total_seconds()
+        logger.info(f"Recomputed totals for {updated} job pricings")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recomputed totals for {updated} job pricings "
+                f"in {duration:.2f} seconds"
+            )
+        )
+
+    def _check(self):
+        count = 0
+        for pricing in JobPricing.objects.with_live_totals().iterator():
+            wrong = [
+                field
+                for field in TOTAL_FIELDS
+                if getattr(pricing, field) != getattr(pricing, f"live_{field}")
+            ]
+            if wrong:
+                count += 1
+                self.stdout.write(
+                    f"JobPricing {pricing.id}: {', '.join(wrong)} out of date"
+                )
+
+        if count:
+            self.stdout.write(self.style.WARNING(f"{count} job pricings out of date"))
+        else:
+            self.stdout.write(self.style.SUCCESS("All job pricing totals are correct"))
@@ -0,0 +1,110 @@
+# Generated by Django 5.2 on 2026-10-16 20:43
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def _sum_entries(entry_model, expression):
+    output_field = DecimalField(max_digits=14, decimal_places=4)
+    entries = (
+        entry_model.objects.filter(job_pricing=OuterRef("pk"))
+        .order_by()
+        .values("job_pricing")
+        .annotate(total=Sum(expression, output_field=output_field))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(entries, output_field=output_field),
+        Value(Decimal("0")),
+        output_field=output_field,
+    )
+
+
+def populate_pricing_totals(apps, schema_editor):
+    """Fill the new totals from the entries each pricing already has"""
+    JobPricing = apps.get_model("job", "JobPricing")
+    MaterialEntry = apps.get_model("job", "MaterialEntry")
+    AdjustmentEntry = apps.get_model("job", "AdjustmentEntry")
+    TimeEntry = apps.get_model("timesheet", "TimeEntry")
+
+    JobPricing.objects.update(
+        total_hours=_sum_entries(TimeEntry, F("hours")),
+        total_time_cost=_sum_entries(TimeEntry, F("hours") * F("wage_rate")),
+        total_time_revenue=_sum_entries(
+            TimeEntry, F("hours") * F("charge_out_rate")
+        ),
+        total_material_cost=_sum_entries(
+            MaterialEntry, F("unit_cost") * F("quantity")
+        ),
+        total_material_revenue=_sum_entries(
+            MaterialEntry, F("unit_revenue") * F("quantity")
+        ),
+        total_adjustment_cost=_sum_entries(AdjustmentEntry, F("cost_adjustment")),
+        total_adjustment_revenue=_sum_entries(
+            AdjustmentEntry, F("price_adjustment")
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0020_change_priority_to_float"),
+        ("timesheet", "0002_alter_timeentry_job_pricing_fk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobpricing",
+            name="total_adjustment_cost",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0"), editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobpricing",
+            name="total_adjustment_revenue",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0"), editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobpricing",
+            name="total_hours",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0"), editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobpricing",
+            name="total_material_cost",
+            field=models.DecimalField(
+                decimal_places=4, default=Decimal("0"), editable=False, max_digits=14
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobpricing",
+            name="total_material_revenue",
+            field=models.DecimalField(
+                decimal_places=4, default=Decimal("0"), editable=False, max_digits=14
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobpricing",
+            name="total_time_cost",
+            field=models.DecimalField(
+                decimal_places=4, default=Decimal("0"), editable=False, max_digits=14
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobpricing",
+            name="total_time_revenue",
+            field=models.DecimalField(
+                decimal_places=4, default=Decimal("0"), editable=False, max_digits=14
+            ),
+        ),
+        migrations.RunPython(populate_pricing_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.2 on 2026-10-16 20:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FULLTEXT_INDEX = "job_jobsearchdocument_document_ft"
+
+
+def add_fulltext_index(apps, schema_editor):
+    """FULLTEXT indexes are MariaDB/MySQL only; elsewhere search falls back to LIKE"""
+    if schema_editor.connection.vendor != "mysql":
+        return
+    table = schema_editor.quote_name("job_jobsearchdocument")
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD FULLTEXT INDEX "
+        f"{schema_editor.quote_name(FULLTEXT_INDEX)} (document)"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    table = schema_editor.quote_name("job_jobsearchdocument")
+    schema_editor.execute(
+        f"ALTER TABLE {table} DROP INDEX {schema_editor.quote_name(FULLTEXT_INDEX)}"
+    )
+
+
+def _staff_name(staff):
+    if staff is None:
+        return ""
+    display = staff.preferred_name or staff.first_name
+    display = display.split()[0] if display else ""
+    return f"{display} {staff.last_name}"
+
+
+def populate_search_documents(apps, schema_editor):
+    """Build a document for every existing job (mirrors build_search_document)"""
+    Job = apps.get_model("job", "Job")
+    JobSearchDocument = apps.get_model("job", "JobSearchDocument")
+    status_labels = dict(Job._meta.get_field("status").choices)
+
+    jobs = (
+        Job.objects.select_related("client", "contact", "created_by")
+        .prefetch_related("people")
+        .order_by("pk")
+    )
+    documents = []
+    for job in jobs.iterator(chunk_size=500):
+        values = [
+            str(job.job_number),
+            job.name,
+            job.description,
+            job.client.name if job.client else "",
+            job.contact.name if job.contact else "",
+            job.contact_person,
+            _staff_name(job.created_by),
+            *(_staff_name(staff) for staff in job.people.all()),
+            status_labels.get(job.status, job.status),
+        ]
+        documents.append(
+            JobSearchDocument(
+                job=job, document="\n".join(value for value in values if value)
+            )
+        )
+        if len(documents) >= 500:
+            JobSearchDocument.objects.bulk_create(documents)
+            documents = []
+    JobSearchDocument.objects.bulk_create(documents)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0021_add_jobpricing_totals"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSearchDocument",
+            fields=[
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="job.job",
+                    ),
+                ),
+                ("document", models.TextField(blank=True, default="")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.2 on 2026-10-16 20:53
+
+import math
+
+from django.conf import settings
+from django.db import migrations, models
+
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_HELP_TEXT = (
+    "Position of the job in its kanban column, ranks sorting first are higher up. "
+    "See apps.job.services.kanban_rank_service."
+)
+
+
+def _spaced_ranks(count):
+    """Copy of kanban_rank_service.spaced_ranks as it was for this migration"""
+    base = len(RANK_DIGITS)
+    width = max(1, math.ceil(math.log(count + 1, base)) + 1)
+    span = base**width
+    ranks = []
+    for index in range(1, count + 1):
+        value = index * span // (count + 1)
+        digits = ""
+        for _ in range(width):
+            value, remainder = divmod(value, base)
+            digits = RANK_DIGITS[remainder] + digits
+        ranks.append(digits.rstrip("0"))
+    return ranks
+
+
+def priorities_to_ranks(apps, schema_editor):
+    """Rank each column in its current order (highest priority first)"""
+    Job = apps.get_model("job", "Job")
+    statuses = Job.objects.order_by().values_list("status", flat=True).distinct()
+    for status in list(statuses):
+        pks = list(
+            Job.objects.filter(status=status)
+            .order_by("-priority", "-created_at", "-id")
+            .values_list("pk", flat=True)
+        )
+        jobs = [
+            Job(pk=pk, rank=rank) for pk, rank in zip(pks, _spaced_ranks(len(pks)))
+        ]
+        Job.objects.bulk_update(jobs, ["rank"], batch_size=500)
+
+
+def ranks_to_priorities(apps, schema_editor):
+    Job = apps.get_model("job", "Job")
+    statuses = Job.objects.order_by().values_list("status", flat=True).distinct()
+    for status in list(statuses):
+        pks = list(
+            Job.objects.filter(status=status)
+            .order_by("rank", "-created_at", "-id")
+            .values_list("pk", flat=True)
+        )
+        jobs = [
+            Job(pk=pk, priority=float((len(pks) - index) * 200))
+            for index, pk in enumerate(pks)
+        ]
+        Job.objects.bulk_update(jobs, ["priority"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client", "0003_client_raw_json_hash"),
+        ("job", "0022_job_search_document"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicaljob",
+            name="rank",
+            field=models.CharField(
+                default="", help_text=RANK_HELP_TEXT, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="rank",
+            field=models.CharField(
+                default="", help_text=RANK_HELP_TEXT, max_length=255
+            ),
+        ),
+        migrations.RunPython(priorities_to_ranks, ranks_to_priorities),
+        migrations.RemoveIndex(
+            model_name="job",
+            name="job_priority_status_idx",
+        ),
+        migrations.RemoveField(
+            model_name="historicaljob",
+            name="priority",
+        ),
+        migrations.RemoveField(
+            model_name="job",
+            name="priority",
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["status", "rank"], name="job_rank_status_idx"),
+        ),
+    ]
@@ -5,8 +5,11 @@ from .job import Job
 from .job_event import JobEvent
 from .job_file import JobFile
 from .job_part import JobPart
-from .job_pricing import JobPricing, QuotePricing
+from .job_pricing import JobPricingQuerySet, JobPricing, QuotePricing
+from .job_search_document import JobSearchDocument
 from .material_entry import MaterialEntry
+from .month_end_run import MonthEndRun
+from .pricing_entry import PricingEntryQuerySet, PricingEntry
 
 __all__ = [
     "AdjustmentEntry",
@@ -14,7 +17,12 @@ __all__ = [
     "JobEvent",
     "JobFile",
     "JobPart",
+    "JobPricingQuerySet",
     "JobPricing",
     "QuotePricing",
+    "JobSearchDocument",
     "MaterialEntry",
+    "MonthEndRun",
+    "PricingEntryQuerySet",
+    "PricingEntry",
 ]
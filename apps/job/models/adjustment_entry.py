@@ -3,10 +3,15 @@ import uuid
 from django.db import models
 from django.utils import timezone
 
+from apps.job.models.pricing_entry import PricingEntry
 
-class AdjustmentEntry(models.Model):
+
+class AdjustmentEntry(PricingEntry):
     """For when costs are manually added to a job"""
 
+    totals_source_fields = ("cost_adjustment", "price_adjustment")
+    report_date_field = "accounting_date"
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     job_pricing = models.ForeignKey(
         "JobPricing",
@@ -38,6 +43,12 @@ class AdjustmentEntry(models.Model):
         ordering = ["created_at"]
         db_table = "workflow_adjustmententry"
 
+    def get_pricing_totals(self) -> dict:
+        return {
+            "total_adjustment_cost": self.cost_adjustment,
+            "total_adjustment_revenue": self.price_adjustment,
+        }
+
     def __str__(self):
         return (
             f"Adjustment for {self.job_pricing.job.name} - "
@@ -177,12 +177,14 @@ class Job(models.Model):
 
     people = models.ManyToManyField(Staff, related_name="assigned_jobs")
 
-    PRIORITY_INCREMENT = 200
-
-    priority = models.FloatField(
-        default=0.0,
-        help_text="Priority of the job, higher numbers are higher priority.",
-    )  # type: ignore
+    rank = models.CharField(
+        max_length=255,
+        default="",
+        help_text=(
+            "Position of the job in its kanban column, ranks sorting first are "
+            "higher up. See apps.job.services.kanban_rank_service."
+        ),
+    )
 
     class Meta:
         verbose_name = "Job"
@@ -190,19 +192,9 @@ class Job(models.Model):
         ordering = ["job_number"]
         db_table = "workflow_job"
         indexes = [
-            Index(fields=["status", "priority"], name="job_priority_status_idx"),
+            Index(fields=["status", "rank"], name="job_rank_status_idx"),
         ]
 
-    @classmethod
-    def _calculate_next_priority_for_status(cls, status_value: str) -> float:
-        max_entry = (
-            cls.objects.filter(status=status_value).aggregate(Max("priority"))[
-                "priority__max"
-            ]
-            or 0.0
-        )
-        return max_entry + cls.PRIORITY_INCREMENT
-
     @property
     def shop_job(self) -> bool:
         """Indicates if this is a shop job (no client)."""
@@ -259,6 +251,8 @@ class Job(models.Model):
         return next_job_number
 
     def save(self, *args, **kwargs):
+        from apps.job.services.job_search_service import update_search_document
+        from apps.job.services.kanban_rank_service import get_rank_at_top
         from apps.workflow.models import CompanyDefaults
 
         staff = kwargs.pop("staff", None)
@@ -283,10 +277,9 @@ class Job(models.Model):
                 raise ValueError("Job number generation failed.")
             logger.debug(f"Saving new job with job number: {self.job_number}")
 
-            # To assure all jobs have a priority
+            # New jobs go to the top of their column
             with transaction.atomic():
-                default_priority = self._calculate_next_priority_for_status(self.status)
-                self.priority = default_priority
+                self.rank = get_rank_at_top(self.status)
 
                 # Creating a new job is tricky because of the circular reference.
                 # We first save the job to the DB without any associated pricings, then we
@@ -335,8 +328,8 @@ class Job(models.Model):
                     ),
                     staff=staff,
                 )
+            else:
+                # Step 5: Save the Job to persist everything, including relationships
+                super(Job, self).save(*args, **kwargs)
 
-                return
-
-            # Step 5: Save the Job to persist everything, including relationships
-            super(Job, self).save(*args, **kwargs)
+        update_search_document(self, update_fields=kwargs.get("update_fields"))
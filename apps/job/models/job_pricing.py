@@ -4,12 +4,84 @@ import uuid
 from decimal import Decimal
 
 from django.db import models, transaction
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 
 from apps.job.enums import JobPricingStage
 from apps.job.models.job_part import JobPart
 
 logger = logging.getLogger(__name__)
 
+# Stored sums of a pricing's entries, kept up to date by the entries themselves
+TOTAL_FIELDS = (
+    "total_hours",
+    "total_time_cost",
+    "total_time_revenue",
+    "total_material_cost",
+    "total_material_revenue",
+    "total_adjustment_cost",
+    "total_adjustment_revenue",
+)
+
+
+def _sum_entries(entry_model, expression, decimal_places):
+    """Correlated subquery summing one expression over a pricing's entries."""
+    output_field = DecimalField(max_digits=14, decimal_places=decimal_places)
+    entries = (
+        entry_model.objects.filter(job_pricing=OuterRef("pk"))
+        .order_by()
+        .values("job_pricing")
+        .annotate(total=Sum(expression, output_field=output_field))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(entries, output_field=output_field),
+        Value(Decimal("0")),
+        output_field=output_field,
+    )
+
+
+class JobPricingQuerySet(models.QuerySet):
+    @staticmethod
+    def live_totals():
+        """Expressions computing each stored total straight from the entries."""
+        from apps.job.models import AdjustmentEntry, MaterialEntry
+        from apps.timesheet.models import TimeEntry
+
+        return {
+            "total_hours": _sum_entries(TimeEntry, F("hours"), 2),
+            "total_time_cost": _sum_entries(
+                TimeEntry, F("hours") * F("wage_rate"), 4
+            ),
+            "total_time_revenue": _sum_entries(
+                TimeEntry, F("hours") * F("charge_out_rate"), 4
+            ),
+            "total_material_cost": _sum_entries(
+                MaterialEntry, F("unit_cost") * F("quantity"), 4
+            ),
+            "total_material_revenue": _sum_entries(
+                MaterialEntry, F("unit_revenue") * F("quantity"), 4
+            ),
+            "total_adjustment_cost": _sum_entries(
+                AdjustmentEntry, F("cost_adjustment"), 2
+            ),
+            "total_adjustment_revenue": _sum_entries(
+                AdjustmentEntry, F("price_adjustment"), 2
+            ),
+        }
+
+    def with_live_totals(self):
+        """
+        Annotate live_<total> for each stored total, e.g. live_total_hours.
+        For callers that can't rely on the stored figures, such as audits.
+        """
+        return self.annotate(
+            **{
+                f"live_{field}": expression
+                for field, expression in self.live_totals().items()
+            }
+        )
+
 
 class JobPricing(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -43,6 +115,32 @@ class JobPricing(models.Model):
         help_text="The default 'Main Work' part associated with this JobPricing instance. This part typically holds general time and material entries for the given pricing type.",
     )
 
+    # Totals of the entries below. Entries adjust these whenever they are
+    # saved or deleted; recompute_pricing_totals rebuilds them from scratch.
+    total_hours = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0"), editable=False
+    )
+    total_time_cost = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0"), editable=False
+    )
+    total_time_revenue = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0"), editable=False
+    )
+    total_material_cost = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0"), editable=False
+    )
+    total_material_revenue = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0"), editable=False
+    )
+    total_adjustment_cost = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0"), editable=False
+    )
+    total_adjustment_revenue = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0"), editable=False
+    )
+
+    objects = JobPricingQuerySet.as_manager()
+
     class Meta:
         ordering = [
             "-created_at",
@@ -65,40 +163,6 @@ class JobPricing(models.Model):
         """Returns all AdjustmentEntries related to this JobPricing"""
         return self.adjustmententries_set.all()
 
-    @property
-    def total_time_cost(self):
-        """Calculate the total cost for all time entries."""
-        return sum(entry.cost for entry in self.time_entries.all())
-
-    @property
-    def total_time_revenue(self):
-        """Calculate the total revenue for all time entries."""
-        return sum(entry.revenue for entry in self.time_entries.all())
-
-    @property
-    def total_material_cost(self):
-        """Calculate the total cost for all material entries."""
-        return sum(
-            entry.unit_cost * entry.quantity for entry in self.material_entries.all()
-        )
-
-    @property
-    def total_material_revenue(self):
-        """Calculate the total revenue for all material entries."""
-        return sum(
-            entry.unit_revenue * entry.quantity for entry in self.material_entries.all()
-        )
-
-    @property
-    def total_adjustment_cost(self):
-        """Calculate the total cost for all adjustment entries."""
-        return sum(entry.cost_adjustment for entry in self.adjustment_entries.all())
-
-    @property
-    def total_adjustment_revenue(self):
-        """Calculate the total cost for all adjustment entries."""
-        return sum(entry.price_adjustment for entry in self.adjustment_entries.all())
-
     @property
     def total_cost(self):
         """Calculate the total cost including time, materials, and adjustments."""
@@ -115,6 +179,23 @@ class JobPricing(models.Model):
             + self.total_adjustment_revenue
         )
 
+    @classmethod
+    def apply_totals_delta(cls, pricing_id, delta):
+        """Add the given amounts to one pricing's stored totals, in the database."""
+        changes = {field: F(field) + amount for field, amount in delta.items() if amount}
+        if changes:
+            cls.objects.filter(pk=pricing_id).update(**changes)
+
+    @classmethod
+    def recalculate_totals(cls, pricing_ids):
+        """Rebuild the stored totals of the given pricings from their entries."""
+        pricing_ids = [pricing_id for pricing_id in pricing_ids if pricing_id]
+        if not pricing_ids:
+            return 0
+        return cls.objects.filter(pk__in=pricing_ids).update(
+            **JobPricingQuerySet.live_totals()
+        )
+
     def save(self, *args, **kwargs):
         if self._state.adding:
             self.revision_number = 1
@@ -135,14 +216,16 @@ class JobPricing(models.Model):
                 )
 
         else:
-            # Normal save for existing instances
+            # Normal save for existing instances. The totals are maintained by
+            # the entries, so a stale copy held in memory must not overwrite them
+            if kwargs.get("update_fields") is None:
+                kwargs["update_fields"] = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name not in TOTAL_FIELDS
+                ]
             super().save(*args, **kwargs)
 
-    @property
-    def total_hours(self) -> Decimal:
-        """Calculate the total hours for all time entries."""
-        return sum(entry.hours for entry in self.time_entries.all())
-
     def display_entries(self):
         """This is like a long form of __str___ -
         it gives a full list of all time/materials/adjustments."""
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class JobSearchDocument(models.Model):
+    """
+    Denormalised text of a job (number, name, description, client, contact,
+    people and status) behind the FULLTEXT index used by job search.
+
+    Kept in step by apps.job.services.job_search_service whenever the job,
+    its people or its client's name change.
+    """
+
+    job = models.OneToOneField(
+        "Job",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    document = models.TextField(blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Search document for job {self.job_id}"
@@ -5,10 +5,15 @@ from datetime import date
 from django.db import models
 from django.utils import timezone
 
+from apps.job.models.pricing_entry import PricingEntry
 
-class MaterialEntry(models.Model):
+
+class MaterialEntry(PricingEntry):
     """Materials, e.g., sheets"""
 
+    totals_source_fields = ("quantity", "unit_cost", "unit_revenue")
+    report_date_field = "accounting_date"
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     job_pricing = models.ForeignKey(
         "JobPricing",
@@ -71,5 +76,11 @@ class MaterialEntry(models.Model):
     def revenue(self) -> Decimal:
         return self.unit_revenue * self.quantity
 
+    def get_pricing_totals(self) -> dict:
+        return {
+            "total_material_cost": self.cost,
+            "total_material_revenue": self.revenue,
+        }
+
     def __str__(self):
         return f"Material for {self.job_pricing.job.name} - {self.description}"
@@ -0,0 +1,29 @@
+from django.db import models
+
+from apps.workflow.models import BackgroundRun
+
+
+class MonthEndRun(BackgroundRun):
+    """
+    A month-end run over a set of jobs, processed in the background by
+    MonthEndService.
+    """
+
+    PROGRESS_FIELDS = ("total_jobs", "processed_jobs")
+
+    job_ids = models.JSONField(default=list, help_text="Jobs selected for the run")
+    total_jobs = models.PositiveIntegerField(default=0)
+    processed_jobs = models.PositiveIntegerField(default=0)
+    started_by = models.ForeignKey(
+        "accounts.Staff",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="month_end_runs",
+    )
+
+    def __str__(self):
+        return (
+            f"Month-end run {self.id}: {self.processed_jobs}/{self.total_jobs} "
+            f"jobs ({self.status})"
+        )
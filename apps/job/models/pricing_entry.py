@@ -0,0 +1,283 @@
+import copy
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from apps.job.models.job_pricing import JobPricing
+
+
+def _refresh_daily_job_profits(report_keys):
+    # Lazy import: the accounting app builds on the job models
+    from apps.accounting.services import DailyJobProfitService
+
+    DailyJobProfitService.refresh_for_entries(report_keys)
+
+
+class PricingEntryQuerySet(models.QuerySet):
+    """
+    Bulk operations skip save() and delete() on the instances, so they
+    rebuild the stored totals of every pricing they touched, and the daily
+    job profits of every day, instead.
+    """
+
+    def _report_keys(self):
+        return set(
+            self.order_by()
+            .values_list(self.model.report_date_field, "job_pricing_id")
+            .distinct()
+        )
+
+    def delete(self):
+        with transaction.atomic():
+            report_keys = self._report_keys()
+            result = super().delete()
+            JobPricing.recalculate_totals({pk for _, pk in report_keys})
+            _refresh_daily_job_profits(report_keys)
+        return result
+
+    def update(self, **kwargs):
+        # As save() would through auto_now
+        kwargs.setdefault("updated_at", timezone.now())
+        if not set(kwargs) & self.model.get_report_source_fields():
+            return super().update(**kwargs)
+
+        with transaction.atomic():
+            report_keys = self._report_keys()
+            moving_fields = {
+                "job_pricing",
+                "job_pricing_id",
+                self.model.report_date_field,
+            }
+            if set(kwargs) & moving_fields:
+                # Entries may move, so find where they went afterwards
+                pks = list(self.values_list("pk", flat=True))
+                rows = super().update(**kwargs)
+                report_keys |= self.model.objects.filter(pk__in=pks)._report_keys()
+            else:
+                rows = super().update(**kwargs)
+            if set(kwargs) & self.model.get_totals_source_fields():
+                JobPricing.recalculate_totals({pk for _, pk in report_keys})
+            _refresh_daily_job_profits(report_keys)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic():
+            objs = super().bulk_create(objs, *args, **kwargs)
+            JobPricing.recalculate_totals({obj.job_pricing_id for obj in objs})
+            _refresh_daily_job_profits({obj._get_report_key() for obj in objs})
+        for obj in objs:
+            obj._remember_saved_values()
+        return objs
+
+
+class PricingEntry(models.Model):
+    """
+    Base for the entries summed into JobPricing's stored totals.
+
+    Subclasses define get_pricing_totals(), the entry's contribution to each
+    JobPricing total it feeds, reading only totals_source_fields.
+
+    Saving or deleting an entry moves its pricing's totals by the difference
+    it makes, worked out from the values it had when loaded, rather than
+    re-summing every entry on the pricing.
+    """
+
+    # Fields get_pricing_totals() reads, besides job_pricing
+    totals_source_fields = ()
+    # The date the entry counts on in reports such as the KPI calendar
+    report_date_field = None
+    # Other fields the daily job profits read, besides those above
+    report_source_fields = ()
+
+    # The values of get_remembered_fields() when last loaded or saved. What
+    # the entry contributed then is only worked out if it is written, so
+    # plain reads pay nothing for it.
+    _saved_values = None
+
+    objects = PricingEntryQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_totals_source_fields(cls):
+        return {"job_pricing", "job_pricing_id", *cls.totals_source_fields}
+
+    @classmethod
+    def get_report_source_fields(cls):
+        return {
+            cls.report_date_field,
+            *cls.get_totals_source_fields(),
+            *cls.report_source_fields,
+        }
+
+    @classmethod
+    def get_remembered_fields(cls):
+        return {"job_pricing_id", cls.report_date_field, *cls.totals_source_fields}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Deferred fields aren't in field_names, so are left unknown
+        remembered = cls.get_remembered_fields()
+        instance._saved_values = {
+            name: value
+            for name, value in zip(field_names, values)
+            if name in remembered
+        }
+        return instance
+
+    def _remember_saved_values(self, update_fields=None):
+        names = self.get_remembered_fields()
+        if update_fields is None:
+            saved = {}
+        else:
+            names &= {self._meta.get_field(name).attname for name in update_fields}
+            saved = dict(self._saved_values or {})
+        # Reading deferred fields here would cost a query per row
+        saved.update(
+            {name: self.__dict__[name] for name in names if name in self.__dict__}
+        )
+        self._saved_values = saved
+
+    def _get_current_totals(self):
+        # Views assign floats and strings straight from the request, and the
+        # database rounds what it stores, so work from the values as stored.
+        # Otherwise the difference would stay in the totals for good.
+        for name in self.totals_source_fields:
+            field = self._meta.get_field(name)
+            value = field.to_python(getattr(self, name))
+            if isinstance(value, Decimal) and field.decimal_places is not None:
+                value = value.quantize(
+                    Decimal(1).scaleb(-field.decimal_places), rounding=ROUND_HALF_UP
+                )
+            setattr(self, name, value)
+        return self.get_pricing_totals()
+
+    def _get_saved_pricing_totals(self):
+        """
+        (job_pricing_id, totals) this entry contributed when last loaded or
+        saved, or None if some of the values that takes are unknown.
+        """
+        saved = self._saved_values or {}
+        if not saved.keys() >= {"job_pricing_id", *self.totals_source_fields}:
+            return None
+        snapshot = copy.copy(self)
+        snapshot.__dict__.update(saved)
+        return saved["job_pricing_id"], snapshot._get_current_totals()
+
+    def _get_stored_pricing_id(self):
+        return (
+            type(self)
+            ._base_manager.filter(pk=self.pk)
+            .values_list("job_pricing_id", flat=True)
+            .first()
+        )
+
+    def _get_report_key(self, values=None):
+        if values is None:
+            values = {
+                name: getattr(self, name)
+                for name in (self.report_date_field, "job_pricing_id")
+            }
+        # Views assign strings, and the date defaults assign datetimes
+        report_date = self._meta.get_field(self.report_date_field).to_python(
+            values[self.report_date_field]
+        )
+        return report_date, values["job_pricing_id"]
+
+    def _get_saved_report_key(self):
+        saved = self._saved_values or {}
+        if not saved.keys() >= {self.report_date_field, "job_pricing_id"}:
+            return None
+        return self._get_report_key(saved)
+
+    def _get_stored_report_key(self):
+        return (
+            type(self)
+            ._base_manager.filter(pk=self.pk)
+            .values_list(self.report_date_field, "job_pricing_id")
+            .first()
+        )
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not (
+            set(update_fields) & self.get_report_source_fields()
+        ):
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic():
+            if self._state.adding:
+                saved_report_key = None
+            else:
+                saved_report_key = (
+                    self._get_saved_report_key() or self._get_stored_report_key()
+                )
+
+            self._save_with_totals(*args, **kwargs)
+            _refresh_daily_job_profits({saved_report_key, self._get_report_key()})
+        self._remember_saved_values(update_fields)
+
+    def _save_with_totals(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        sources = self.get_totals_source_fields()
+        if update_fields is not None and not set(update_fields) & sources:
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic():
+            adding = self._state.adding
+            saved_totals = None
+            if not adding and (
+                update_fields is None
+                or set(self.totals_source_fields) <= set(update_fields)
+            ):
+                saved_totals = self._get_saved_pricing_totals()
+            if not adding and saved_totals is None:
+                saved_pricing_id = self._get_stored_pricing_id()
+
+            # Also rounds the values about to be written
+            current_totals = self._get_current_totals()
+            super().save(*args, **kwargs)
+
+            if adding:
+                JobPricing.apply_totals_delta(self.job_pricing_id, current_totals)
+            elif saved_totals is None:
+                JobPricing.recalculate_totals({self.job_pricing_id, saved_pricing_id})
+            elif saved_totals[0] == self.job_pricing_id:
+                saved = saved_totals[1]
+                JobPricing.apply_totals_delta(
+                    self.job_pricing_id,
+                    {
+                        field: amount - saved[field]
+                        for field, amount in current_totals.items()
+                    },
+                )
+            else:
+                # Moved to another pricing
+                self._subtract_totals(*saved_totals)
+                JobPricing.apply_totals_delta(self.job_pricing_id, current_totals)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            report_key = (
+                self._get_saved_report_key() or self._get_stored_report_key()
+            )
+            saved_totals = self._get_saved_pricing_totals()
+            if saved_totals is None:
+                pricing_id = self._get_stored_pricing_id()
+                result = super().delete(*args, **kwargs)
+                JobPricing.recalculate_totals({pricing_id})
+            else:
+                result = super().delete(*args, **kwargs)
+                self._subtract_totals(*saved_totals)
+            _refresh_daily_job_profits({report_key})
+        self._saved_values = None
+        return result
+
+    @staticmethod
+    def _subtract_totals(pricing_id, totals):
+        JobPricing.apply_totals_delta(
+            pricing_id, {field: -amount for field, amount in totals.items()}
+        )
@@ -0,0 +1,26 @@
+"""
+Standalone job functions for APScheduler related to jobs.
+These functions must be independent to ensure they can be properly serialized.
+"""
+
+import logging
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+def compact_kanban_ranks_job():
+    """
+    Respaces kanban columns whose ranks have grown long from repeated drops
+    into the same place.
+    """
+    logger.info("Running kanban rank compaction job.")
+    try:
+        close_old_connections()
+        # Import models/services here to avoid AppRegistryNotReady errors during Django startup
+        from apps.job.services.kanban_rank_service import compact_ranks
+
+        compacted = compact_ranks()
+        logger.info(f"Kanban rank compaction finished, {compacted} columns compacted.")
+    except Exception as e:
+        logger.error(f"Error during kanban rank compaction job: {e}", exc_info=True)
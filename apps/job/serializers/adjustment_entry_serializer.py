@@ -4,6 +4,8 @@ from apps.job.models import AdjustmentEntry
 
 
 class AdjustmentEntrySerializer(serializers.ModelSerializer):
+    # Writable so autosave can tell which stored entry a row is
+    id = serializers.UUIDField(required=False)
     revenue = serializers.SerializerMethodField(read_only=True)
     cost = serializers.SerializerMethodField(read_only=True)
     description = serializers.CharField(allow_blank=True, required=False)
@@ -7,6 +7,7 @@ from rest_framework import serializers
 
 from apps.job.enums import JobPricingStage
 from apps.job.models import JobPricing
+from apps.job.services.pricing_entry_service import sync_entries
 from .adjustment_entry_serializer import AdjustmentEntrySerializer
 from .material_entry_serializer import MaterialEntrySerializer
 from apps.timesheet.serializers import (
@@ -129,69 +130,21 @@ class JobPricingSerializer(serializers.ModelSerializer):
         return validated
 
     def update(self, instance, validated_data):
-        # Update time entries
-        if (
-            "time_entries" in validated_data
-            and instance.pricing_stage != JobPricingStage.REALITY
-        ):
-            # Delete existing entries
-            instance.time_entries.all().delete()
-            # Create new entries using serializer
-            for time_entry_data in validated_data.pop("time_entries", []):
-                time_entry_serializer = TimeEntrySerializer(data=time_entry_data)
-                if time_entry_serializer.is_valid():
-                    time_entry_serializer.save(job_pricing=instance)
-                else:
-                    logger.error(
-                        f"Time entry validation failed: {time_entry_serializer.errors}"
-                    )
-                    raise serializers.ValidationError(
-                        {"time_entries": time_entry_serializer.errors}
-                    )
-
-        # Remove time entries if the pricing stage is REALITY
-        if "time_entries" in validated_data:
-            validated_data.pop("time_entries")
-
-        # Update material entries
-        if "material_entries" in validated_data:
-            # Delete existing entries
-            instance.material_entries.all().delete()
-            # Create new entries using serializer
-            for material_entry_data in validated_data.pop("material_entries", []):
-                material_entry_serializer = MaterialEntrySerializer(
-                    data=material_entry_data
-                )
-                if material_entry_serializer.is_valid():
-                    material_entry_serializer.save(job_pricing=instance)
-                else:
-                    logger.error(
-                        "Material entry validation failed: %(errors)s",
-                        {"errors": material_entry_serializer.errors},
-                    )
-                    raise serializers.ValidationError(
-                        {"material_entries": material_entry_serializer.errors}
-                    )
-
-        # Update adjustment entries
-        if "adjustment_entries" in validated_data:
-            # Delete existing entries
-            instance.adjustment_entries.all().delete()
-            # Create new entries using serializer
-            for adjustment_entry_data in validated_data.pop("adjustment_entries", []):
-                adjustment_entry_serializer = AdjustmentEntrySerializer(
-                    data=adjustment_entry_data
-                )
-                if adjustment_entry_serializer.is_valid():
-                    adjustment_entry_serializer.save(job_pricing=instance)
-                else:
-                    logger.error(
-                        "Adjustment entry validation failed: %(errors)s",
-                        {"errors": adjustment_entry_serializer.errors},
-                    )
-                    raise serializers.ValidationError(
-                        {"adjustment_entries": adjustment_entry_serializer.errors}
-                    )
+        # Entries are diffed against the stored ones rather than recreated;
+        # entry_ids lists the resulting ids in the order they were sent
+        self.entry_ids = {}
+        for section in ["time_entries", "material_entries", "adjustment_entries"]:
+            if section not in validated_data:
+                continue
+            rows = validated_data.pop(section)
+            # Reality time comes from timesheets, never from the job grids
+            if (
+                section == "time_entries"
+                and instance.pricing_stage == JobPricingStage.REALITY
+            ):
+                continue
+            entries = sync_entries(instance, section, rows)
+            self.entry_ids[section] = [str(entry.id) for entry in entries]
 
         # Update other fields (that aren't relationships, otherwise they would be handled above)
         related_fields = ["time_entries", "material_entries", "adjustment_entries"]
@@ -151,6 +151,8 @@ class JobSerializer(serializers.ModelSerializer):
             "latest_reality_pricing": instance.latest_reality_pricing,
         }
 
+        # Ids of the saved entries, per pricing and section, for the client
+        self.entry_ids = {}
         for pricing_methodology, pricing_instance in pricing_methodologys.items():
             pricing_data = validated_data.get(pricing_methodology)
             if pricing_data:
@@ -172,6 +174,7 @@ class JobSerializer(serializers.ModelSerializer):
                 if pricing_serializer.is_valid():
                     logger.debug(f"{pricing_methodology} serializer is valid")
                     pricing_serializer.save()
+                    self.entry_ids[pricing_methodology] = pricing_serializer.entry_ids
                 else:
                     logger.error(
                         "%(type)s serializer validation failed: %(errors)s",
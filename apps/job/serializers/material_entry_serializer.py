@@ -5,6 +5,8 @@ from apps.job.models import MaterialEntry
 
 
 class MaterialEntrySerializer(serializers.ModelSerializer):
+    # Writable so autosave can tell which stored entry a row is
+    id = serializers.UUIDField(required=False)
     unit_cost = serializers.DecimalField(max_digits=10, decimal_places=2)
     unit_revenue = serializers.DecimalField(max_digits=10, decimal_places=2)
     revenue = serializers.SerializerMethodField()
@@ -0,0 +1,190 @@
+"""
+Full-text job search shared by the kanban board and advanced search.
+
+Each job has a JobSearchDocument holding its searchable text in one column,
+which on MariaDB/MySQL carries a FULLTEXT index. Searches match every term
+against that index in boolean mode and rank by relevance, instead of chaining
+icontains across joined tables.
+"""
+
+import logging
+import re
+
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import F, FloatField, Func, Lookup, Q, QuerySet, Value
+
+from apps.job.models import Job, JobSearchDocument
+
+logger = logging.getLogger(__name__)
+
+# InnoDB's default innodb_ft_min_token_size; shorter words aren't indexed
+MIN_INDEXED_TERM_LENGTH = 3
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Job fields that appear in the document. Saves limited to other fields
+# (e.g. a kanban reorder) don't need to touch the index.
+INDEXED_JOB_FIELDS = {
+    "job_number",
+    "name",
+    "description",
+    "client",
+    "contact",
+    "contact_person",
+    "created_by",
+    "status",
+}
+
+
+class MatchAgainst(Func):
+    """MATCH (column) AGAINST (query IN BOOLEAN MODE), MariaDB/MySQL only."""
+
+    output_field = FloatField()
+
+    def __init__(self, expression, query):
+        super().__init__(expression, Value(query))
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        column, query = self.get_source_expressions()
+        column_sql, column_params = compiler.compile(column)
+        query_sql, query_params = compiler.compile(query)
+        return (
+            f"MATCH ({column_sql}) AGAINST ({query_sql} IN BOOLEAN MODE)",
+            (*column_params, *query_params),
+        )
+
+
+class FullTextMatch(Lookup):
+    """
+    The MATCH ... AGAINST predicate itself, for WHERE clauses.
+
+    Filtering on the relevance instead would drop real matches: InnoDB
+    scores a term found in every document at 0.
+    """
+
+    lookup_name = "fulltext_match"
+
+    def as_mysql(self, compiler, connection):
+        column_sql, column_params = self.process_lhs(compiler, connection)
+        query_sql, query_params = self.process_rhs(compiler, connection)
+        return (
+            f"MATCH ({column_sql}) AGAINST ({query_sql} IN BOOLEAN MODE)",
+            (*column_params, *query_params),
+        )
+
+
+def _get_staff_name(staff) -> str:
+    return staff.get_display_full_name() if staff else ""
+
+
+def build_search_document(job: Job) -> str:
+    """All of a job's searchable text, one value per line."""
+    status_label = dict(Job.JOB_STATUS_CHOICES).get(job.status, job.status)
+    values = [
+        str(job.job_number),
+        job.name,
+        job.description,
+        job.client.name if job.client else "",
+        job.contact.name if job.contact else "",
+        job.contact_person,
+        _get_staff_name(job.created_by),
+        *(_get_staff_name(staff) for staff in job.people.all()),
+        status_label,
+    ]
+    return "\n".join(value for value in values if value)
+
+
+def update_search_documents(jobs) -> int:
+    """
+    Rebuild the search documents of the given jobs (a queryset or list of ids).
+    Returns how many were written.
+    """
+    if not isinstance(jobs, QuerySet):
+        jobs = Job.objects.filter(pk__in=list(jobs))
+    jobs = jobs.select_related("client", "contact", "created_by").prefetch_related(
+        "people"
+    )
+
+    documents = [
+        JobSearchDocument(job=job, document=build_search_document(job))
+        for job in jobs
+    ]
+    # MySQL's ON DUPLICATE KEY UPDATE can't name a conflict target (it uses
+    # the unique job key anyway), and Django rejects unique_fields there
+    unique_fields = (
+        ["job"] if connection.features.supports_update_conflicts_with_target else None
+    )
+    JobSearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=unique_fields,
+        update_fields=["document", "updated_at"],
+    )
+    return len(documents)
+
+
+def update_search_documents_for_staff(staff) -> int:
+    """Rebuild the documents of every job a staff member created or is on."""
+    jobs = Job.objects.filter(Q(created_by=staff) | Q(people=staff)).distinct()
+    return update_search_documents(jobs.values_list("pk", flat=True))
+
+
+def update_search_document(job: Job, update_fields=None) -> None:
+    """Called after a job is saved; skips saves that can't change the text."""
+    if update_fields is not None and not set(update_fields) & INDEXED_JOB_FIELDS:
+        return
+    update_search_documents([job.pk])
+
+
+def _get_terms(text: str) -> list[str]:
+    # Word characters only, which also strips the boolean-mode operators
+    return re.findall(r"\w+", text or "")
+
+
+def search_jobs(text: str, jobs=None):
+    """
+    Restrict jobs to those whose search document contains every term of text,
+    annotated with search_rank (higher is better; 0 where not ranked).
+
+    Terms shorter than the index's minimum token length, and every term on
+    databases without FULLTEXT support, fall back to a substring match on
+    the document.
+    """
+    jobs = Job.objects.all() if jobs is None else jobs
+    terms = _get_terms(text)
+
+    indexed_terms = [term for term in terms if len(term) >= MIN_INDEXED_TERM_LENGTH]
+    if connection.vendor == "mysql" and indexed_terms:
+        # Every term required, each matched as a prefix
+        boolean_query = " ".join(f"+{term}*" for term in indexed_terms)
+        jobs = jobs.filter(
+            FullTextMatch(F("search_document__document"), boolean_query)
+        ).annotate(
+            search_rank=MatchAgainst(F("search_document__document"), boolean_query)
+        )
+        substring_terms = [term for term in terms if term not in indexed_terms]
+    else:
+        jobs = jobs.annotate(search_rank=Value(0.0, output_field=FloatField()))
+        substring_terms = terms
+
+    for term in substring_terms:
+        jobs = jobs.filter(search_document__document__icontains=term)
+    return jobs
+
+
+def get_search_page(jobs, page_number, page_size):
+    """
+    Page through ranked search results, best match first.
+
+    Returns:
+        (page, paginator), clamping page_number and page_size to valid values
+    """
+    try:
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+    except (TypeError, ValueError):
+        page_size = DEFAULT_PAGE_SIZE
+
+    paginator = Paginator(jobs.order_by("-search_rank", "-created_at"), page_size)
+    return paginator.get_page(page_number), paginator
@@ -3,10 +3,11 @@ import logging
 from django.db import transaction
 from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
-from apps.workflow.models import CompanyDefaults
-
-from apps.job.models import Job, JobPricing, AdjustmentEntry, MaterialEntry
+from apps.job.models import Job, AdjustmentEntry, MaterialEntry
+from apps.job.services.job_search_service import update_search_documents
+from apps.job.services.month_end_service import archive_and_reset_job_pricings
 
 from apps.timesheet.models import TimeEntry
 
@@ -18,57 +19,7 @@ logger = logging.getLogger(__name__)
 def archive_and_reset_job_pricing(job_id):
     """Archives current pricing and resets to defaults based on company defaults."""
     job = Job.objects.get(id=job_id)
-
-    # Fetch company defaults (assuming only one instance exists)
-    company_defaults = CompanyDefaults.objects.first()
-    if not company_defaults:
-        raise ValueError("Company defaults are not configured.")
-
-    with transaction.atomic():
-        # Archive current pricing by marking them as historical
-        current_pricings = JobPricing.objects.filter(job=job, is_historical=False)
-        for pricing in current_pricings:
-            pricing.is_historical = True
-            pricing.save()
-            # Add to the archived_pricings relationship
-            job.archived_pricings.add(pricing)
-
-        # Create new pricing for "estimate"
-        estimate_pricing = JobPricing.objects.create(
-            job=job,
-            pricing_stage="estimate",
-        )
-        estimate_pricing.time_entries.create(
-            wage_rate=company_defaults.wage_rate,
-            charge_out_rate=company_defaults.charge_out_rate,
-        )
-
-        # Create new pricing for "quote"
-        quote_pricing = JobPricing.objects.create(
-            job=job,
-            pricing_stage="quote",
-        )
-        quote_pricing.adjustment_entries.create(
-            cost_adjustment=company_defaults.time_markup,
-            price_adjustment=company_defaults.charge_out_rate
-            * company_defaults.time_markup,
-        )
-
-        # Create new pricing for "reality"
-        reality_pricing = JobPricing.objects.create(
-            job=job,
-            pricing_stage="reality",
-        )
-        reality_pricing.material_entries.create(
-            unit_cost=company_defaults.wage_rate,
-            unit_revenue=company_defaults.charge_out_rate,
-        )
-
-        # Save references to the job
-        job.latest_estimate_pricing = estimate_pricing
-        job.latest_quote_pricing = quote_pricing
-        job.latest_reality_pricing = reality_pricing
-        job.save()
+    archive_and_reset_job_pricings([job.id])
 
 
 def get_job_with_pricings(job_id):
@@ -150,7 +101,7 @@ def archive_complete_jobs(job_ids):
             try:
                 job = Job.objects.get(id=jid)
                 job.status = "archived"
-                job.save(update_fields=["status"])
+                job.save(update_fields=["status", "updated_at"])
                 archived_count += 1
                 logger.info(f"Job {jid} successfully archived")
             except Job.DoesNotExist:
@@ -172,6 +123,9 @@ class JobStaffService:
 
             if staff not in job.people.all():
                 job.people.add(staff)
+                # The kanban board's version stamp follows updated_at
+                Job.objects.filter(pk=job.pk).update(updated_at=timezone.now())
+                update_search_documents([job.pk])
 
             return True, None
         except Job.DoesNotExist:
@@ -190,6 +144,8 @@ class JobStaffService:
 
             if staff in job.people.all():
                 job.people.remove(staff)
+                Job.objects.filter(pk=job.pk).update(updated_at=timezone.now())
+                update_search_documents([job.pk])
 
             return True, None
         except Job.DoesNotExist:
@@ -0,0 +1,163 @@
+"""
+Ordering of jobs within a kanban column by rank strings.
+
+A rank is a base-36 fraction written without the leading "0." (so "i" is
+one half and "9" a quarter), and a column is sorted by rank ascending, top
+card first. There is always another rank between two different ranks, so a
+card can be dropped anywhere by writing only its own row; ranks just get
+longer where many cards are dropped in the same place. compact_column
+spaces a column out again, and runs in the background rather than while a
+user is dragging cards.
+"""
+
+import logging
+import math
+
+from django.db import transaction
+from django.db.models.functions import Length
+
+from apps.job.models import Job
+
+logger = logging.getLogger(__name__)
+
+# Lower case only, so case-insensitive collations sort ranks the same way
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_BASE = len(RANK_DIGITS)
+
+# Columns with ranks longer than this are compacted by the scheduled job
+RANK_COMPACT_LENGTH = 12
+
+
+class RankError(ValueError):
+    """The neighbouring ranks leave no room between them."""
+
+
+def _digit(rank: str, index: int) -> int:
+    return RANK_DIGITS.index(rank[index]) if index < len(rank) else 0
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """
+    A rank that sorts after before and ahead of after. Either may be None for
+    the top or bottom of the column.
+
+    Raises:
+        RankError: If before doesn't sort ahead of after
+    """
+    if after is not None and not (before or "") < after:
+        raise RankError(f"No rank between {before!r} and {after!r}")
+
+    # Cards keep landing at the same end of a column, so step along from the
+    # neighbour there instead of halving the gap, which costs a digit per
+    # few cards rather than per few dozen
+    if before is None and after is not None:
+        step = -1
+    elif before is not None and after is None:
+        step = 1
+    else:
+        step = 0
+    return _rank_between(before or "", after, step)
+
+
+def _rank_between(before: str, after: str | None, step: int) -> str:
+    # Copy the digits the two ranks share
+    prefix = ""
+    if after is not None:
+        while len(prefix) < len(after) and _digit(before, len(prefix)) == _digit(
+            after, len(prefix)
+        ):
+            prefix += after[len(prefix)]
+    position = len(prefix)
+
+    low = _digit(before, position)
+    high = _digit(after, position) if after is not None else RANK_BASE
+    if high - low > 1:
+        match step:
+            case -1:
+                digit = high - 1
+            case 1:
+                digit = low + 1
+            case _:
+                digit = (low + high) // 2
+        return prefix + RANK_DIGITS[digit]
+    if after is not None and len(after) > position + 1:
+        # after continues past this digit, so the digit alone sorts ahead of it
+        return prefix + after[position]
+    # Adjacent digits: keep before's and go one digit deeper
+    return prefix + RANK_DIGITS[low] + _rank_between(before[position + 1 :], None, step)
+
+
+def spaced_ranks(count: int) -> list[str]:
+    """count ranks of equal length, spread evenly across the whole range."""
+    width = max(1, math.ceil(math.log(count + 1, RANK_BASE)) + 1)
+    span = RANK_BASE**width
+    ranks = []
+    for index in range(1, count + 1):
+        value = index * span // (count + 1)
+        digits = ""
+        for _ in range(width):
+            value, remainder = divmod(value, RANK_BASE)
+            digits = RANK_DIGITS[remainder] + digits
+        # Trailing zeros add nothing, and a rank ending in one has no room below
+        ranks.append(digits.rstrip("0"))
+    return ranks
+
+
+def get_top_rank(status: str) -> str | None:
+    """Rank of the first card in a column, read through the (status, rank) index."""
+    return (
+        Job.objects.filter(status=status)
+        .order_by("rank")
+        .values_list("rank", flat=True)
+        .first()
+    )
+
+
+def get_rank_at_top(status: str) -> str:
+    """A rank for a job going to the top of a column."""
+    try:
+        return rank_between(None, get_top_rank(status))
+    except RankError:
+        # Only rows written without a rank (e.g. loaded from a fixture) get here
+        compact_column(status)
+        return rank_between(None, get_top_rank(status))
+
+
+def compact_column(status: str) -> int:
+    """
+    Respace the ranks of one column, keeping its order. Returns the number of
+    jobs in it.
+    """
+    with transaction.atomic():
+        # Locked so a card dropped meanwhile isn't written back to its old place
+        pks = list(
+            Job.objects.select_for_update()
+            .filter(status=status)
+            .order_by("rank", "-created_at", "-id")
+            .values_list("pk", flat=True)
+        )
+        jobs = [
+            Job(pk=pk, rank=rank) for pk, rank in zip(pks, spaced_ranks(len(pks)))
+        ]
+        Job.objects.bulk_update(jobs, ["rank"], batch_size=500)
+    logger.info(f"Compacted {len(jobs)} kanban ranks in column {status}")
+    return len(jobs)
+
+
+def get_statuses_to_compact(max_length: int = RANK_COMPACT_LENGTH) -> list[str]:
+    return list(
+        Job.objects.annotate(rank_length=Length("rank"))
+        .filter(rank_length__gt=max_length)
+        .order_by()
+        .values_list("status", flat=True)
+        .distinct()
+    )
+
+
+def compact_ranks(max_length: int = RANK_COMPACT_LENGTH) -> int:
+    """Compact every column holding a rank longer than max_length."""
+    compacted = 0
+    for status in get_statuses_to_compact(max_length):
+        compact_column(status)
+        compacted += 1
+    return compacted
@@ -0,0 +1,196 @@
+"""
+Month-end processing: archiving the current pricings of jobs and starting
+them again from the company defaults.
+
+archive_and_reset_job_pricings does this for a whole batch of jobs with a
+fixed number of bulk statements, however many jobs are in it.
+MonthEndService runs it over the selected jobs as a background run,
+recording progress on a MonthEndRun.
+"""
+
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+from simple_history.utils import bulk_update_with_history
+
+from apps.job.enums import JobPricingStage
+from apps.job.models import (
+    AdjustmentEntry,
+    Job,
+    JobPart,
+    JobPricing,
+    MaterialEntry,
+    MonthEndRun,
+)
+from apps.timesheet.models import TimeEntry
+from apps.workflow.models import CompanyDefaults
+from apps.workflow.services.background_run_service import start_background_run
+
+logger = logging.getLogger(__name__)
+
+LATEST_PRICING_FIELDS = {
+    JobPricingStage.ESTIMATE: "latest_estimate_pricing",
+    JobPricingStage.QUOTE: "latest_quote_pricing",
+    JobPricingStage.REALITY: "latest_reality_pricing",
+}
+
+
+def _seed_entry(pricing, company_defaults):
+    """The entry a new pricing of each stage starts with."""
+    match pricing.pricing_stage:
+        case JobPricingStage.ESTIMATE:
+            return TimeEntry(
+                job_pricing=pricing,
+                wage_rate=company_defaults.wage_rate,
+                charge_out_rate=company_defaults.charge_out_rate,
+            )
+        case JobPricingStage.QUOTE:
+            return AdjustmentEntry(
+                job_pricing=pricing,
+                cost_adjustment=company_defaults.time_markup,
+                price_adjustment=company_defaults.charge_out_rate
+                * company_defaults.time_markup,
+            )
+        case JobPricingStage.REALITY:
+            return MaterialEntry(
+                job_pricing=pricing,
+                unit_cost=company_defaults.wage_rate,
+                unit_revenue=company_defaults.charge_out_rate,
+            )
+
+
+def archive_and_reset_job_pricings(
+    job_ids, company_defaults=None, staff=None
+) -> list[Job]:
+    """
+    Archive the current pricings of the given jobs and give each a new
+    estimate, quote and reality pricing seeded from the company defaults.
+
+    Does for every job what saving the pricings, parts and entries one by one
+    would, in one transaction: the statements run per batch, not per job.
+
+    Returns:
+        The jobs processed. Ids with no job are skipped.
+    """
+    if company_defaults is None:
+        company_defaults = CompanyDefaults.objects.first()
+    if not company_defaults:
+        raise ValueError("Company defaults are not configured.")
+
+    with transaction.atomic():
+        jobs = list(Job.objects.select_for_update().filter(pk__in=job_ids))
+        if not jobs:
+            return []
+        now = timezone.now()
+
+        # Archive the current pricings
+        archived = list(
+            JobPricing.objects.filter(job__in=jobs, is_historical=False).values_list(
+                "pk", "job_id"
+            )
+        )
+        JobPricing.objects.filter(pk__in=[pk for pk, _ in archived]).update(
+            is_historical=True, updated_at=now
+        )
+        ArchivedPricing = Job.archived_pricings.through
+        ArchivedPricing.objects.bulk_create(
+            [
+                ArchivedPricing(job_id=job_id, jobpricing_id=pk)
+                for pk, job_id in archived
+            ],
+            ignore_conflicts=True,
+        )
+
+        # The new pricings and their default parts point at each other, so
+        # the pricings are written first and linked to their parts after
+        pricings = []
+        for job in jobs:
+            for stage, field in LATEST_PRICING_FIELDS.items():
+                pricing = JobPricing(job=job, pricing_stage=stage, revision_number=1)
+                setattr(job, field, pricing)
+                pricings.append(pricing)
+        JobPricing.objects.bulk_create(pricings)
+
+        parts = [
+            JobPart(
+                job_pricing=pricing,
+                name="Main Work",
+                description="Default part for time entries",
+            )
+            for pricing in pricings
+        ]
+        JobPart.objects.bulk_create(parts)
+        for pricing, part in zip(pricings, parts):
+            pricing.default_part = part
+        JobPricing.objects.bulk_update(pricings, ["default_part"])
+
+        # Seeding through bulk_create also sets the new pricings' totals
+        entries = {}
+        for pricing in pricings:
+            entry = _seed_entry(pricing, company_defaults)
+            entries.setdefault(type(entry), []).append(entry)
+        for model, model_entries in entries.items():
+            model.objects.bulk_create(model_entries)
+
+        for job in jobs:
+            job.updated_at = now
+        bulk_update_with_history(
+            jobs,
+            Job,
+            [*LATEST_PRICING_FIELDS.values(), "updated_at"],
+            default_user=staff,
+            default_change_reason="Month-end processing",
+            default_date=now,
+        )
+
+    logger.info(f"Month-end processed {len(jobs)} jobs")
+    return jobs
+
+
+class MonthEndService:
+    """
+    Runs month-end over the selected jobs as a background process.
+
+    Jobs are processed BATCH_SIZE at a time, each batch in its own
+    transaction, so the run's progress can be committed as it goes. A batch
+    that fails is rolled back whole and stops the run; batches already done
+    stay done, and running month-end again for the remaining jobs is safe.
+    Only one run is active at a time.
+    """
+
+    BATCH_SIZE = 100
+
+    @staticmethod
+    def get_active_run():
+        return MonthEndRun.get_active_run()
+
+    @staticmethod
+    def start_run(job_ids, staff=None):
+        """
+        Start month-end for the given jobs.
+        Returns a tuple of (run, is_new), where is_new is False if a run was
+        already in progress, which is returned instead.
+        """
+        job_ids = [str(job_id) for job_id in dict.fromkeys(job_ids)]
+        return start_background_run(
+            MonthEndRun,
+            MonthEndService.process,
+            job_ids=job_ids,
+            total_jobs=len(job_ids),
+            started_by=staff,
+        )
+
+    @staticmethod
+    def process(run):
+        """Process the jobs of a run, batch by batch."""
+        company_defaults = CompanyDefaults.objects.first()
+        if not company_defaults:
+            raise ValueError("Company defaults are not configured.")
+
+        for start in range(0, len(run.job_ids), MonthEndService.BATCH_SIZE):
+            batch = run.job_ids[start : start + MonthEndService.BATCH_SIZE]
+            archive_and_reset_job_pricings(
+                batch, company_defaults, staff=run.started_by
+            )
+            run.record_progress(processed_jobs=start + len(batch))
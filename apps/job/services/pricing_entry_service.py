@@ -0,0 +1,171 @@
+"""
+Saving the time, material and adjustment entries of a JobPricing as a diff.
+
+Autosave sends every row of every grid. Rather than deleting the entries and
+creating them again, rows are matched to the entries already stored (by id,
+or for rows without one, by identical values) and only the differences are
+written: new rows with one bulk_create, changed rows with one bulk_update and
+removed rows with one delete.
+"""
+
+import logging
+from decimal import Decimal
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from apps.job.models import AdjustmentEntry, JobPricing, MaterialEntry
+from apps.timesheet.models import TimeEntry
+
+logger = logging.getLogger(__name__)
+
+SECTION_MODELS = {
+    "time_entries": TimeEntry,
+    "material_entries": MaterialEntry,
+    "adjustment_entries": AdjustmentEntry,
+}
+
+
+class UnknownEntryError(ValueError):
+    """A patch named an entry the pricing doesn't have."""
+
+
+def _same_value(field, stored, incoming) -> bool:
+    if (
+        isinstance(field, models.DecimalField)
+        and stored is not None
+        and incoming is not None
+    ):
+        # Compare at the precision the column keeps
+        places = Decimal(1).scaleb(-field.decimal_places)
+        return Decimal(stored).quantize(places) == Decimal(incoming).quantize(places)
+    return stored == incoming
+
+
+def _apply_row(entry, row: dict) -> set[str]:
+    """Copy a row onto an entry. Returns the names of the fields it changed."""
+    changed = set()
+    for name, value in row.items():
+        field = entry._meta.get_field(name)
+        if not _same_value(field, getattr(entry, field.attname), value):
+            setattr(entry, field.attname, value)
+            changed.add(field.attname)
+
+    if isinstance(entry, TimeEntry) and entry.hours == 0:
+        # As TimeEntry.save does, hours not given follow items on estimates
+        # and quotes
+        entry.set_hours_from_items()
+        if entry.hours != 0:
+            changed.add("hours")
+    return changed
+
+
+def _matches(entry, row: dict) -> bool:
+    return all(
+        _same_value(
+            entry._meta.get_field(name),
+            getattr(entry, entry._meta.get_field(name).attname),
+            value,
+        )
+        for name, value in row.items()
+    )
+
+
+def sync_entries(
+    pricing: JobPricing, section: str, rows: list[dict], partial: bool = False
+) -> list:
+    """
+    Make a section of a pricing match rows, validated by the entry serializer.
+
+    Args:
+        pricing: JobPricing the entries belong to
+        section: "time_entries", "material_entries" or "adjustment_entries"
+        rows: The entries' values, with "id" for those the client already has
+        partial: Only create or update the given rows, leaving the rest alone
+            (used for a patch to a single row) rather than deleting entries
+            missing from rows
+
+    Raises:
+        UnknownEntryError: If partial and a row's id isn't an entry of the
+            section
+
+    Returns:
+        The entries for rows, in the same order
+    """
+    model = SECTION_MODELS[section]
+    rows = [dict(row) for row in rows]
+    row_ids = [row.pop("id", None) for row in rows]
+
+    if partial:
+        existing = model.objects.filter(
+            job_pricing=pricing, pk__in=[pk for pk in row_ids if pk]
+        )
+    else:
+        # Served from the prefetch cache when the caller has one
+        existing = getattr(pricing, section).all()
+    unmatched = {entry.pk: entry for entry in existing}
+
+    entries = [unmatched.pop(pk, None) if pk else None for pk in row_ids]
+    if partial:
+        missing = [pk for pk, entry in zip(row_ids, entries) if pk and entry is None]
+        if missing:
+            raise UnknownEntryError(f"No {section} {missing} on pricing {pricing.id}")
+    else:
+        # Rows the client has no id for yet (e.g. the simple grids) keep the
+        # entry they were saved as if nothing about them has changed
+        for index, row in enumerate(rows):
+            if entries[index] is None:
+                match = next(
+                    (e for e in unmatched.values() if _matches(e, row)), None
+                )
+                if match is not None:
+                    entries[index] = unmatched.pop(match.pk)
+
+    to_create = []
+    to_update = []
+    update_fields = set()
+    for index, row in enumerate(rows):
+        entry = entries[index]
+        if entry is None:
+            # Ids from another pricing or from an entry deleted meanwhile are
+            # not reused
+            entry = model(job_pricing=pricing, **row)
+            if isinstance(entry, TimeEntry) and entry.hours == 0:
+                entry.set_hours_from_items()
+            entries[index] = entry
+            to_create.append(entry)
+            continue
+
+        changed = _apply_row(entry, row)
+        if changed:
+            to_update.append(entry)
+            update_fields |= changed
+
+    to_delete = [] if partial else list(unmatched)
+
+    with transaction.atomic():
+        if to_delete:
+            model.objects.filter(pk__in=to_delete).delete()
+        if to_create:
+            model.objects.bulk_create(to_create)
+        if to_update:
+            # bulk_update doesn't touch auto_now fields itself
+            now = timezone.now()
+            for entry in to_update:
+                entry.updated_at = now
+            model.objects.bulk_update(to_update, [*update_fields, "updated_at"])
+
+    logger.debug(
+        f"Synced {section} of pricing {pricing.id}: {len(to_create)} created, "
+        f"{len(to_update)} updated, {len(to_delete)} deleted"
+    )
+    return entries
+
+
+def delete_entries(pricing: JobPricing, section: str, ids: list) -> int:
+    """Delete the given entries of a section of a pricing, in one query."""
+    if not ids:
+        return 0
+    model = SECTION_MODELS[section]
+    deleted, _ = model.objects.filter(job_pricing=pricing, pk__in=ids).delete()
+    return deleted
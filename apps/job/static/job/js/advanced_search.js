@@ -47,16 +47,20 @@ export function setupAdvancedSearch() {
     });
 }
 
-function loadClientsDropdown() {
+function loadClientsDropdown(cursor = null) {
   if (Environment.isDebugMode()) console.log("Loading clients for dropdown...");
-  fetch("/clients/api/all/")
+  // The API returns clients a page at a time, so follow next_cursor
+  const url = cursor
+    ? `/clients/api/all/?cursor=${encodeURIComponent(cursor)}`
+    : "/clients/api/all/";
+  fetch(url)
     .then((response) => {
       if (Environment.isDebugMode())
         console.log("Clients API response status:", response.status);
       return response.json().then((data) => ({ data, ok: response.ok }));
     })
     .then(({ data, ok }) => {
-      if (!ok || !Array.isArray(data)) {
+      if (!ok || !Array.isArray(data.results)) {
         console.log("Failed to load clients:", data);
         return;
       }
@@ -64,12 +68,16 @@ function loadClientsDropdown() {
       if (Environment.isDebugMode())
         console.log("Clients loaded successfully:", data);
       const clientSelect = document.getElementById("advClient");
-      data.forEach((client) => {
+      data.results.forEach((client) => {
         const option = document.createElement("option");
         option.value = client.name;
         option.textContent = client.name;
         clientSelect.appendChild(option);
       });
+
+      if (data.next_cursor) {
+        loadClientsDropdown(data.next_cursor);
+      }
     })
     .catch((error) => {
       console.error("Error loading clients:", error);
@@ -115,14 +123,16 @@ function loadStaffDropdown() {
     });
 }
 
-function executeAdvancedSearch() {
+function executeAdvancedSearch(page = 1) {
   const resultsContainer = document.getElementById("searchResults");
-  resultsContainer.innerHTML = `
+  if (page === 1) {
+    resultsContainer.innerHTML = `
         <div class="text-center p-5">
             <div class="spinner-border text-primary" role="status"></div>
             <p class="mt-3">Searching jobs...</p>
         </div>
     `;
+  }
 
   document.getElementById("searchResultsContainer").style.display = "block";
   document.getElementById("kanbanContainer").style.display = "none";
@@ -147,6 +157,7 @@ function executeAdvancedSearch() {
     // Add any non-empty value to query params
     queryParams.append(key, value);
   }
+  queryParams.set("page", page);
 
   if (Environment.isDebugMode())
     console.log("Query params:", queryParams.toString());
@@ -159,7 +170,7 @@ function executeAdvancedSearch() {
             `;
         return;
       }
-      renderSearchResults(data.jobs, data.total);
+      renderSearchResults(data.jobs, data.total, data.page, data.has_next);
     })
     .catch((error) => {
       console.error("Error performing advanced search", error);
@@ -168,15 +179,20 @@ function executeAdvancedSearch() {
     });
 }
 
-function renderSearchResults(jobs, total) {
+function renderSearchResults(jobs, total, page = 1, hasNext = false) {
   const resultsContainer = document.getElementById("searchResults");
   const resultCount = document.getElementById("result-count");
 
   resultCount.textContent = total;
 
-  resultsContainer.innerHTML = "";
+  // Later pages are appended below the ones already shown
+  if (page === 1) {
+    resultsContainer.innerHTML = "";
+  } else {
+    resultsContainer.querySelector(".load-more-results")?.remove();
+  }
 
-  if (jobs.length === 0) {
+  if (jobs.length === 0 && page === 1) {
     resultsContainer.innerHTML = `
             <div class="alert alert-info">No jobs found matching your search criteria.</div>
         `;
@@ -187,6 +203,18 @@ function renderSearchResults(jobs, total) {
     const jobCard = createSearchResultCard(job);
     resultsContainer.appendChild(jobCard);
   });
+
+  if (hasNext) {
+    const loadMore = document.createElement("button");
+    loadMore.type = "button";
+    loadMore.className = "btn btn-outline-secondary w-100 mt-2 load-more-results";
+    loadMore.textContent = "Load more results";
+    loadMore.addEventListener("click", () => {
+      loadMore.disabled = true;
+      executeAdvancedSearch(page + 1);
+    });
+    resultsContainer.appendChild(loadMore);
+  }
 }
 
 function createSearchResultCard(job) {
@@ -141,6 +141,7 @@ function loadAdvJobTime(entries) {
     console.log("[-loadAdvJobTime] entry:", entry);
 
     return {
+      id: entry.id,
       description: entry.description,
       items: entry.items,
       mins_per_item: entry.minutes_per_item,
@@ -160,6 +161,7 @@ function loadAdvJobTime(entries) {
 
 function loadAdvJobMaterial(entries) {
   return entries.map((entry) => ({
+    id: entry.id,
     item_code: entry.item_code,
     description: entry.description,
     quantity: entry.quantity,
@@ -172,6 +174,7 @@ function loadAdvJobMaterial(entries) {
 
 function loadAdvJobAdjustment(entries) {
   return entries.map((entry) => ({
+    id: entry.id,
     description: entry.description,
     cost_adjustment: entry.cost_adjustment,
     price_adjustment: entry.price_adjustment,
@@ -1210,6 +1210,7 @@ function saveDataToServer(collectedData) {
       return response.json();
     })
     .then((data) => {
+      if (data && data.entry_ids) stampEntryIds(data.entry_ids);
       exportJobToPDF(collectedData).then((pdfBlob) => {
         handlePDF(pdfBlob, "upload", collectedData);
         console.log("Autosave successful:", data);
@@ -1232,6 +1233,115 @@ function saveDataToServer(collectedData) {
     });
 }
 
+const ADVANCED_GRID_SECTIONS = {
+  TimeTable: "time_entries",
+  MaterialsTable: "material_entries",
+  AdjustmentsTable: "adjustment_entries",
+};
+
+function isComplexSection(section) {
+  return (
+    section === "reality" ||
+    document.getElementById("complex-job").textContent.toLowerCase() === "true"
+  );
+}
+
+// Give rows saved for the first time the ids the server created, so later
+// saves update those entries instead of matching rows by their values
+function stampEntryIds(entryIds) {
+  ["estimate", "quote", "reality"].forEach((section) => {
+    const pricingIds = entryIds[`latest_${section}_pricing`];
+    if (!pricingIds || !isComplexSection(section)) return;
+
+    Object.entries(ADVANCED_GRID_SECTIONS).forEach(([gridName, entryKey]) => {
+      const ids = pricingIds[entryKey];
+      const gridData = window.grids[`${section}${gridName}`];
+      if (!ids || !gridData || !gridData.api) return;
+
+      const nodes = [];
+      gridData.api.forEachNode((node) => {
+        if (isNonDefaultRow(node.data, gridName)) nodes.push(node);
+      });
+      // The grid changed while saving; the next autosave sorts it out
+      if (nodes.length !== ids.length) return;
+
+      nodes.forEach((node, index) => {
+        if (!node.data.id) node.data.id = ids[index];
+      });
+    });
+  });
+}
+
+const pendingRowPatches = new Map();
+
+/**
+ * Save one edited row of an advanced grid on its own, rather than the whole
+ * job. Only rows the server already has an id for can be patched; anything
+ * else (new rows, simple grids) needs the full autosave.
+ */
+export function patchGridRow(gridKey, gridType, rowData) {
+  const entryKey = ADVANCED_GRID_SECTIONS[gridType];
+  const section = gridKey.slice(0, gridKey.length - gridType.length);
+  if (
+    !entryKey ||
+    !rowData.id ||
+    !["estimate", "quote", "reality"].includes(section) ||
+    (section === "reality" && entryKey === "time_entries")
+  ) {
+    return false;
+  }
+  if (window.isInHistoricalMode && window.isInHistoricalMode()) return true;
+
+  // Debounced per row, so typing in one cell sends one request
+  clearTimeout(pendingRowPatches.get(rowData.id));
+  pendingRowPatches.set(
+    rowData.id,
+    setTimeout(() => {
+      pendingRowPatches.delete(rowData.id);
+      const entry = { ...rowData };
+      if ("mins_per_item" in entry) {
+        entry.minutes_per_item = entry.mins_per_item;
+        delete entry.mins_per_item;
+      }
+
+      const jobId = document.getElementById("job_id").value;
+      fetch(`/api/job/${jobId}/pricing-entries/`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          "X-CSRFToken": getCsrfToken(),
+        },
+        body: JSON.stringify({
+          pricing_stage: section,
+          section: entryKey,
+          entries: [entry],
+        }),
+      })
+        .then((response) => response.json())
+        .then((data) => {
+          if (data.unknown_entry) {
+            // Deleted or never saved here; let the full autosave reconcile it
+            delete rowData.id;
+            debouncedAutosave();
+          } else if (!data.success) {
+            console.error("Row save failed:", data.errors || data.error);
+            renderMessages(
+              [{ level: "error", message: "Autosave failed for an edited row." }],
+              "job-details",
+            );
+          }
+        })
+        .catch((error) => {
+          renderMessages(
+            [{ level: "error", message: `Autosave failed: ${error.message}` }],
+            "job-details",
+          );
+        });
+    }, 1000),
+  );
+  return true;
+}
+
 // Function to extract error messages from a nested error structure
 function extractErrorMessages(errors) {
   // Handle simple string error case
@@ -1425,7 +1535,8 @@ function copyGridData(sourceGridApi, targetGridApi) {
     return;
   }
 
-  const sourceData = getAllRowData(sourceGridApi);
+  // Copies are new entries of the target pricing, so drop the source's ids
+  const sourceData = getAllRowData(sourceGridApi).map(({ id, ...row }) => row);
   const targetData = getAllRowData(targetGridApi);
 
   targetGridApi.applyTransaction({ remove: targetData });
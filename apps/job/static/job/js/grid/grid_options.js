@@ -11,7 +11,7 @@ import {
   fetchMaterialsMarkup,
 } from "./grid_utils.js";
 
-import { debouncedAutosave } from "../edit_job_form_autosave.js";
+import { debouncedAutosave, patchGridRow } from "../edit_job_form_autosave.js";
 import {
   calculateSimpleTotals,
   recalcSimpleTimeRow,
@@ -492,7 +492,10 @@ export function createCommonGridOptions() {
       });
 
       adjustGridHeight(event.api, `${gridKey}`);
-      debouncedAutosave(event);
+      // Edits to saved rows of advanced grids are saved on their own
+      if (!patchGridRow(gridKey, gridType, data)) {
+        debouncedAutosave(event);
+      }
       
       calculateSimpleTotals();
     },
@@ -7,6 +7,13 @@ console.log("kanban.js load started");
 
 let currentSearchTerm = "";
 
+// Idle screens revalidate with If-None-Match and get a 304 until a job changes
+const BOARD_POLL_INTERVAL = 30000;
+const LOAD_MORE_PAGE_SIZE = 50;
+let boardEtag = null;
+let isDragging = false;
+const columnCursors = {};
+
 document.addEventListener("DOMContentLoaded", function () {
   console.log("Script loaded and DOM fully loaded");
 
@@ -19,17 +26,88 @@ document.addEventListener("DOMContentLoaded", function () {
     filterJobs();
     updateColumnCounts();
   });
+
+  document.querySelectorAll(".load-more").forEach((button) => {
+    button.addEventListener("click", () => loadMoreJobs(button.dataset.status));
+  });
+
+  setInterval(() => {
+    if (!document.hidden && !isDragging) loadBoard();
+  }, BOARD_POLL_INTERVAL);
 });
 
 function initializeColumns() {
-  const columns = document.querySelectorAll(".kanban-column");
-  const columnIds = Array.from(columns).map((col) => col.id);
+  loadBoard(true);
+  initializeDragAndDrop();
+}
+
+function loadBoard(force = false) {
+  return fetch("/kanban/fetch_board/")
+    .then((response) => {
+      // A 304 comes back as the cached response, with the same ETag
+      const etag = response.headers.get("ETag");
+      if (!force && etag && etag === boardEtag) return null;
+      boardEtag = etag;
+      return response.json();
+    })
+    .then((data) => {
+      if (!data) return;
+      if (!data.success) {
+        console.error("Error loading board:", data.error);
+        return;
+      }
 
-  columnIds.forEach((status) => {
-    loadJobs(status);
+      Object.entries(data.columns).forEach(([status, column]) => {
+        if (!document.getElementById(status)) return;
+        renderJobs(status, column.jobs);
+        updateCounters(status, column.jobs.length, column.total);
+        setColumnCursor(status, column.next_cursor);
+      });
+      applyStaffFilters();
+    })
+    .catch((error) => {
+      console.error("Error loading board:", error);
+    });
+}
+
+function setColumnCursor(status, cursor) {
+  columnCursors[status] = cursor;
+  const loadMoreContainer = document.querySelector(
+    `#${status}-load-more-container`,
+  );
+  if (loadMoreContainer) {
+    loadMoreContainer.style.display = cursor ? "" : "none";
+  }
+}
+
+function loadMoreJobs(status) {
+  const cursor = columnCursors[status];
+  if (!cursor) return;
+
+  const params = new URLSearchParams({
+    cursor: cursor,
+    limit: LOAD_MORE_PAGE_SIZE,
   });
+  if (currentSearchTerm) params.set("search", currentSearchTerm);
 
-  initializeDragAndDrop();
+  fetch(`/kanban/fetch_jobs/${status}/?${params}`)
+    .then((response) => response.json())
+    .then((data) => {
+      if (!data.success) {
+        console.error(`Error loading more ${status} jobs:`, data.error);
+        return;
+      }
+
+      const container = document.querySelector(`#${status} .job-list`);
+      data.jobs.forEach((job) => container.appendChild(createJobCard(job)));
+      initializeDragAndDropForColumn(container);
+      initializeStaffDragAndDrop();
+      setColumnCursor(status, data.next_cursor);
+      applyStaffFilters();
+    })
+    .catch((error) => {
+      console.error(`Error loading more ${status} jobs:`, error);
+    });
 }
 
 function loadJobs(status) {
@@ -53,12 +131,7 @@ function loadJobs(status) {
         renderJobs(status, data.jobs);
         applyStaffFilters();
         updateCounters(status, data.filtered_count, data.total);
-        const loadMoreContainer = document.querySelector(
-          `#${status}-load-more-container`,
-        );
-        if (loadMoreContainer) {
-          loadMoreContainer.remove();
-        }
+        setColumnCursor(status, data.next_cursor);
       } else {
         console.error(`Error loading ${status} jobs:`, data.error);
         container.innerHTML = `
@@ -74,12 +147,7 @@ function loadJobs(status) {
 }
 
 function refreshAllColumns() {
-  const columns = document.querySelectorAll(".kanban-column");
-  const columnIds = Array.from(columns).map((col) => col.id);
-
-  columnIds.forEach((status) => {
-    loadJobs(status);
-  });
+  loadBoard(true);
 }
 
 function renderJobs(status, jobs) {
@@ -215,11 +283,13 @@ function initializeDragAndDropForColumn(container) {
     chosenClass: "sortable-drag",
     dragClass: "sortable-drag",
     onStart: function () {
+      isDragging = true;
       document.querySelectorAll(".kanban-column").forEach((col) => {
         col.classList.add("drop-target-potential");
       });
     },
     onEnd: function (evt) {
+      isDragging = false;
       const itemEl = evt.item;
       const oldCol = evt.from.closest(".kanban-column");
       const newCol = evt.to.closest(".kanban-column");
@@ -308,11 +378,13 @@ function initializeDragAndDrop() {
       chosenClass: "sortable-drag",
       dragClass: "sortable-drag",
       onStart: function () {
+        isDragging = true;
         document.querySelectorAll(".kanban-column").forEach((col) => {
           col.classList.add("drop-target-potential");
         });
       },
       onEnd: function (evt) {
+        isDragging = false;
         const itemEl = evt.item;
         const oldCol = evt.from.closest(".kanban-column");
         const newCol = evt.to.closest(".kanban-column");
@@ -376,7 +448,7 @@ function initializeDragAndDrop() {
               alert("Could not reorder job: " + (data.error || "Unknown error"));
               return;
             }
-            itemEl.dataset.priority = data.priority;
+            itemEl.dataset.rank = data.rank;
             loadJobs(oldStatus);
             if (newStatus !== oldStatus) loadJobs(newStatus);
           })
@@ -666,12 +738,7 @@ function assignStaffToJob(jobId, staffId) {
     .then(response => response.json())
     .then(data => {
       if (!data.success) throw new Error(data.error || "Failed to assign staff.");
-      const columns = document.querySelectorAll(".kanban-column");
-      const columnIds = Array.from(columns).map((col) => col.id);
-
-      columnIds.forEach((status) => {
-        loadJobs(status);
-      });
+      refreshAllColumns();
     })
     .catch(error => {
       console.error("Error assigning staff:", error);
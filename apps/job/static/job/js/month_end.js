@@ -67,6 +67,55 @@ document.addEventListener("DOMContentLoaded", function () {
     });
   }
 
+  // Follow a month-end run started from this page until it finishes
+  const progress = document.getElementById("monthEndProgress");
+  const POLL_INTERVAL_MS = 2000;
+
+  function showRunStatus(run) {
+    const percent = run.total_jobs
+      ? Math.round((run.processed_jobs / run.total_jobs) * 100)
+      : 100;
+    document.getElementById("monthEndProgressBar").style.width = `${percent}%`;
+    document.getElementById("monthEndProgressText").textContent =
+      `Processed ${run.processed_jobs} of ${run.total_jobs} jobs (${run.status})`;
+
+    const errorBox = document.getElementById("monthEndProgressError");
+    errorBox.textContent = run.error;
+    errorBox.classList.toggle("d-none", !run.error);
+  }
+
+  function pollRunStatus() {
+    fetch(progress.dataset.statusUrl)
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error(`Status request failed: ${response.status}`);
+        }
+        return response.json();
+      })
+      .then((run) => {
+        showRunStatus(run);
+        if (run.is_finished) {
+          // Reload for the jobs' new month-end dates
+          if (run.status === "completed") {
+            window.location.reload();
+          }
+          return;
+        }
+        setTimeout(pollRunStatus, POLL_INTERVAL_MS);
+      })
+      .catch((error) => {
+        console.error("Error fetching month-end progress:", error);
+        setTimeout(pollRunStatus, POLL_INTERVAL_MS * 5);
+      });
+  }
+
+  if (progress && progress.dataset.finished !== "true") {
+    if (processButton) {
+      processButton.disabled = true;
+    }
+    pollRunStatus();
+  }
+
   // Add row click handler to toggle checkboxes
   const tableRows = document.querySelectorAll("tbody tr");
   tableRows.forEach((row) => {
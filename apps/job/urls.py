@@ -30,6 +30,11 @@ urlpatterns = [
         edit_job_view_ajax.autosave_job_view,
         name="autosave_job_api",
     ),
+    path(
+        "api/job/<uuid:job_id>/pricing-entries/",
+        edit_job_view_ajax.patch_pricing_entries_view,
+        name="patch_pricing_entries_api",
+    ),
     path("api/create-job/", edit_job_view_ajax.create_job_api, name="create_job_api"),
     path(
         "api/fetch_job_pricing/",
@@ -86,6 +91,16 @@ urlpatterns = [
     path(
         "api/job-files/<path:file_path>", JobFileView.as_view(), name="serve-job-file"
     ),  # For GET/download
+    path(
+        "api/job/month-end/",
+        edit_job_view_ajax.process_month_end,
+        name="process_month_end_api",
+    ),
+    path(
+        "api/job/month-end/<uuid:run_id>/",
+        job_management_view.month_end_status_view,
+        name="month_end_status_api",
+    ),
     path(
         "api/company_defaults/",
         edit_job_view_ajax.get_company_defaults_api,
@@ -122,4 +137,9 @@ urlpatterns = [
         kanban_view.fetch_jobs,
         name="fetch_jobs",
     ),
+    path(
+        "kanban/fetch_board/",
+        kanban_view.fetch_board,
+        name="fetch_board",
+    ),
 ]
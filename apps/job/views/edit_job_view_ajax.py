@@ -1,5 +1,6 @@
 import json
 import logging
+from uuid import UUID
 
 from django.forms import ValidationError
 from django.http import JsonResponse
@@ -11,7 +12,13 @@ from django.db import transaction
 from apps.job.enums import JobPricingMethodology, JobPricingStage
 from apps.job.helpers import DecimalEncoder, get_company_defaults
 from apps.accounting.models import Quote, Invoice
-from apps.job.serializers import JobPricingSerializer, JobSerializer
+from apps.job.serializers import (
+    AdjustmentEntrySerializer,
+    JobPricingSerializer,
+    JobSerializer,
+    MaterialEntrySerializer,
+)
+from apps.timesheet.serializers import TimeEntryForJobPricingSerializer
 
 from apps.job.models import Job, JobEvent
 
@@ -20,7 +27,12 @@ from apps.job.services.job_service import (
     get_historical_job_pricings,
     get_job_with_pricings,
     get_latest_job_pricings,
-    archive_and_reset_job_pricing,
+)
+from apps.job.services.month_end_service import MonthEndService
+from apps.job.services.pricing_entry_service import (
+    UnknownEntryError,
+    delete_entries,
+    sync_entries,
 )
 
 logger = logging.getLogger(__name__)
@@ -382,8 +394,17 @@ def autosave_job_view(request):
             logger.error("Job ID missing in data")
             return JsonResponse({"error": "Job ID missing"}, status=400)
 
-        # Fetch the existing job along with all pricings
-        job = get_job_with_pricings(job_id)
+        # Entries are read per section while saving, so only the pricings
+        # themselves are loaded here
+        job = get_object_or_404(
+            Job.objects.select_related(
+                "client",
+                "latest_estimate_pricing",
+                "latest_quote_pricing",
+                "latest_reality_pricing",
+            ),
+            id=job_id,
+        )
         logger.info(f"Job found: {job}")
 
         # Step 3: Pass the job and incoming data to a dedicated serializer
@@ -399,7 +420,6 @@ def autosave_job_view(request):
             if DEBUG_JSON:
                 logger.debug(f"Validated data: {serializer.validated_data}")
             serializer.save(staff=request.user)
-            job.latest_estimate_pricing.display_entries()  # Just for debugging
 
             # Logging client name for better traceability
             client_name = job.client.name if job.client else "No Client"
@@ -423,7 +443,13 @@ def autosave_job_view(request):
                 },
             )
 
-            return JsonResponse({"success": True, "job_id": job.id})
+            return JsonResponse(
+                {
+                    "success": True,
+                    "job_id": job.id,
+                    "entry_ids": serializer.entry_ids,
+                }
+            )
         else:
             logger.error(f"Validation errors: {serializer.errors}")
             return JsonResponse(
@@ -439,15 +465,104 @@ def autosave_job_view(request):
         return JsonResponse({"error": "Unexpected error"}, status=500)
 
 
+ENTRY_SERIALIZERS = {
+    "time_entries": TimeEntryForJobPricingSerializer,
+    "material_entries": MaterialEntrySerializer,
+    "adjustment_entries": AdjustmentEntrySerializer,
+}
+
+
+@require_http_methods(["POST"])
+def patch_pricing_entries_view(request, job_id):
+    """
+    Save some rows of one grid without sending the whole job.
+
+    Expected JSON:
+        {
+            "pricing_stage": "estimate" | "quote" | "reality",
+            "section": "time_entries" | "material_entries" | "adjustment_entries",
+            "entries": [rows to create or update, with "id" if saved before],
+            "deleted_ids": [ids of entries to delete]
+        }
+
+    Returns the ids of the saved rows in the order they were sent. Entries
+    not mentioned are left as they are.
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    stage = data.get("pricing_stage")
+    section = data.get("section")
+    if stage not in JobPricingStage.values or section not in ENTRY_SERIALIZERS:
+        return JsonResponse(
+            {"success": False, "error": "Unknown pricing stage or section"},
+            status=400,
+        )
+    if stage == JobPricingStage.REALITY and section == "time_entries":
+        return JsonResponse(
+            {"success": False, "error": "Reality time is entered on timesheets"},
+            status=400,
+        )
+
+    deleted_ids = data.get("deleted_ids") or []
+    try:
+        if not isinstance(deleted_ids, list):
+            raise TypeError(deleted_ids)
+        deleted_ids = [UUID(str(entry_id)) for entry_id in deleted_ids]
+    except (TypeError, ValueError):
+        return JsonResponse(
+            {"success": False, "error": "deleted_ids must be a list of entry ids"},
+            status=400,
+        )
+
+    job = get_object_or_404(
+        Job.objects.select_related(f"latest_{stage}_pricing"), id=job_id
+    )
+    pricing = getattr(job, f"latest_{stage}_pricing")
+
+    serializer = ENTRY_SERIALIZERS[section](data=data.get("entries", []), many=True)
+    if not serializer.is_valid():
+        logger.error(f"Validation errors in {section}: {serializer.errors}")
+        return JsonResponse({"success": False, "errors": serializer.errors}, status=400)
+
+    try:
+        with transaction.atomic():
+            delete_entries(pricing, section, deleted_ids)
+            entries = sync_entries(
+                pricing, section, serializer.validated_data, partial=True
+            )
+    except UnknownEntryError as e:
+        logger.warning(str(e))
+        return JsonResponse(
+            {"success": False, "unknown_entry": True, "error": str(e)}, status=409
+        )
+
+    return JsonResponse(
+        {"success": True, "entry_ids": [str(entry.id) for entry in entries]}
+    )
+
+
 @require_http_methods(["POST"])
 def process_month_end(request):
-    """Handles month-end processing for selected jobs."""
+    """
+    Starts month-end processing for selected jobs in the background.
+    Poll month_end_status_api with the returned run_id for its progress.
+    """
     try:
         data = json.loads(request.body)
         job_ids = data.get("jobs", [])
-        for job_id in job_ids:
-            archive_and_reset_job_pricing(job_id)
-        return JsonResponse({"success": True})
+        run, is_new = MonthEndService.start_run(job_ids, staff=request.user)
+        return JsonResponse(
+            {
+                "success": is_new,
+                "run_id": str(run.id),
+                "status_url": reverse("jobs:month_end_status_api", args=[run.id]),
+                "error": None if is_new else "Month-end is already running",
+            },
+            status=202 if is_new else 409,
+        )
     except Exception as e:
         return JsonResponse({"success": False, "error": str(e)}, status=400)
 
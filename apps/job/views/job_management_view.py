@@ -3,12 +3,14 @@ from datetime import datetime
 from decimal import Decimal
 from django.db.models import Sum, F, Q
 from django.contrib import messages
-from django.shortcuts import render, redirect
-from django.http import HttpRequest, HttpResponse
+from django.core.exceptions import ValidationError
+from django.shortcuts import get_object_or_404, render, redirect
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.contrib.auth.decorators import login_required, user_passes_test
+from django.urls import reverse
 
-from apps.job.models import Job, JobPricing
-from apps.job.services.job_service import archive_and_reset_job_pricing
+from apps.job.models import Job, JobPricing, MonthEndRun
+from apps.job.services.month_end_service import MonthEndService
 
 logger = logging.getLogger(__name__)
 
@@ -64,43 +66,42 @@ def month_end_view(request: HttpRequest) -> HttpResponse:
         )
 
     if request.method == "POST":
-        # Process selected jobs
+        # Process selected jobs in the background and follow along on this page
         selected_job_ids = request.POST.getlist("job_ids")
-        processed_jobs = []
-        error_jobs = []
-
-        for job_id in selected_job_ids:
-            try:
-                job = Job.objects.get(id=job_id)
-                archive_and_reset_job_pricing(job_id)
-                processed_jobs.append(job)
-            except Job.DoesNotExist:
-                logger.error(f"Job with ID {job_id} not found")
-            except Exception as e:
-                error_jobs.append((job_id, str(e)))
-                logger.exception(f"Error processing job {job_id}: {str(e)}")
-                messages.error(request, f"Error processing job {job_id}: {str(e)}")
-
-        # Add success messages
-        if processed_jobs:
-            job_names = ", ".join([job.name for job in processed_jobs])
-            messages.success(
-                request,
-                f"Successfully processed {len(processed_jobs)} jobs: {job_names}",
+        run, is_new = MonthEndService.start_run(selected_job_ids, staff=request.user)
+        if is_new:
+            messages.info(
+                request, f"Month-end processing started for {run.total_jobs} jobs"
             )
-
-        if error_jobs:
-            error_msg = ", ".join([f"Job {job_id}" for job_id, _ in error_jobs])
+        else:
             messages.warning(
-                request, f"Errors occurred with {len(error_jobs)} jobs: {error_msg}"
+                request,
+                "Month-end processing is already running. "
+                "Wait for it to finish before starting another.",
             )
 
         # Redirect to same page to avoid form resubmission
-        return redirect("month_end")
+        return redirect(f"{reverse('jobs:month_end')}?run={run.id}")
 
     # For GET requests, render the selection form
+    month_end_run = None
+    run_id = request.GET.get("run")
+    if run_id:
+        try:
+            month_end_run = MonthEndRun.objects.filter(pk=run_id).first()
+        except ValidationError:
+            logger.warning(f"Invalid month-end run id {run_id}")
+
     context = {
         "job_data": job_data,
         "page_title": "Month-End Processing",
+        "month_end_run": month_end_run,
     }
     return render(request, "jobs/month_end.html", context)
+
+
+@user_passes_test(is_staff)
+def month_end_status_view(request: HttpRequest, run_id) -> JsonResponse:
+    """Progress of a month-end run, polled by the month-end page."""
+    run = get_object_or_404(MonthEndRun, pk=run_id)
+    return JsonResponse(run.get_progress())
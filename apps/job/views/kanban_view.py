@@ -1,25 +1,127 @@
+import base64
+import hashlib
 import logging
 import json
+from datetime import datetime
 from uuid import UUID
 
 from django.http import HttpRequest, HttpResponse, JsonResponse
-from django.db import transaction
-from django.db.models import Q, Max
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    FloatField,
+    Max,
+    OuterRef,
+    Q,
+    Value,
+    Window,
+)
+from django.db.models.functions import RowNumber
 from django.shortcuts import render
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
 
-from apps.job.models import Job
+from apps.job.models import Job, JobEvent, JobSearchDocument
+from apps.job.services import kanban_rank_service
+from apps.job.services.job_search_service import (
+    DEFAULT_PAGE_SIZE,
+    get_search_page,
+    search_jobs,
+)
 
 logger = logging.getLogger(__name__)
 
+# Jobs per column on the board; further pages are fetched with the column cursor
+KANBAN_PAGE_SIZE = 50
+MAX_KANBAN_PAGE_SIZE = 200
 
-def kanban_view(request: HttpRequest) -> HttpResponse:
-    active_jobs = Job.objects.filter(~Q(status="archived")).order_by(
-        "status", "-priority"
+# Column order, newest tie-breakers last so the cursor is unique
+KANBAN_ORDERING = ("rank", "-created_at", "-id")
+
+
+def _get_board_version() -> str:
+    """
+    Changes whenever a job is added, removed or saved. Anything that moves a
+    job on the board, or changes what its card shows (such as renaming its
+    client or assigned staff), must therefore touch its updated_at.
+    """
+    stamp = Job.objects.aggregate(count=Count("id"), latest=Max("updated_at"))
+    latest = stamp["latest"].isoformat() if stamp["latest"] else ""
+    return f"{stamp['count']}:{latest}"
+
+
+def _kanban_etag(request: HttpRequest, *args, **kwargs) -> str:
+    # The same board version renders differently per column, page and search
+    key = f"{_get_board_version()}|{request.get_full_path()}"
+    if request.GET.get("search"):
+        # Renaming a contact changes which jobs match without touching them
+        latest = JobSearchDocument.objects.aggregate(latest=Max("updated_at"))
+        key += f"|{latest['latest']}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def _encode_cursor(job: Job) -> str:
+    position = [job.rank, job.created_at.isoformat(), str(job.id)]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def _after_cursor(jobs, cursor: str):
+    """Restrict jobs (in KANBAN_ORDERING) to those after the cursor's job."""
+    try:
+        rank, created_at, job_id = json.loads(base64.urlsafe_b64decode(cursor))
+        rank = str(rank)
+        created_at = datetime.fromisoformat(created_at)
+        job_id = UUID(job_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    return jobs.filter(
+        Q(rank__gt=rank)
+        | Q(rank=rank, created_at__lt=created_at)
+        | Q(rank=rank, created_at=created_at, id__lt=job_id)
     )
 
-    archived_jobs = Job.objects.filter(status="archived").order_by("-created_at")[:50]
 
+def _get_page_size(request: HttpRequest, default: int) -> int:
+    try:
+        page_size = int(request.GET.get("limit", default))
+    except ValueError:
+        return default
+    return max(1, min(page_size, MAX_KANBAN_PAGE_SIZE))
+
+
+def _get_kanban_jobs():
+    # Cards only need created_by_id, so created_by itself isn't joined
+    return Job.objects.select_related("client").prefetch_related("people")
+
+
+def _serialise_kanban_job(request: HttpRequest, job: Job) -> dict:
+    return {
+        "id": job.id,
+        "name": job.name,
+        "description": job.description,
+        "job_number": job.job_number,
+        "client_name": job.client.name if job.client else "",
+        "contact_person": job.contact_person,
+        "people": [
+            {
+                "id": staff.id,
+                "display_name": staff.get_display_full_name(),
+                "icon": (
+                    request.build_absolute_uri(staff.icon.url) if staff.icon else None
+                ),
+            }
+            for staff in job.people.all()
+        ],
+        "status": job.get_status_display(),
+        "paid": job.paid,
+        "created_by_id": job.created_by_id,
+    }
+
+
+def kanban_view(request: HttpRequest) -> HttpResponse:
     active_status_choices = [
         (key, label) for key, label in Job.JOB_STATUS_CHOICES if key != "archived"
     ]
@@ -29,8 +131,6 @@ def kanban_view(request: HttpRequest) -> HttpResponse:
         if key != "archived"
     }
     context = {
-        "jobs": active_jobs,
-        "latest_archived_jobs": archived_jobs,
         "status_choices": active_status_choices,
         "status_tooltips": active_status_tooltips,
     }
@@ -59,97 +159,52 @@ def update_job_status(request: HttpRequest, job_id: UUID) -> HttpResponse:
     return JsonResponse({"success": False, "error": "Invalid request method"})
 
 
-def _get_adjacent_priorities(
+def _get_adjacent_ranks(
     before_id: str, after_id: str
-) -> tuple[int | None, int | None]:
+) -> tuple[str | None, str | None]:
     """
-    Return (before_priority, after_priority), fetching from DB if IDs are provided.
+    Return (before_rank, after_rank), fetching from DB if IDs are provided.
     If an ID is invalid or the job does not exist, raises Job.DoesNotExist.
     """
-    before_prio = None
-    after_prio = None
+    before_rank = None
+    after_rank = None
 
     if before_id:
-        before_prio = Job.objects.get(pk=before_id).priority
+        before_rank = Job.objects.values_list("rank", flat=True).get(pk=before_id)
     if after_id:
-        after_prio = Job.objects.get(pk=after_id).priority
-
-    return before_prio, after_prio
-
-
-def _rebalance_column(status: str) -> None:
-    """
-    Renumber all jobs in the given status so that priorities become:
-    1 * INCREMENT, 2 * INCREMENT, 3 * INCREMENT, … in ascending order.
-    """
-    increment = Job.PRIORITY_INCREMENT
-    jobs = list(Job.objects.filter(status=status).order_by("priority"))
+        after_rank = Job.objects.values_list("rank", flat=True).get(pk=after_id)
 
-    with transaction.atomic():
-        for index, job in enumerate(jobs, start=1):
-            job.priority = index * increment
-            job.save(update_fields=["priority"])
+    return before_rank, after_rank
 
 
-def _calculate_priority(
-    before_prio: float | None, after_prio: float | None, status: str
-) -> float:
+def _calculate_rank(before_id: str, after_id: str, status: str) -> str:
     """
-    Determine the new priority given before_prio and after_prio.
+    Determine the new rank from the cards the job was dropped between.
     Cases:
-      - (None, None): empty column or invalid payload → push to end
+      - (None, None): empty column or invalid payload → push to top
       - (None, after): top insertion
       - (before, None): bottom insertion
-      - (before, after): internal insertion (average or rebalance if gap ≤ 1)
+      - (before, after): internal insertion
+    Only the moved job is written. Neighbours sharing a rank (two cards once
+    dropped into the same gap at the same moment) get their own ranks by
+    compacting the column first.
+
+    Raises:
+        Job.DoesNotExist: If a neighbour doesn't exist
+        RankError: If the neighbours are no longer next to each other
     """
-    increment = Job.PRIORITY_INCREMENT
-
-    match (before_prio, after_prio):
-        case (None, None):
-            # No adjacent jobs; place at end
-            max_prio = (
-                Job.objects.filter(status=status).aggregate(Max("priority"))[
-                    "priority__max"
-                ]
-                or 0.0
-            )
-            return max_prio + increment
-
-        case (None, after) if after is not None:
-            # Insert at top: place just above the ‘after’ job
-            new_prio = after + increment
-            return new_prio
-
-        case (before, None) if before is not None:
-            # Insert at bottom: place just below the ‘before’ job
-            new_prio = before - increment
-            if new_prio <= 0:
-                _rebalance_column(status)
-                # Re-fetch before_prio after rebalance
-                before = Job.objects.get(priority=before, status=status).priority
-                return before - increment
-            return new_prio
-
-        case (before, after) if before is not None and after is not None:
-            # Internal insertion: try to take the average
-            gap = before - after
-            if gap > 1:
-                return (before + after) / 2
-            # Gap too small → rebalance first, then recompute
-            _rebalance_column(status)
-            before = Job.objects.get(priority=before, status=status).priority
-            after = Job.objects.get(priority=after, status=status).priority
-            return (before + after) / 2
-
-        case _:
-            # Fallback: push to end if anything unexpected happens
-            max_prio = (
-                Job.objects.filter(status=status).aggregate(Max("priority"))[
-                    "priority__max"
-                ]
-                or 0
-            )
-            return max_prio + increment
+    before_rank, after_rank = _get_adjacent_ranks(before_id, after_id)
+    if before_rank is None and after_rank is None:
+        return kanban_rank_service.get_rank_at_top(status)
+
+    try:
+        return kanban_rank_service.rank_between(before_rank, after_rank)
+    except kanban_rank_service.RankError:
+        if before_rank != after_rank:
+            raise
+        kanban_rank_service.compact_column(status)
+        before_rank, after_rank = _get_adjacent_ranks(before_id, after_id)
+        return kanban_rank_service.rank_between(before_rank, after_rank)
 
 
 @csrf_exempt
@@ -171,97 +226,145 @@ def reorder_job(request: HttpRequest, job_id: UUID) -> HttpResponse:
     after_id = payload.get("after_id")
     new_status = payload.get("status")
 
-    try:
-        before_prio, after_prio = _get_adjacent_priorities(before_id, after_id)
-    except Job.DoesNotExist:
-        return JsonResponse({"success": False, "error": "Adjacent job not found"})
-
-    # Determine and assign new priority (handles all edge cases internally)
-    new_priority = _calculate_priority(before_prio, after_prio, job.status)
-    job.priority = new_priority
-
     old_status = job.status
 
     if new_status and new_status != job.status:
         job.status = new_status
 
-    update_fields = ["priority"]
+    try:
+        job.rank = _calculate_rank(before_id, after_id, job.status)
+    except Job.DoesNotExist:
+        return JsonResponse({"success": False, "error": "Adjacent job not found"})
+    except kanban_rank_service.RankError:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "The board has changed since it was loaded, please retry",
+            }
+        )
+
+    update_fields = ["rank", "updated_at"]
     if new_status and new_status != old_status:
         update_fields.insert(0, "status")
 
     job.save(update_fields=update_fields)
-    return JsonResponse({"success": True, "message": "Job reordered successfully."})
+    return JsonResponse(
+        {"success": True, "message": "Job reordered successfully.", "rank": job.rank}
+    )
 
 
+@cache_control(no_cache=True)
+@condition(etag_func=_kanban_etag)
 def fetch_jobs(request: HttpRequest, status: str) -> JsonResponse:
+    """
+    One column of the board. Pass the previous response's next_cursor as
+    ?cursor= to get the page after it.
+    """
     try:
         search_term = request.GET.get("search", "").strip()
-        search_terms = search_term.split() if search_term else []
-
-        jobs_query = Job.objects.filter(status=status)
-        if search_terms:
-            query = Q()
-            for term in search_terms:
-                # Each term should correspond to at least one field
-                term_query = (
-                    Q(name__icontains=term)
-                    | Q(description__icontains=term)
-                    | Q(client__name__icontains=term)
-                    | Q(contact_person__icontains=term)
-                    | Q(created_by__username__icontains=term)
-                )
-                query &= term_query
-            jobs_query = jobs_query.filter(query)
+        cursor = request.GET.get("cursor")
 
-        jobs = jobs_query.order_by("-priority", "-created_at")
+        jobs = _get_kanban_jobs().filter(status=status)
+        if search_term:
+            # Columns keep board order rather than relevance order
+            jobs = search_jobs(search_term, jobs)
 
         total_jobs = Job.objects.filter(status=status).count()
 
+        jobs = jobs.order_by(*KANBAN_ORDERING)
+        if cursor:
+            jobs = _after_cursor(jobs, cursor)
+
         match status:
             case "archived":
-                jobs = jobs[:100]
+                page_size = _get_page_size(request, 100)
             case _:
-                jobs = jobs[:200]
+                page_size = _get_page_size(request, MAX_KANBAN_PAGE_SIZE)
 
-        total_filtered = jobs.count()
+        # One extra row tells us whether there is another page
+        jobs = list(jobs[: page_size + 1])
+        next_cursor = None
+        if len(jobs) > page_size:
+            jobs = jobs[:page_size]
+            next_cursor = _encode_cursor(jobs[-1])
 
-        logger.info(f"Found {total_jobs} jobs, returning {total_filtered} jobs")
-        job_data = [
+        logger.info(f"Found {total_jobs} jobs, returning {len(jobs)} jobs")
+        return JsonResponse(
             {
-                "id": job.id,
-                "name": job.name,
-                "description": job.description,
-                "job_number": job.job_number,
-                "client_name": job.client.name if job.client else "",
-                "contact_person": job.contact_person,
-                "people": [
-                    {
-                        "id": staff.id,
-                        "display_name": staff.get_display_full_name(),
-                        "icon": (
-                            request.build_absolute_uri(staff.icon.url)
-                            if staff.icon
-                            else None
-                        ),
-                    }
-                    for staff in job.people.all()
-                ],
-                "status": job.get_status_display(),
-                "paid": job.paid,
-                "created_by_id": job.created_by.id if job.created_by else None,
+                "success": True,
+                "jobs": [_serialise_kanban_job(request, job) for job in jobs],
+                "total": total_jobs,
+                "filtered_count": len(jobs),
+                "next_cursor": next_cursor,
             }
-            for job in jobs
+        )
+    except Exception as e:
+        return JsonResponse({"success": False, "error": str(e)})
+
+
+@cache_control(no_cache=True)
+@condition(etag_func=_kanban_etag)
+def fetch_board(request: HttpRequest) -> JsonResponse:
+    """
+    First page of every active column, with each column's job count and the
+    cursor for its next page (see fetch_jobs).
+
+    Screens polling the board send If-None-Match and get a 304 until a job
+    changes.
+    """
+    try:
+        page_size = _get_page_size(request, KANBAN_PAGE_SIZE)
+        active_statuses = [
+            key for key, _ in Job.JOB_STATUS_CHOICES if key != "archived"
         ]
 
+        counts = dict(
+            Job.objects.filter(status__in=active_statuses)
+            .order_by()
+            .values_list("status")
+            .annotate(count=Count("id"))
+        )
+
+        # Top page_size + 1 jobs of each column in one query
+        jobs = (
+            _get_kanban_jobs()
+            .filter(status__in=active_statuses)
+            .annotate(
+                column_position=Window(
+                    RowNumber(),
+                    partition_by=[F("status")],
+                    order_by=[
+                        F("rank").asc(),
+                        F("created_at").desc(),
+                        F("id").desc(),
+                    ],
+                )
+            )
+            .filter(column_position__lte=page_size + 1)
+            .order_by("status", *KANBAN_ORDERING)
+        )
+
+        columns = {
+            status: {"jobs": [], "total": counts.get(status, 0), "next_cursor": None}
+            for status in active_statuses
+        }
+        previous_job = None
+        for job in jobs:
+            column = columns[job.status]
+            if job.column_position > page_size:
+                column["next_cursor"] = _encode_cursor(previous_job)
+                continue
+            column["jobs"].append(_serialise_kanban_job(request, job))
+            previous_job = job
+
         return JsonResponse(
             {
                 "success": True,
-                "jobs": job_data,
-                "total": total_jobs,
-                "filtered_count": total_filtered,
+                "columns": columns,
             }
         )
     except Exception as e:
+        logger.error(f"Error fetching kanban board: {e}")
         return JsonResponse({"success": False, "error": str(e)})
 
 
@@ -299,11 +402,28 @@ def advanced_search(request: HttpRequest) -> JsonResponse:
         statuses = request.GET.getlist("status")
         paid = request.GET.get("paid")
 
-        jobs_query = Job.objects.all()
+        page_number = request.GET.get("page", 1)
+        page_size = request.GET.get("page_size", DEFAULT_PAGE_SIZE)
+
+        jobs_query = Job.objects.select_related(
+            "client", "created_by"
+        ).prefetch_related("people")
 
         if number:
             jobs_query = jobs_query.filter(job_number=number)
 
+        # The text fields are matched together against the search index, then
+        # each is checked against its own column
+        search_text = " ".join(
+            term for term in (name, description, client_name, contact_person) if term
+        )
+        if search_text:
+            jobs_query = search_jobs(search_text, jobs_query)
+        else:
+            jobs_query = jobs_query.annotate(
+                search_rank=Value(0.0, output_field=FloatField())
+            )
+
         if name:
             jobs_query = jobs_query.filter(name__icontains=name)
 
@@ -317,7 +437,12 @@ def advanced_search(request: HttpRequest) -> JsonResponse:
             jobs_query = jobs_query.filter(contact_person__icontains=contact_person)
 
         if created_by:
-            jobs_query = jobs_query.filter(events__staff=created_by)
+            # Exists rather than a join, which returned a job once per event
+            jobs_query = jobs_query.filter(
+                Exists(
+                    JobEvent.objects.filter(job=OuterRef("pk"), staff_id=created_by)
+                )
+            )
 
         if created_after:
             jobs_query = jobs_query.filter(created_at__gte=created_after)
@@ -334,7 +459,7 @@ def advanced_search(request: HttpRequest) -> JsonResponse:
             case "false":
                 jobs_query = jobs_query.filter(paid=False)
 
-        jobs = jobs_query.order_by("-created_at")
+        jobs, paginator = get_search_page(jobs_query, page_number, page_size)
 
         job_data = [
             {
@@ -342,7 +467,8 @@ def advanced_search(request: HttpRequest) -> JsonResponse:
                 "name": job.name,
                 "description": job.description,
                 "job_number": job.job_number,
-                "client_name": job.client.name if job.client else "",                "people": [
+                "client_name": job.client.name if job.client else "",
+                "people": [
                     {
                         "id": staff.id,
                         "display_name": staff.get_display_name(),
@@ -370,7 +496,9 @@ def advanced_search(request: HttpRequest) -> JsonResponse:
             {
                 "success": True,
                 "jobs": job_data,
-                "total": len(job_data),
+                "total": paginator.count,
+                "page": jobs.number,
+                "has_next": jobs.has_next(),
             }
         )
     except Exception as e:
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("purchasing", "0007_stock_unique_xero_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="purchaseorder",
+            name="raw_json_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="stock",
+            name="raw_json_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="Digest of raw_json, used to skip unchanged items when syncing",
+                max_length=32,
+                null=True,
+            ),
+        ),
+    ]
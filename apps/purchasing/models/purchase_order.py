@@ -57,6 +57,8 @@ class PurchaseOrder(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     xero_last_modified = models.DateTimeField(null=True, blank=True)
     xero_last_synced = models.DateTimeField(null=True, blank=True, default=timezone.now)
+    # Digest of the serialised Xero payload, so syncs can skip unchanged POs
+    raw_json_hash = models.CharField(max_length=32, null=True, blank=True)
     online_url = models.URLField(max_length=500, null=True, blank=True)
 
     def generate_po_number(self):
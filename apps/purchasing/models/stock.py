@@ -125,6 +125,12 @@ class Stock(models.Model):
     raw_json = models.JSONField(
         null=True, blank=True, help_text="Raw JSON data from Xero for this item"
     )
+    raw_json_hash = models.CharField(
+        max_length=32,
+        null=True,
+        blank=True,
+        help_text="Digest of raw_json, used to skip unchanged items when syncing",
+    )
 
     class Meta:
         db_table = "workflow_stock"
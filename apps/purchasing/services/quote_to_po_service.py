@@ -9,7 +9,6 @@ import mimetypes
 import pdfplumber
 import re
 from decimal import Decimal, InvalidOperation
-from rapidfuzz import process, fuzz
 
 from google import genai
 
@@ -21,7 +20,7 @@ from apps.purchasing.models import (
     PurchaseOrderLine,
     PurchaseOrderSupplierQuote,
 )
-from apps.client.models import Client
+from apps.purchasing.services.supplier_matching_service import match_supplier
 from apps.workflow.helpers import get_company_defaults
 from apps.job.enums import MetalType
 from apps.workflow.models import AIProvider
@@ -33,15 +32,6 @@ logger = logging.getLogger(__name__)
 USE_PDF_PARSER = False
 
 
-def normalize(s):
-    """Normalize a string for comparison."""
-    if not s:
-        return ""
-    return " ".join(
-        s.lower().split()
-    )  # lower, remove extra whitespace, preserve everything else
-
-
 def fuzzy_find_supplier(supplier_name):
     """
     Find a supplier in the database using fuzzy matching.
@@ -52,45 +42,8 @@ def fuzzy_find_supplier(supplier_name):
     Returns:
         tuple: (matched_supplier, original_name) - The matched supplier object and the original name
     """
-    if not supplier_name:
-        return None, supplier_name
-
-    # Get all suppliers
-    suppliers = Client.objects.all()
-
-    # Extract supplier names and create a mapping from name to supplier object
-    supplier_names = [s.name for s in suppliers]
-    supplier_map = {s.name: s for s in suppliers}
-
-    # Build a map from normalized -> original so we can return the true supplier name
-    norm_map = {normalize(name): name for name in supplier_names}
-    norm_names = list(norm_map.keys())
-
-    # Normalize the input supplier name
-    norm_supplier = normalize(supplier_name)
-
-    # Find the best match
-    if not norm_names:
-        # No suppliers in database
-        logger.warning(f"No suppliers in database to match against: {supplier_name}")
-        return None, supplier_name
-
-    match, score, _ = process.extractOne(
-        norm_supplier, norm_names, scorer=fuzz.token_set_ratio
-    )
-
-    # Use a threshold to ensure the match is good enough
-    if score < 85:
-        # Score too low
-        logger.warning(f"No supplier match found for: {supplier_name}")
-        return None, supplier_name
-
-    original_name = norm_map[match]
-    matched_supplier = supplier_map[original_name]
-    logger.info(
-        f"Found fuzzy supplier match: '{supplier_name}' -> '{original_name}' (score: {score})"
-    )
-    return matched_supplier, supplier_name
+    match = match_supplier(supplier_name)
+    return (match.supplier if match else None), supplier_name
 
 
 def save_quote_file(purchase_order, file_obj):
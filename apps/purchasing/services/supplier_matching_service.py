@@ -0,0 +1,184 @@
+"""
+Matching supplier names read from quotes and price lists to clients.
+
+Normalised client names are indexed once per process and kept until the
+clients change, rather than read and normalised on every upload. Each name
+is only scored against the clients sharing a trigram with it (blocking),
+since a client with no trigram in common can't reach the match threshold.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import Count, Max
+from rapidfuzz import fuzz, process
+
+from apps.client.models import Client
+
+logger = logging.getLogger(__name__)
+
+# Lowest token_set_ratio counted as a match
+MATCH_THRESHOLD = 85
+GRAM_SIZE = 3
+
+
+def normalize(s):
+    """Normalize a string for comparison."""
+    if not s:
+        return ""
+    return " ".join(
+        s.lower().split()
+    )  # lower, remove extra whitespace, preserve everything else
+
+
+def _get_grams(norm_name: str) -> set:
+    """
+    The trigrams of each word of a normalised name, padded with a space each
+    side so that words sharing a start or end share a trigram however short.
+    """
+    grams = set()
+    for token in norm_name.split():
+        padded = f" {token} "
+        grams.update(
+            padded[i : i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)
+        )
+    return grams
+
+
+@dataclass(frozen=True)
+class SupplierMatch:
+    supplier: Client
+    # The client's name as indexed, and how well it matched (0-100)
+    matched_name: str
+    score: float
+
+
+class SupplierIndex:
+    """The normalised names of all clients, bucketed by trigram."""
+
+    def __init__(self, clients: Iterable[Tuple[str, str]]):
+        # Clients whose names normalise the same are matched as the last one
+        client_ids = {normalize(name): client_id for client_id, name in clients}
+        self.names = list(client_ids)
+        self.client_ids = [client_ids[name] for name in self.names]
+        self.buckets: Dict[str, List[int]] = {}
+        for position, name in enumerate(self.names):
+            for gram in _get_grams(name):
+                self.buckets.setdefault(gram, []).append(position)
+
+    def __len__(self):
+        return len(self.names)
+
+    def get_candidates(self, norm_name: str) -> Dict[int, str]:
+        """The indexed names sharing a trigram with norm_name, by position."""
+        positions = set()
+        for gram in _get_grams(norm_name):
+            positions.update(self.buckets.get(gram, ()))
+        return {position: self.names[position] for position in sorted(positions)}
+
+    def find(
+        self, norm_name: str, threshold: float = MATCH_THRESHOLD
+    ) -> Optional[Tuple[str, str, float]]:
+        """The best (client_id, name, score) at or above threshold, if any."""
+        if not norm_name:
+            return None
+        result = process.extractOne(
+            norm_name,
+            self.get_candidates(norm_name),
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=threshold,
+        )
+        if result is None:
+            return None
+        name, score, position = result
+        return self.client_ids[position], name, score
+
+
+_index: Optional[SupplierIndex] = None
+_index_stamp = None
+_index_lock = threading.Lock()
+
+
+def _get_clients_stamp():
+    # Saving a client touches django_updated_at; deleting one changes the count
+    return tuple(
+        Client.objects.aggregate(
+            count=Count("id"), latest=Max("django_updated_at")
+        ).values()
+    )
+
+
+def get_supplier_index() -> SupplierIndex:
+    """
+    The index of this process, rebuilt first if clients have been added,
+    saved or deleted since it was built (by any process).
+    """
+    global _index, _index_stamp
+
+    stamp = _get_clients_stamp()
+    with _index_lock:
+        if _index is None or stamp != _index_stamp:
+            _index = SupplierIndex(Client.objects.values_list("id", "name"))
+            _index_stamp = stamp
+            logger.debug(f"Built supplier index of {len(_index)} names")
+        return _index
+
+
+def clear_supplier_index() -> None:
+    global _index, _index_stamp
+
+    with _index_lock:
+        _index = None
+        _index_stamp = None
+
+
+def match_suppliers(
+    supplier_names: Iterable[str], threshold: float = MATCH_THRESHOLD
+) -> Dict[str, Optional[SupplierMatch]]:
+    """
+    Match many supplier names at once against one index, loading the
+    matched clients in a single query.
+
+    Returns:
+        Each name given, mapped to its SupplierMatch or None
+    """
+    supplier_names = list(dict.fromkeys(supplier_names))
+    index = get_supplier_index()
+    if not len(index):
+        logger.warning("No suppliers in database to match against")
+        return {name: None for name in supplier_names}
+
+    found = {}
+    for supplier_name in supplier_names:
+        if supplier_name:
+            found[supplier_name] = index.find(normalize(supplier_name), threshold)
+
+    suppliers = Client.objects.in_bulk(
+        [result[0] for result in found.values() if result]
+    )
+    matches = {}
+    for supplier_name in supplier_names:
+        result = found.get(supplier_name)
+        supplier = suppliers.get(result[0]) if result else None
+        if supplier is None:
+            logger.warning(f"No supplier match found for: {supplier_name}")
+            matches[supplier_name] = None
+            continue
+        _, matched_name, score = result
+        logger.info(
+            f"Found fuzzy supplier match: '{supplier_name}' -> '{supplier.name}' "
+            f"(score: {score})"
+        )
+        matches[supplier_name] = SupplierMatch(supplier, matched_name, score)
+    return matches
+
+
+def match_supplier(
+    supplier_name: str, threshold: float = MATCH_THRESHOLD
+) -> Optional[SupplierMatch]:
+    """Match one supplier name, see match_suppliers."""
+    if not supplier_name:
+        return None
+    return match_suppliers([supplier_name], threshold)[supplier_name]
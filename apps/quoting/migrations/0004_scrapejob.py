@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:21
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client", "0005_client_archive_run"),
+        ("quoting", "0003_alter_supplierpricelist_supplier_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScrapeJob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="running",
+                        max_length=20,
+                    ),
+                ),
+                ("started_at", models.DateTimeField()),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "products_scraped",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Product pages scraped"
+                    ),
+                ),
+                (
+                    "products_failed",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Product pages that couldn't be scraped"
+                    ),
+                ),
+                (
+                    "products_inserted",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Variants not seen before"
+                    ),
+                ),
+                (
+                    "products_updated",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Variants whose details had changed"
+                    ),
+                ),
+                ("products_unchanged", models.PositiveIntegerField(default=0)),
+                ("error_message", models.TextField(blank=True, null=True)),
+                (
+                    "supplier",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scrape_jobs",
+                        to="client.client",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-started_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quoting", "0004_scrapejob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapejob",
+            name="products_skipped",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Variants that couldn't be saved"
+            ),
+        ),
+    ]
@@ -73,3 +73,54 @@ class SupplierPriceList(models.Model):
 
     def __str__(self):
         return f"{self.supplier.name} - {self.file_name} ({self.uploaded_at.strftime('%Y-%m-%d %H:%M')})"
+
+
+class ScrapeJobStatus(models.TextChoices):
+    """
+    Progress of a supplier website scrape
+    """
+
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+
+class ScrapeJob(models.Model):
+    """
+    A run of a supplier's scraper, with what it found and what it wrote.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    supplier = models.ForeignKey(
+        Client, on_delete=models.CASCADE, related_name="scrape_jobs"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=ScrapeJobStatus.choices,
+        default=ScrapeJobStatus.RUNNING,
+    )
+    started_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+    products_scraped = models.PositiveIntegerField(
+        default=0, help_text="Product pages scraped"
+    )
+    products_failed = models.PositiveIntegerField(
+        default=0, help_text="Product pages that couldn't be scraped"
+    )
+    products_inserted = models.PositiveIntegerField(
+        default=0, help_text="Variants not seen before"
+    )
+    products_updated = models.PositiveIntegerField(
+        default=0, help_text="Variants whose details had changed"
+    )
+    products_unchanged = models.PositiveIntegerField(default=0)
+    products_skipped = models.PositiveIntegerField(
+        default=0, help_text="Variants that couldn't be saved"
+    )
+    error_message = models.TextField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-started_at"]
+
+    def __str__(self):
+        return f"{self.supplier.name} scrape {self.started_at:%Y-%m-%d %H:%M} ({self.status})"
@@ -6,6 +6,17 @@ from django.utils import timezone
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
+from apps.quoting.models import (
+    ScrapeJob,
+    ScrapeJobStatus,
+    SupplierPriceList,
+    SupplierProduct,
+)
+from apps.quoting.services.scraped_product_service import (
+    SaveCounts,
+    save_scraped_products,
+)
+
 
 class BaseScraper(ABC):
     """Base class for all supplier scrapers"""
@@ -15,6 +26,9 @@ class BaseScraper(ABC):
         self.limit = limit
         self.force = force
         self.driver = None
+        self.job = None
+        self.price_list = None
+        self.save_counts = SaveCounts()
         self.logger = logging.getLogger(
             f'scraper.{supplier.name.lower().replace(" ", "_")}'
         )
@@ -62,11 +76,11 @@ class BaseScraper(ABC):
 
     def run(self):
         """Main scraper execution"""
-        from quoting.models import ScrapeJob, Product
-
         # Create scrape job
-        job = ScrapeJob.objects.create(
-            supplier=self.supplier, status="running", started_at=timezone.now()
+        job = self.job = ScrapeJob.objects.create(
+            supplier=self.supplier,
+            status=ScrapeJobStatus.RUNNING,
+            started_at=timezone.now(),
         )
 
         try:
@@ -80,7 +94,7 @@ class BaseScraper(ABC):
             product_urls = self.get_product_urls()
 
             if not product_urls:
-                job.status = "failed"
+                job.status = ScrapeJobStatus.FAILED
                 job.error_message = "No product URLs found"
                 job.completed_at = timezone.now()
                 job.save()
@@ -89,9 +103,9 @@ class BaseScraper(ABC):
             # Filter existing URLs if not forcing
             if not self.force:
                 existing_urls = set(
-                    Product.objects.filter(supplier=self.supplier).values_list(
-                        "url", flat=True
-                    )
+                    SupplierProduct.objects.filter(
+                        supplier=self.supplier
+                    ).values_list("url", flat=True)
                 )
                 product_urls = [url for url in product_urls if url not in existing_urls]
 
@@ -132,18 +146,26 @@ class BaseScraper(ABC):
                 self.save_products(batch_data)
 
             # Update job status
-            job.status = "completed"
+            job.status = ScrapeJobStatus.COMPLETED
             job.products_scraped = successful
             job.products_failed = failed
             job.completed_at = timezone.now()
+            self.record_save_counts()
             job.save()
 
-            self.logger.info(f"Completed: {successful} successful, {failed} failed")
+            self.logger.info(
+                f"Completed: {successful} successful, {failed} failed; "
+                f"{self.save_counts.inserted} variants inserted, "
+                f"{self.save_counts.updated} updated, "
+                f"{self.save_counts.unchanged} unchanged, "
+                f"{self.save_counts.skipped} skipped"
+            )
 
         except Exception as e:
-            job.status = "failed"
+            job.status = ScrapeJobStatus.FAILED
             job.error_message = str(e)
             job.completed_at = timezone.now()
+            self.record_save_counts()
             job.save()
             self.logger.error(f"Scraper failed: {e}")
             raise
@@ -151,24 +173,37 @@ class BaseScraper(ABC):
             self.cleanup()
 
     def save_products(self, products_data):
-        """Save products to database"""
-        from quoting.models import Product
-
-        for product_data in products_data:
-            try:
-                product_data["supplier"] = self.supplier
-                product, created = Product.objects.get_or_create(
-                    supplier=self.supplier,
-                    variant_id=product_data["variant_id"],
-                    url=product_data["url"],
-                    defaults=product_data,
-                )
+        """Save a batch of scraped variants to database"""
+        if self.price_list is None:
+            # New variants are filed under a price list for this scrape
+            self.price_list = SupplierPriceList.objects.create(
+                supplier=self.supplier,
+                file_name=f"Web scrape {timezone.now():%Y-%m-%d %H:%M}",
+            )
 
-                if not created:
-                    # Update existing
-                    for key, value in product_data.items():
-                        setattr(product, key, value)
-                    product.save()
+        try:
+            counts = save_scraped_products(
+                self.supplier, self.price_list, products_data
+            )
+        except Exception as e:
+            self.logger.error(f"Error saving {len(products_data)} products: {e}")
+            counts = SaveCounts(skipped=len(products_data))
+
+        self.save_counts += counts
+        self.record_save_counts()
+        if self.job:
+            # Keep the job's counts current while the scrape goes on
+            ScrapeJob.objects.filter(pk=self.job.pk).update(
+                products_inserted=self.job.products_inserted,
+                products_updated=self.job.products_updated,
+                products_unchanged=self.job.products_unchanged,
+                products_skipped=self.job.products_skipped,
+            )
 
-            except Exception as e:
-                self.logger.error(f"Error saving product: {e}")
+    def record_save_counts(self):
+        """Copy the variant counts saved so far onto the scrape job"""
+        if self.job:
+            self.job.products_inserted = self.save_counts.inserted
+            self.job.products_updated = self.save_counts.updated
+            self.job.products_unchanged = self.save_counts.unchanged
+            self.job.products_skipped = self.save_counts.skipped
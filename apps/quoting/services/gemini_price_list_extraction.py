@@ -10,6 +10,7 @@ import google.generativeai as genai
 
 from django.conf import settings
 
+from apps.purchasing.services.supplier_matching_service import match_supplier
 from apps.workflow.helpers import get_company_defaults
 from apps.job.enums import MetalType
 from apps.workflow.enums import AIProviderTypes
@@ -214,8 +215,19 @@ def extract_data_from_supplier_price_list_gemini(
 
         price_list_data = json.loads(clean_json_response(json_text))
 
-        # No supplier matching needed here, as this is for price lists, not specific quotes.
-        # The supplier name will be extracted directly from the JSON.
+        # Match the supplier as quotes are, so the list can be filed against it
+        price_list_data["matched_supplier"] = None
+        try:
+            match = match_supplier(price_list_data["supplier"]["name"])
+        except (KeyError, TypeError):
+            logger.warning("Supplier name not found in price list JSON")
+            match = None
+        if match:
+            price_list_data["matched_supplier"] = {
+                "id": str(match.supplier.id),
+                "name": match.supplier.name,
+                "xero_id": match.supplier.xero_contact_id,
+            }
 
         return price_list_data, None
 
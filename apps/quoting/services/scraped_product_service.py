@@ -0,0 +1,171 @@
+"""
+Saving the products scraped from supplier websites.
+
+A full scrape returns thousands of variants, so they are written a batch at
+a time: the batch's existing rows are read in one query, then the new
+variants are inserted with one bulk_create and the changed ones written
+with one bulk_update of just the fields that changed. Variants scraped again
+with nothing changed aren't written at all.
+"""
+
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.quoting.models import SupplierProduct
+
+logger = logging.getLogger(__name__)
+
+# The fields a scrape fills in, compared to decide whether a variant changed
+SCRAPED_FIELDS = (
+    "product_name",
+    "item_no",
+    "description",
+    "specifications",
+    "variant_id",
+    "variant_width",
+    "variant_length",
+    "variant_price",
+    "price_unit",
+    "variant_available_stock",
+    "url",
+)
+
+
+@dataclass
+class SaveCounts:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # Variants not saved: invalid ones, or a variant id already saved for
+    # another url
+    skipped: int = 0
+
+    def __iadd__(self, other):
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.skipped += other.skipped
+        return self
+
+
+def _clean_product_data(product_data: dict) -> dict:
+    """
+    The variant's SCRAPED_FIELDS as the model would store them.
+
+    Scrapers give prices as floats and lengths as numbers or text, so values
+    are converted (and prices rounded to the stored decimal places) before
+    being compared to saved variants. Raises ValidationError for a variant
+    that couldn't be saved, e.g. one missing its variant id or with a value
+    too long for its column, so it doesn't fail the whole batch's insert.
+    """
+    values = {
+        name: SupplierProduct._meta.get_field(name).to_python(product_data.get(name))
+        for name in SCRAPED_FIELDS
+    }
+    if values["variant_price"] is not None:
+        decimal_places = SupplierProduct._meta.get_field(
+            "variant_price"
+        ).decimal_places
+        values["variant_price"] = values["variant_price"].quantize(
+            Decimal(1).scaleb(-decimal_places)
+        )
+
+    SupplierProduct(**values).clean_fields(
+        exclude=[
+            field.name
+            for field in SupplierProduct._meta.concrete_fields
+            if field.name not in SCRAPED_FIELDS
+        ]
+    )
+    return values
+
+
+def save_scraped_products(supplier, price_list, products_data) -> SaveCounts:
+    """
+    Insert or update a batch of scraped variants of a supplier.
+
+    Variants are identified by (supplier, variant_id, url). New ones are
+    added to price_list; existing ones keep the price list they were first
+    found in.
+
+    Args:
+        supplier: The Client the products were scraped for
+        price_list: The SupplierPriceList new variants are added to
+        products_data: Dicts of SCRAPED_FIELDS, as scrapers return them
+
+    Returns:
+        SaveCounts of the batch
+    """
+    counts = SaveCounts()
+    cleaned = {}
+    for product_data in products_data:
+        try:
+            product = _clean_product_data(product_data)
+        except Exception as e:
+            logger.error(f"Skipping product {product_data.get('url')}: {e}")
+            counts.skipped += 1
+            continue
+        # A variant scraped twice in a batch is saved as last scraped
+        cleaned[(product["variant_id"], product["url"])] = product
+
+    with transaction.atomic():
+        # Variant ids are unique per supplier, so read by those to also find
+        # variants saved under another url
+        existing = {
+            product.variant_id: product
+            for product in SupplierProduct.objects.select_for_update().filter(
+                supplier=supplier,
+                variant_id__in={variant_id for variant_id, _ in cleaned},
+            )
+        }
+
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        changed_fields = set()
+        for (variant_id, url), values in cleaned.items():
+            product = existing.get(variant_id)
+            if product is None:
+                product = SupplierProduct(
+                    supplier=supplier, price_list=price_list, **values
+                )
+                existing[variant_id] = product
+                to_create.append(product)
+                continue
+
+            if product.url != url:
+                logger.error(
+                    f"Variant {variant_id} of {supplier.name} is already saved for "
+                    f"{product.url}, not saving it for {url}"
+                )
+                counts.skipped += 1
+                continue
+
+            changed = {
+                name
+                for name, value in values.items()
+                if getattr(product, name) != value
+            }
+            if not changed:
+                counts.unchanged += 1
+                continue
+            for name in changed:
+                setattr(product, name, values[name])
+            # bulk_update skips auto_now
+            product.updated_at = now
+            changed_fields |= changed
+            to_update.append(product)
+
+        SupplierProduct.objects.bulk_create(to_create)
+        if to_update:
+            SupplierProduct.objects.bulk_update(
+                to_update, [*sorted(changed_fields), "updated_at"]
+            )
+
+    counts.inserted += len(to_create)
+    counts.updated += len(to_update)
+    return counts
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TimesheetConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.timesheet"
+
+    def ready(self):
+        # Connects the signal handlers
+        from apps.timesheet import signals  # noqa: F401
@@ -30,12 +30,20 @@ class PaidAbsenceForm(forms.Form):
         label="End Date",
     )
 
-    staff = forms.ModelChoiceField(
+    staff = forms.ModelMultipleChoiceField(
         queryset=Staff.objects.filter(is_active=True, is_staff=False).exclude(
             Q(id__in=get_excluded_staff())
         ),
-        widget=forms.Select(attrs={"class": "form-control"}),
-        label="Staff Member",
-        empty_label="Select a staff member",
+        widget=forms.SelectMultiple(attrs={"class": "form-control"}),
+        label="Staff Members",
+        help_text="Hold Ctrl (Cmd on a Mac) to book leave for several staff.",
         required=True,
     )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start_date = cleaned_data.get("start_date")
+        end_date = cleaned_data.get("end_date")
+        if start_date and end_date and end_date < start_date:
+            raise forms.ValidationError("End date must be after start date.")
+        return cleaned_data
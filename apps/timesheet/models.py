@@ -6,12 +6,16 @@ from django.db import models
 
 from apps.accounts.models import Staff
 
-from apps.job.models import JobPricing
+from apps.job.models import JobPricing, PricingEntry
 
 logger = logging.getLogger(__name__)
 
 
-class TimeEntry(models.Model):
+class TimeEntry(PricingEntry):
+    totals_source_fields = ("hours", "wage_rate", "charge_out_rate")
+    report_date_field = "date"
+    report_source_fields = ("is_billable", "staff", "staff_id")
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     job_pricing = models.ForeignKey(
         JobPricing,
@@ -75,19 +79,22 @@ class TimeEntry(models.Model):
         db_table = "workflow_timeentry"
 
     def save(self, *args, **kwargs):
-        if (
-            self.hours == 0
-            and self.items is not None
-            and self.minutes_per_item is not None
-        ):
-            total_minutes = Decimal(self.items) * Decimal(self.minutes_per_item)
-            logger.debug(f"Calculated total_minutes before assignment: {total_minutes}")
-            self.hours = (total_minutes / Decimal(60)).quantize(
-                Decimal("0.0001"), rounding="ROUND_HALF_UP"
-            )
-            logger.debug(f"Calculated hours before saving: {self.hours}")
+        if self.hours == 0:
+            self.set_hours_from_items()
         super().save(*args, **kwargs)
 
+    def set_hours_from_items(self) -> None:
+        """Work hours out from items and minutes_per_item, where both are set."""
+        if self.items is None or self.minutes_per_item is None:
+            return
+        total_minutes = Decimal(self.items) * Decimal(self.minutes_per_item)
+        logger.debug(f"Calculated total_minutes before assignment: {total_minutes}")
+        # To the 2 decimal places hours are stored with
+        self.hours = (total_minutes / Decimal(60)).quantize(
+            Decimal("0.01"), rounding="ROUND_HALF_UP"
+        )
+        logger.debug(f"Calculated hours before saving: {self.hours}")
+
     @property
     def minutes(self) -> Decimal:
         """Compute minutes dynamically based on hours."""
@@ -103,6 +110,13 @@ class TimeEntry(models.Model):
     def revenue(self) -> Decimal:
         return self.hours * self.charge_out_rate
 
+    def get_pricing_totals(self) -> dict:
+        return {
+            "total_hours": self.hours,
+            "total_time_cost": self.cost,
+            "total_time_revenue": self.revenue,
+        }
+
     def __str__(self):
         staff_name = self.staff.get_display_name() if self.staff else "No Staff"
         job_name = self.job_pricing.job.name if self.job_pricing else "No Job"
@@ -15,6 +15,8 @@ class TimeEntryForJobPricingSerializer(serializers.ModelSerializer):
     timesheet_date to display a link for the timesheet in edit_job_view_ajax.html
     """
 
+    # Writable so autosave can tell which stored entry a row is
+    id = serializers.UUIDField(required=False)
     total_minutes = serializers.SerializerMethodField()
     revenue = serializers.SerializerMethodField()
     cost = serializers.SerializerMethodField()
@@ -0,0 +1,274 @@
+from datetime import timedelta
+from decimal import Decimal
+from logging import getLogger
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    DecimalField,
+    F,
+    Min,
+    Sum,
+    Value,
+    When,
+)
+
+from apps.accounting.utils import get_nz_holidays
+from apps.job.models import Job
+from apps.timesheet.models import TimeEntry
+
+logger = getLogger(__name__)
+
+# Leave is booked against jobs named "Annual Leave", "Sick Leave", ...
+LEAVE_JOB_NAME = "Leave"
+# The job each type of paid absence is booked against
+LEAVE_JOB_NAMES = {
+    "annual": "Annual Leave",
+    "sick": "Sick Leave",
+    "other": "Other Leave",
+}
+LEAVE_JOB_IDS_CACHE_KEY = "timesheet_leave_job_ids"
+LEAVE_JOB_IDS_CACHE_TIMEOUT = 60 * 60
+
+
+class LeaveJobNotConfigured(ValueError):
+    """A type of leave has no job, or the job has no reality pricing."""
+
+
+def _empty_day():
+    return {
+        "hours": 0,
+        "billable_hours": 0,
+        "leave_hours": Decimal(0),
+        "leave_type": None,
+        "leave_entry_count": 0,
+        "leave_first_created": None,
+        # Non-leave hours keyed by wage_rate_multiplier
+        "hours_by_multiplier": {},
+    }
+
+
+def build_week_matrix(staff_members, days):
+    """
+    Sum every staff member's time entries for each of the given days.
+
+    All entries for the week come back from one query, grouped by staff, date,
+    leave job (if the entry is leave) and wage multiplier, and are folded
+    into a day's totals here.
+
+    Args:
+        staff_members: Staff to include
+        days: Dates to include
+
+    Returns:
+        Dict of staff id -> date -> day totals, with an entry for every
+        staff member and day even when nothing was logged:
+            - hours: All hours, leave included
+            - billable_hours: Hours on billable entries
+            - leave_hours: Hours booked to leave jobs
+            - leave_type: Name of the first leave job booked that day, if any
+            - leave_entry_count: Number of leave entries
+            - hours_by_multiplier: Non-leave hours per wage_rate_multiplier
+    """
+    matrix = {
+        staff_member.id: {day: _empty_day() for day in days}
+        for staff_member in staff_members
+    }
+    if not matrix or not days:
+        return matrix
+
+    hours_field = DecimalField(max_digits=10, decimal_places=2)
+    rows = (
+        TimeEntry.objects.filter(staff_id__in=matrix.keys(), date__in=days)
+        .annotate(
+            leave_type=Case(
+                When(
+                    job_pricing__job__name__icontains=LEAVE_JOB_NAME,
+                    then=F("job_pricing__job__name"),
+                ),
+                default=None,
+                output_field=CharField(),
+            )
+        )
+        .values("staff_id", "date", "leave_type", "wage_rate_multiplier")
+        .annotate(
+            total_hours=Sum("hours"),
+            total_billable_hours=Sum(
+                Case(
+                    When(is_billable=True, then=F("hours")),
+                    default=Value(Decimal(0)),
+                    output_field=hours_field,
+                )
+            ),
+            entry_count=Count("id"),
+            first_created=Min("created_at"),
+        )
+        .order_by()
+    )
+
+    for row in rows:
+        day = matrix[row["staff_id"]][row["date"]]
+        hours = row["total_hours"]
+        day["hours"] += hours
+        day["billable_hours"] += row["total_billable_hours"]
+
+        if row["leave_type"] is not None:
+            day["leave_hours"] += hours
+            day["leave_entry_count"] += row["entry_count"]
+            first_created = day["leave_first_created"]
+            if first_created is None or row["first_created"] < first_created:
+                day["leave_type"] = row["leave_type"]
+                day["leave_first_created"] = row["first_created"]
+        else:
+            by_multiplier = day["hours_by_multiplier"]
+            multiplier = row["wage_rate_multiplier"]
+            by_multiplier[multiplier] = by_multiplier.get(multiplier, 0) + hours
+
+    return matrix
+
+
+def _find_leave_job_ids() -> dict:
+    job_ids = dict(
+        Job.objects.filter(name__in=LEAVE_JOB_NAMES.values()).values_list(
+            "name", "id"
+        )
+    )
+    return {
+        leave_type: job_ids[name]
+        for leave_type, name in LEAVE_JOB_NAMES.items()
+        if name in job_ids
+    }
+
+
+def get_leave_jobs(leave_types) -> dict:
+    """
+    The jobs the given types of leave are booked against, with their current
+    reality pricings.
+
+    The ids of the leave jobs are cached by type, so only the jobs
+    themselves are read, in one query.
+
+    Raises:
+        LeaveJobNotConfigured: If a type has no job or pricing to book to
+    """
+    leave_types = set(leave_types)
+    job_ids = cache.get(LEAVE_JOB_IDS_CACHE_KEY) or {}
+    if not leave_types <= job_ids.keys():
+        job_ids = _find_leave_job_ids()
+        cache.set(LEAVE_JOB_IDS_CACHE_KEY, job_ids, LEAVE_JOB_IDS_CACHE_TIMEOUT)
+
+    jobs = Job.objects.select_related("latest_reality_pricing").in_bulk(
+        [job_ids[leave_type] for leave_type in leave_types if leave_type in job_ids]
+    )
+    if len(jobs) < len(leave_types):
+        # A cached job was deleted or renamed, look again next time
+        cache.delete(LEAVE_JOB_IDS_CACHE_KEY)
+
+    leave_jobs = {}
+    for leave_type in sorted(leave_types):
+        job = jobs.get(job_ids.get(leave_type))
+        if job is None:
+            raise LeaveJobNotConfigured(
+                f"Leave type '{LEAVE_JOB_NAMES[leave_type]}' not configured in system."
+            )
+        if job.latest_reality_pricing is None:
+            raise LeaveJobNotConfigured(
+                f"Leave job '{job.name}' has no reality pricing to book to."
+            )
+        leave_jobs[leave_type] = job
+    return leave_jobs
+
+
+def get_leave_days(staff_member, start_date, end_date) -> dict:
+    """
+    The days from start_date to end_date inclusive a staff member would
+    have worked, with the hours each, skipping their days off and New
+    Zealand public holidays.
+    """
+    days = {}
+    day = start_date
+    while day <= end_date:
+        hours = Decimal(str(staff_member.get_scheduled_hours(day)))
+        if hours > 0 and day not in get_nz_holidays(day.year):
+            days[day] = hours
+        day += timedelta(days=1)
+    return days
+
+
+def book_paid_absences(staff_members, date_ranges, leave_type: str) -> list:
+    """
+    Book leave for each staff member over each (start_date, end_date) range.
+
+    Each working day (see get_leave_days) gets a leave entry for the hours
+    the staff member is scheduled, except days they already have leave of
+    that type booked. All entries are written with one bulk_create, so
+    either every entry is booked or none is.
+
+    Args:
+        staff_members: Staff taking the leave
+        date_ranges: (start_date, end_date) pairs, both days included
+        leave_type: A key of LEAVE_JOB_NAMES
+
+    Raises:
+        ValueError: If a range ends before it starts
+        LeaveJobNotConfigured: If the leave type has nowhere to be booked
+
+    Returns:
+        The entries created
+    """
+    for start_date, end_date in date_ranges:
+        if end_date < start_date:
+            raise ValueError("End date must be after start date.")
+
+    job = get_leave_jobs([leave_type])[leave_type]
+    job_pricing = job.latest_reality_pricing
+
+    leave_days = {
+        staff_member: {
+            day: hours
+            for start_date, end_date in date_ranges
+            for day, hours in get_leave_days(
+                staff_member, start_date, end_date
+            ).items()
+        }
+        for staff_member in staff_members
+    }
+    all_days = {day for days in leave_days.values() for day in days}
+    if not all_days:
+        return []
+
+    with transaction.atomic():
+        booked = set(
+            TimeEntry.objects.filter(
+                job_pricing__job=job,
+                staff__in=staff_members,
+                date__range=[min(all_days), max(all_days)],
+            ).values_list("staff_id", "date")
+        )
+        entries = [
+            TimeEntry(
+                job_pricing=job_pricing,
+                staff=staff_member,
+                date=day,
+                hours=hours,
+                description=f"{leave_type.capitalize()} Leave",
+                is_billable=False,
+                note="Automatically created leave entry",
+                wage_rate=staff_member.wage_rate,
+                charge_out_rate=job.charge_out_rate,
+                wage_rate_multiplier=1.0,
+            )
+            for staff_member, days in leave_days.items()
+            for day, hours in sorted(days.items())
+            if (staff_member.id, day) not in booked
+        ]
+        TimeEntry.objects.bulk_create(entries)
+
+    logger.info(
+        f"Booked {len(entries)} {leave_type} leave entries for "
+        f"{len(leave_days)} staff"
+    )
+    return entries
@@ -0,0 +1,29 @@
+"""
+Deleting a staff member cascades to their time entries in the database
+collector, which skips TimeEntry.delete() and PricingEntryQuerySet.delete().
+These handlers rebuild what those would have kept up to date.
+"""
+
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import receiver
+
+from apps.accounts.models import Staff
+from apps.job.models import JobPricing
+from apps.timesheet.models import TimeEntry
+
+
+@receiver(pre_delete, sender=Staff)
+def remember_staff_time_entries(sender, instance, **kwargs):
+    # Read before the cascade removes them
+    instance._time_entry_report_keys = set(
+        TimeEntry.objects.filter(staff=instance)
+        .order_by()
+        .values_list("date", "job_pricing_id")
+        .distinct()
+    )
+
+
+@receiver(post_delete, sender=Staff)
+def recalculate_staff_pricings(sender, instance, **kwargs):
+    report_keys = getattr(instance, "_time_entry_report_keys", set())
+    JobPricing.recalculate_totals({pricing_id for _, pricing_id in report_keys})
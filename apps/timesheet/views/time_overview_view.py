@@ -23,7 +23,7 @@ from django.utils.html import format_html
 from django.views.generic import TemplateView
 from django.db import models
 
-from apps.job.models import Job, JobPricing
+from apps.job.models import Job
 from apps.workflow.utils import extract_messages
 
 from apps.accounts.models import Staff
@@ -31,6 +31,11 @@ from apps.accounts.utils import get_excluded_staff
 
 from apps.timesheet.models import TimeEntry
 from apps.timesheet.forms import PaidAbsenceForm
+from apps.timesheet.services import (
+    LeaveJobNotConfigured,
+    book_paid_absences,
+    build_week_matrix,
+)
 
 # Configure logging to only show logs from this module
 logger = logging.getLogger(__name__)
@@ -238,7 +243,10 @@ class TimesheetOverviewView(TemplateView):
         total_hours = 0
         total_billable_hours = 0
 
-        for staff_member in self.get_filtered_staff():
+        staff_members = self.get_filtered_staff()
+        week_matrix = build_week_matrix(staff_members, week_days)
+
+        for staff_member in staff_members:
             weekly_hours = []
             total_staff_std_hours = 0
             total_staff_ovt_hours = 0
@@ -252,10 +260,11 @@ class TimesheetOverviewView(TemplateView):
             total_staff_other_leave_hours = 0
 
             for day in week_days:
+                day_totals = week_matrix[staff_member.id][day]
                 if export_to_ims:
-                    daily_data = self._get_ims_data(staff_member, day)
+                    daily_data = self._get_ims_data(staff_member, day, day_totals)
                 else:
-                    daily_data = self._get_daily_data(staff_member, day)
+                    daily_data = self._get_daily_data(staff_member, day, day_totals)
 
                 weekly_hours.append(daily_data["daily_summary"])
                 total_staff_std_hours += daily_data["hours"]
@@ -335,29 +344,22 @@ class TimesheetOverviewView(TemplateView):
         }
         return staff_data, totals
 
-    def _get_daily_data(self, staff_member, day):
+    def _get_daily_data(self, staff_member, day, day_totals):
         """Get timesheet data for a staff member on a specific day.
 
         Args:
             staff_member: Staff object
             day: datetime.date object
+            day_totals: The staff member's totals for the day from build_week_matrix
 
         Returns:
             Dict containing hours, billable hours and daily summary
         """
         try:
             scheduled_hours = staff_member.get_scheduled_hours(day)
-            time_entries = TimeEntry.objects.filter(
-                staff=staff_member, date=day
-            ).select_related("job_pricing")
-
-            daily_hours = sum(entry.hours for entry in time_entries)
-            daily_billable_hours = sum(
-                entry.hours for entry in time_entries if entry.is_billable
-            )
-            has_paid_leave = time_entries.filter(
-                job_pricing__job__name__icontains="Leave"
-            ).exists()
+            daily_hours = day_totals["hours"]
+            daily_billable_hours = day_totals["billable_hours"]
+            has_paid_leave = day_totals["leave_entry_count"] > 0
 
             return {
                 "hours": daily_hours,
@@ -380,39 +382,20 @@ class TimesheetOverviewView(TemplateView):
                 "daily_summary": {"day": day, "hours": 0, "status": "⚠"},
             }
 
-    def _get_ims_data(self, staff_member, day):
+    def _get_ims_data(self, staff_member, day, day_totals):
         try:
             scheduled_hours = staff_member.get_scheduled_hours(day)
-            time_entries = TimeEntry.objects.filter(
-                staff=staff_member, date=day
-            ).select_related("job_pricing")
+            daily_hours = day_totals["hours"]
+            daily_billable_hours = day_totals["billable_hours"]
 
-            daily_hours = sum(entry.hours for entry in time_entries)
-            daily_billable_hours = sum(
-                entry.hours for entry in time_entries if entry.is_billable
-            )
-
-            leave_entries = time_entries.filter(
-                job_pricing__job__name__icontains="Leave"
-            )
-            has_paid_leave = leave_entries.exists()
-            leave_type = None
-            leave_hours = Decimal(0)
+            has_paid_leave = day_totals["leave_entry_count"] > 0
+            leave_type = day_totals["leave_type"]
+            leave_hours = day_totals["leave_hours"]
 
-            if has_paid_leave:
-                if leave_entries.count() > 1:
-                    logger.warning(
-                        f"Multiple leave entries found for {staff_member} on {day}"
-                    )
-                    leave_type = leave_entries.first().job_pricing.job.name
-                else:
-                    leave_type = leave_entries.first().job_pricing.job.name
-
-                leave_hours = sum(entry.hours for entry in leave_entries)
-
-            non_leave_entries = time_entries.exclude(
-                job_pricing__job__name__icontains="Leave"
-            )
+            if day_totals["leave_entry_count"] > 1:
+                logger.warning(
+                    f"Multiple leave entries found for {staff_member} on {day}"
+                )
 
             # Convert scheduled_hours to Decimal before calculation
             overtime = (
@@ -426,17 +409,16 @@ class TimesheetOverviewView(TemplateView):
             time_and_half_hours = Decimal(0)
             double_time_hours = Decimal(0)
             unpaid_hours = Decimal(0)
-            for entry in non_leave_entries:
-                multiplier = Decimal(entry.wage_rate_multiplier)
-                match multiplier:
+            for multiplier, hours in day_totals["hours_by_multiplier"].items():
+                match Decimal(multiplier):
                     case 1.0:
-                        standard_hours += entry.hours
+                        standard_hours += hours
                     case 1.5:
-                        time_and_half_hours += entry.hours
+                        time_and_half_hours += hours
                     case 2.0:
-                        double_time_hours += entry.hours
+                        double_time_hours += hours
                     case 0.0:
-                        unpaid_hours += entry.hours
+                        unpaid_hours += hours
 
             return {
                 "hours": daily_hours,
@@ -523,7 +505,9 @@ class TimesheetOverviewView(TemplateView):
             HTML string containing base64 encoded PNG image
         """
         try:
-            open_jobs = self._get_open_jobs()
+            open_jobs = self._get_open_jobs().select_related(
+                "latest_estimate_pricing", "latest_reality_pricing"
+            )
 
             job_names = [job.name for job in open_jobs]
 
@@ -652,8 +636,9 @@ class TimesheetOverviewView(TemplateView):
     def submit_paid_absence(self, request):
         """Handle submission of paid absence form and create leave entries.
 
-        Creates TimeEntry records for each weekday in the date range with the specified
-        leave type. Skips weekends and validates form data.
+        Books leave for every selected staff member on each day in the date
+        range they are scheduled to work, skipping NZ public holidays (see
+        book_paid_absences). Either every entry is created or none is.
 
         Args:
             request: The HTTP request containing form data
@@ -662,7 +647,7 @@ class TimesheetOverviewView(TemplateView):
             JsonResponse with success/error status and messages
 
         Form Fields:
-            staff: Staff member taking leave
+            staff: Staff members taking leave
             start_date: First day of leave period
             end_date: Last day of leave period
             leave_type: Type of leave (annual, sick, or other)
@@ -679,65 +664,23 @@ class TimesheetOverviewView(TemplateView):
                 status=400,
             )
 
-        staff_member = form.cleaned_data["staff"]
-        start_date = form.cleaned_data["start_date"]
-        end_date = form.cleaned_data["end_date"]
-        leave_type = form.cleaned_data["leave_type"]
-
-        if end_date < start_date:
-            messages.error(request, "End date must be after start date.")
-            return JsonResponse(
-                {"success": False, "messages": extract_messages(request)}, status=400
+        try:
+            entries = book_paid_absences(
+                form.cleaned_data["staff"],
+                [(form.cleaned_data["start_date"], form.cleaned_data["end_date"])],
+                form.cleaned_data["leave_type"],
             )
-
-        # Get leave job IDs dynamically instead of hardcoding them
-        leave_jobs = {}
-        leave_types = {
-            "annual": "Annual Leave",
-            "sick": "Sick Leave",
-            "other": "Other Leave",
-        }
-
-        for leave_key, leave_name in leave_types.items():
-            job = Job.objects.filter(name=leave_name).first()
-            if job:
-                leave_jobs[leave_key] = str(job.id)
-            else:
-                logger.error(f"Leave job '{leave_name}' not found in database")
-                messages.error(
-                    request, f"Leave type '{leave_name}' not configured in system."
-                )
-                return JsonResponse(
-                    {"success": False, "messages": extract_messages(request)},
-                    status=400,
-                )
-
-        job_pricing = JobPricing.objects.filter(job_id=leave_jobs[leave_type]).first()
-        if not job_pricing:
-            messages.error(request, "Invalid leave type selected.")
+        except LeaveJobNotConfigured as e:
+            logger.error(str(e))
+            messages.error(request, str(e))
             return JsonResponse(
                 {"success": False, "messages": extract_messages(request)}, status=400
             )
 
-        for day in range((end_date - start_date).days + 1):
-            date = start_date + timezone.timedelta(days=day)
-            if date.weekday() >= 5:  # Skip weekends
-                continue
-
-            TimeEntry.objects.create(
-                job_pricing=job_pricing,
-                staff=staff_member,
-                date=date,
-                hours=8,
-                description=f"{leave_type.capitalize()} Leave",
-                is_billable=False,
-                note="Automatically created leave entry",
-                wage_rate=staff_member.wage_rate,
-                charge_out_rate=job_pricing.job.charge_out_rate,
-                wage_rate_multiplier=1.0,
-            )
-
-        messages.success(request, "Paid absence entries created successfully.")
+        if entries:
+            messages.success(request, "Paid absence entries created successfully.")
+        else:
+            messages.info(request, "No working days needed leave booking.")
         return JsonResponse({"success": True, "messages": extract_messages(request)})
 
     def export_to_ims(self, request, start_date):
@@ -0,0 +1,224 @@
+"""
+Shared rate-limit governor for every call made through the Xero api_client.
+
+Xero allows 60 calls per minute, 5000 calls per day and 5 concurrent calls per
+tenant, and reports what is left on every response via the
+X-MinLimit-Remaining and X-DayLimit-Remaining headers. Rather than each caller
+padding its requests with fixed sleeps, all calls go through one token bucket
+that is kept in step with those headers and only waits when the budget is
+actually low (or Xero has told us to back off with Retry-After). Once the
+day's budget is down to DAY_RESERVE, calls are refused rather than queued,
+since it won't refill for hours.
+"""
+
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.utils import timezone
+from xero_python.exceptions import ApiException
+
+logger = logging.getLogger("xero")
+
+MINUTE_LIMIT = 60
+DAY_LIMIT = 5000
+MAX_CONCURRENT_CALLS = 5
+
+# Day calls kept back so a runaway sync can't use up the whole day, and how
+# often one call is let through to see whether Xero's rolling day has freed any
+DAY_RESERVE = 100
+DAY_RECHECK_SECONDS = 15 * 60
+
+# Where the latest headroom snapshot is published for the sync progress page
+HEADROOM_CACHE_KEY = "xero_rate_limit_headroom"
+HEADROOM_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _get_int_header(headers, name):
+    """Read an integer header, tolerating missing or malformed values."""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def get_retry_after(headers):
+    """Return the Retry-After header in seconds, or 0 if there isn't one."""
+    return _get_int_header(headers, "Retry-After") or 0
+
+
+class XeroDayLimitReached(RuntimeError):
+    """The day's Xero call budget is down to its reserve."""
+
+
+class XeroRateGovernor:
+    """
+    Token bucket shared by every Xero API call in this process.
+
+    The minute bucket refills continuously at minute_limit per minute and is
+    clamped to X-MinLimit-Remaining whenever Xero reports it. A 429 blocks all
+    callers until its Retry-After has elapsed. The day budget follows
+    X-DayLimit-Remaining, less the calls made since, and calls are refused
+    once it reaches day_reserve.
+    """
+
+    def __init__(
+        self,
+        minute_limit=MINUTE_LIMIT,
+        day_limit=DAY_LIMIT,
+        max_concurrent_calls=MAX_CONCURRENT_CALLS,
+        day_reserve=DAY_RESERVE,
+    ):
+        self.minute_limit = minute_limit
+        self.day_limit = day_limit
+        self.day_reserve = day_reserve
+        self._lock = threading.Lock()
+        self._concurrency = threading.BoundedSemaphore(max_concurrent_calls)
+        self._minute_tokens = float(minute_limit)
+        self._refilled_at = time.monotonic()
+        self._day_remaining = None
+        self._day_checked_at = 0.0
+        self._blocked_until = 0.0
+        self._updated_at = None
+
+    def _refill(self, now):
+        elapsed = now - self._refilled_at
+        self._minute_tokens = min(
+            float(self.minute_limit),
+            self._minute_tokens + elapsed * self.minute_limit / 60,
+        )
+        self._refilled_at = now
+
+    def _check_day_budget(self, now):
+        if self._day_remaining is None or self._day_remaining > self.day_reserve:
+            return
+        if now - self._day_checked_at < DAY_RECHECK_SECONDS:
+            raise XeroDayLimitReached(
+                f"Only {self._day_remaining} Xero calls left today, "
+                f"keeping {self.day_reserve} in reserve"
+            )
+        # Let this one call through; its headers tell us what has freed up
+        self._day_checked_at = now
+
+    def acquire(self):
+        """
+        Block until there is budget for one more call, then spend it.
+
+        Raises:
+            XeroDayLimitReached: If the day's budget is down to its reserve
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                self._check_day_budget(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._minute_tokens >= 1:
+                        self._minute_tokens -= 1
+                        if self._day_remaining is not None:
+                            self._day_remaining -= 1
+                        return
+                    wait = (1 - self._minute_tokens) * 60 / self.minute_limit
+            logger.info(f"Xero rate budget low, waiting {wait:.1f} seconds")
+            time.sleep(wait)
+
+    def record_headers(self, headers):
+        """Bring the local budget in line with the limits Xero reported."""
+        minute_remaining = _get_int_header(headers, "X-MinLimit-Remaining")
+        day_remaining = _get_int_header(headers, "X-DayLimit-Remaining")
+        if minute_remaining is None and day_remaining is None:
+            return
+
+        with self._lock:
+            if minute_remaining is not None:
+                self._refill(time.monotonic())
+                self._minute_tokens = max(
+                    0.0, min(self._minute_tokens, minute_remaining)
+                )
+            if day_remaining is not None:
+                self._day_remaining = day_remaining
+                self._day_checked_at = time.monotonic()
+            self._updated_at = timezone.now()
+            headroom = self._get_headroom()
+
+        cache.set(HEADROOM_CACHE_KEY, headroom, timeout=HEADROOM_CACHE_TIMEOUT)
+
+    def record_rate_limited(self, headers):
+        """
+        Xero returned a 429. Block every caller until Retry-After has passed.
+        Returns the number of seconds we will wait.
+        """
+        retry_after = get_retry_after(headers)
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            self._minute_tokens = 0.0
+            self._refilled_at = now
+            self._updated_at = timezone.now()
+            headroom = self._get_headroom()
+
+        cache.set(HEADROOM_CACHE_KEY, headroom, timeout=HEADROOM_CACHE_TIMEOUT)
+        if retry_after > 0:
+            logger.warning(
+                f"Rate limit reached. Retrying after {retry_after} seconds..."
+            )
+        return retry_after
+
+    def _get_headroom(self):
+        blocked_for = max(0.0, self._blocked_until - time.monotonic())
+        return {
+            "minute_remaining": int(self._minute_tokens),
+            "minute_limit": self.minute_limit,
+            "day_remaining": self._day_remaining,
+            "day_limit": self.day_limit,
+            "blocked_for": round(blocked_for, 1),
+            "updated_at": self._updated_at.isoformat() if self._updated_at else None,
+        }
+
+    def get_headroom(self):
+        """Current budget as seen by this process."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._get_headroom()
+
+    def install(self, client):
+        """Route every request made through an xero_python ApiClient via us."""
+        request = client.request
+
+        def governed_request(*args, **kwargs):
+            with self._concurrency:
+                self.acquire()
+                try:
+                    response = request(*args, **kwargs)
+                except ApiException as e:
+                    if e.status == 429:
+                        self.record_rate_limited(e.headers)
+                    else:
+                        self.record_headers(e.headers)
+                    raise
+            # Raw urllib3 responses (_preload_content=False) expose .headers
+            if hasattr(response, "getheaders"):
+                self.record_headers(response.getheaders())
+            else:
+                self.record_headers(getattr(response, "headers", None))
+            return response
+
+        client.request = governed_request
+
+
+governor = XeroRateGovernor()
+
+
+def get_headroom():
+    """
+    Latest known Xero budget, for display on the sync progress page.
+    Prefers the published snapshot so other workers see the syncing thread's view.
+    """
+    return cache.get(HEADROOM_CACHE_KEY) or governor.get_headroom()
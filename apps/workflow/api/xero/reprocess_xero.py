@@ -3,6 +3,8 @@ import logging
 import uuid
 from decimal import Decimal
 
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
@@ -23,31 +25,90 @@ from apps.workflow.models import XeroAccount
 logger = logging.getLogger("xero")
 
 
-def set_invoice_or_bill_fields(document, document_type):
-    """
-    Process either an invoice or bill from Xero.
-
-    Args:
-        document: Instance of XeroInvoiceOrBill
-        document_type: String either "INVOICE" or "BILL"
-    """
-
+# Per-type wiring for set_invoice_or_bill_fields_batch: the line item model and
+# the name of its foreign key back to the document.
+LINE_ITEM_MODELS = {
+    "INVOICE": (InvoiceLineItem, "invoice"),
+    "BILL": (BillLineItem, "bill"),
+    "CREDIT_NOTE": (CreditNoteLineItem, "credit_note"),
+}
+
+DOCUMENT_FIELDS = [
+    "xero_id",
+    "number",
+    "date",
+    "due_date",
+    "status",
+    "tax",
+    "total_excl_tax",
+    "total_incl_tax",
+    "amount_due",
+    "xero_last_modified",
+    "xero_last_synced",
+    "client",
+    "raw_json",
+    "raw_json_hash",
+    "django_updated_at",
+]
+
+LINE_ITEM_FIELDS = [
+    "quantity",
+    "unit_price",
+    "description",
+    "account",
+    "tax_amount",
+    "line_amount_excl_tax",
+    "line_amount_incl_tax",
+]
+
+BULK_BATCH_SIZE = 500
+
+
+def _get_json_document_type(raw_json):
+    """Work out INVOICE/BILL/CREDIT_NOTE from the Xero _type in raw_json."""
+    xero_type = raw_json.get("_type")
+    if xero_type == "ACCREC":
+        return "INVOICE"
+    if xero_type == "ACCPAY":
+        return "BILL"
+    if xero_type in ["ACCRECCREDIT", "ACCPAYCREDIT"]:
+        return "CREDIT_NOTE"
+    return None
+
+
+def _preload_accounts(account_codes):
+    """Return a map of account_code -> XeroAccount using a single query."""
+    accounts_by_code = {}
+    codes = {code for code in account_codes if code}
+    if not codes:
+        return accounts_by_code
+    for account in XeroAccount.objects.filter(account_code__in=codes).order_by("pk"):
+        # Mirror .first(): keep the lowest pk if a code is duplicated
+        accounts_by_code.setdefault(account.account_code, account)
+    return accounts_by_code
+
+
+def _preload_clients(contact_ids):
+    """Return a map of str(xero_contact_id) -> Client using a single query."""
+    clients_by_contact_id = {}
+    ids = {str(contact_id) for contact_id in contact_ids if contact_id}
+    if not ids:
+        return clients_by_contact_id
+    for client in Client.objects.filter(xero_contact_id__in=ids).order_by("pk"):
+        clients_by_contact_id.setdefault(str(client.xero_contact_id), client)
+    return clients_by_contact_id
+
+
+def _set_document_fields(document, document_type, clients_by_contact_id, now):
+    """Copy the header fields of a Xero document from raw_json onto the model."""
     if not document.raw_json:
         raise ValueError(
             f"{document_type.title()} raw_json is empty. "
             "We better not try to process it"
         )
 
-    is_invoice = document.raw_json.get("_type") == "ACCREC"
-    is_bill = document.raw_json.get("_type") == "ACCPAY"
-    is_credit_note = document.raw_json.get("_type") in ["ACCRECCREDIT", "ACCPAYCREDIT"]
-
-    if is_invoice:
-        json_document_type = "INVOICE"
-    elif is_bill:
-        json_document_type = "BILL"
-    elif is_credit_note:
-        json_document_type = "CREDIT_NOTE"
+    raw_data = document.raw_json
+    json_document_type = _get_json_document_type(raw_data)
 
     # Validate the document matches the type
     if document_type != json_document_type:
@@ -56,10 +117,8 @@ def set_invoice_or_bill_fields(document, document_type):
             f"but document appears to be a {json_document_type}"
         )
 
-    raw_data = document.raw_json
-
     # Common fields that are identical between invoices and bills
-    if is_credit_note:
+    if json_document_type == "CREDIT_NOTE":
         document.xero_id = raw_data.get("_credit_note_id")
         document.number = raw_data.get("_credit_note_number")
     else:
@@ -76,80 +135,191 @@ def set_invoice_or_bill_fields(document, document_type):
     else:
         document.amount_due = raw_data.get("_amount_due")
     document.xero_last_modified = raw_data.get("_updated_date_utc")
-    document.xero_last_synced = timezone.now()
+    document.xero_last_synced = now
+    # bulk_update bypasses auto_now, so stamp it ourselves
+    document.django_updated_at = now
 
-    # Set or create the client/supplier
+    # Set the client/supplier
     contact_data = raw_data.get("_contact", {})
     contact_id = contact_data.get("_contact_id")
-    client = Client.objects.filter(xero_contact_id=contact_id).first()
+    client = clients_by_contact_id.get(str(contact_id)) if contact_id else None
     if not client:
         raise ValueError(
             f"Client not found for {document_type.lower()} {document.number}"
         )
     document.client = client
 
-    document.save()
 
-    # Handle line items
-    line_items_data = raw_data.get("_line_items", [])
+def _get_line_item_values(line_item_data, amount_type, accounts_by_code):
+    """Derive the stored values of a single line item from its raw_json."""
+    description = line_item_data.get("_description") or "No description provided"
+    quantity = line_item_data.get("_quantity", 1)
+    unit_price = line_item_data.get("_unit_amount", 1)
+
+    try:
+        line_amount = float(line_item_data.get("_line_amount", 0))
+        tax_amount = float(line_item_data.get("_tax_amount", 0))
+    except (TypeError, ValueError):
+        line_amount = 0
+        tax_amount = 0
+
+    # Fix for the GST calculation bug
+    if amount_type == "Inclusive":
+        line_amount_excl_tax = line_amount - tax_amount
+        line_amount_incl_tax = line_amount
+    else:
+        line_amount_excl_tax = line_amount
+        line_amount_incl_tax = line_amount + tax_amount
+
+    return {
+        "quantity": quantity,
+        "unit_price": unit_price,
+        "description": description,
+        "account": accounts_by_code.get(line_item_data.get("_account_code")),
+        "tax_amount": tax_amount,
+        "line_amount_excl_tax": line_amount_excl_tax,
+        "line_amount_incl_tax": line_amount_incl_tax,
+    }
+
+
+def _get_line_item_rows(document, accounts_by_code):
+    """Return (xero_line_id, values) for each line item in a document's raw_json."""
+    raw_data = document.raw_json
     amount_type = raw_data.get("_line_amount_types", {}).get("_value_")
+    return [
+        (
+            uuid.UUID(line_item_data.get("_line_item_id")),
+            _get_line_item_values(line_item_data, amount_type, accounts_by_code),
+        )
+        for line_item_data in raw_data.get("_line_items", [])
+    ]
+
+
+def set_invoice_or_bill_fields(document, document_type):
+    """
+    Process either an invoice or bill from Xero.
+
+    Args:
+        document: Instance of XeroInvoiceOrBill
+        document_type: String either "INVOICE" or "BILL"
+    """
+    failures = set_invoice_or_bill_fields_batch([document], document_type)
+    if failures:
+        raise failures[0][1]
+
+
+def set_invoice_or_bill_fields_batch(documents, document_type):
+    """
+    Process a page of invoices, bills or credit notes from Xero in bulk.
+
+    Accounts and clients are loaded once for the whole page, line items are
+    diffed against the existing rows by xero_line_id, and everything is written
+    with bulk_create/bulk_update inside a single transaction.
+
+    A document whose raw_json can't be processed (e.g. empty, or for a client
+    we don't have) is logged and left unwritten, and the rest of the page
+    carries on.
 
-    # Determine which line item model to use
-    LineItemModel = (
-        InvoiceLineItem
-        if is_invoice
-        else BillLineItem if is_bill else CreditNoteLineItem if is_credit_note else None
+    Args:
+        documents: Instances of the same document model, saved or unsaved,
+            each with raw_json already populated
+        document_type: String "INVOICE", "BILL" or "CREDIT_NOTE"
+
+    Returns:
+        list of (document, error) for the documents that were skipped.
+    """
+    if not documents:
+        return []
+
+    if document_type not in LINE_ITEM_MODELS:
+        raise ValueError(f"Unsupported document type: {document_type}")
+    LineItemModel, document_field = LINE_ITEM_MODELS[document_type]
+    DocumentModel = type(documents[0])
+
+    now = timezone.now()
+    clients_by_contact_id = _preload_clients(
+        (document.raw_json or {}).get("_contact", {}).get("_contact_id")
+        for document in documents
     )
-    document_field = (
-        "invoice"
-        if is_invoice
-        else "bill" if is_bill else "credit_note" if is_credit_note else None
+    accounts_by_code = _preload_accounts(
+        line_item_data.get("_account_code")
+        for document in documents
+        for line_item_data in (document.raw_json or {}).get("_line_items", [])
     )
 
-    for line_item_data in line_items_data:
-        line_item_id = line_item_data.get("_line_item_id")
-        xero_line_id = uuid.UUID(line_item_id)
-        description = line_item_data.get("_description") or "No description provided"
-        quantity = line_item_data.get("_quantity", 1)
-        unit_price = line_item_data.get("_unit_amount", 1)
-
+    failures = []
+    line_item_rows = []
+    new_documents = []
+    existing_documents = []
+    for document in documents:
         try:
-            line_amount = float(line_item_data.get("_line_amount", 0))
-            tax_amount = float(line_item_data.get("_tax_amount", 0))
-        except (TypeError, ValueError):
-            line_amount = 0
-            tax_amount = 0
-
-        # Fix for the GST calculation bug
-        if amount_type == "Inclusive":
-            line_amount_excl_tax = line_amount - tax_amount
-            line_amount_incl_tax = line_amount
+            _set_document_fields(document, document_type, clients_by_contact_id, now)
+            rows = _get_line_item_rows(document, accounts_by_code)
+        except (TypeError, ValueError) as e:
+            logger.error(
+                f"Skipping {document_type.lower()} "
+                f"{document.number or document.xero_id}: {str(e)}"
+            )
+            failures.append((document, e))
+            continue
+        line_item_rows.append((document, rows))
+        if document._state.adding:
+            new_documents.append(document)
         else:
-            line_amount_excl_tax = line_amount
-            line_amount_incl_tax = line_amount + tax_amount
-
-        # Fetch the account
-        account_code = line_item_data.get("_account_code")
-        account = XeroAccount.objects.filter(account_code=account_code).first()
-
-        # Sync the line item using dynamic field name
-        kwargs = {document_field: document, "xero_line_id": xero_line_id}
-        line_item, created = LineItemModel.objects.update_or_create(
-            **kwargs,
-            defaults={
-                "quantity": quantity,
-                "unit_price": unit_price,
-                "description": description,
-                "account": account,
-                "tax_amount": tax_amount,
-                "line_amount_excl_tax": line_amount_excl_tax,
-                "line_amount_incl_tax": line_amount_incl_tax,
-            },
-        )
-        # print(f"{'Created' if created else 'Updated'} Line Item: "
-        #       f"Amount Excl. Tax: {line_item.line_amount_excl_tax}, "
-        #       f"Tax Amount: {line_item.tax_amount}, "
-        #       f"Total Incl. Tax: {line_item.line_amount_incl_tax}")
+            existing_documents.append(document)
+
+    # Only documents that are already in the DB can have line items to update
+    existing_lines = {}
+    if existing_documents:
+        for line_item in LineItemModel.objects.filter(
+            **{f"{document_field}__in": [d.pk for d in existing_documents]}
+        ):
+            key = (getattr(line_item, f"{document_field}_id"), line_item.xero_line_id)
+            existing_lines[key] = line_item
+
+    lines_to_create = []
+    lines_to_update = []
+    for document, rows in line_item_rows:
+        for xero_line_id, values in rows:
+            line_item = existing_lines.get((document.pk, xero_line_id))
+            if line_item is None:
+                lines_to_create.append(
+                    LineItemModel(
+                        **{document_field: document, "xero_line_id": xero_line_id},
+                        **values,
+                    )
+                )
+            else:
+                for field, value in values.items():
+                    setattr(line_item, field, value)
+                lines_to_update.append(line_item)
+
+    with transaction.atomic():
+        if new_documents:
+            DocumentModel.objects.bulk_create(
+                new_documents, batch_size=BULK_BATCH_SIZE
+            )
+        if existing_documents:
+            DocumentModel.objects.bulk_update(
+                existing_documents, DOCUMENT_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+        if lines_to_create:
+            LineItemModel.objects.bulk_create(
+                lines_to_create, batch_size=BULK_BATCH_SIZE
+            )
+        if lines_to_update:
+            LineItemModel.objects.bulk_update(
+                lines_to_update, LINE_ITEM_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+
+    logger.debug(
+        f"Processed {len(documents)} {document_type.lower()} documents: "
+        f"{len(new_documents)} new, {len(existing_documents)} existing, "
+        f"{len(failures)} skipped, "
+        f"{len(lines_to_create)} line items created, "
+        f"{len(lines_to_update)} line items updated"
+    )
+    return failures
 
 
 def set_client_fields(client, new_from_xero=False):
@@ -399,27 +569,11 @@ def set_client_fields(client, new_from_xero=False):
         logger.info(f"Client {client.name} (ID: {client.id}) updated from Xero data.")
 
 
-def set_journal_fields(journal: XeroJournal):
-    """
-    Read the raw_json from a XeroJournal record and set all fields and line items.
-    Similar to set_invoice_or_bill_fields, but for journals.
-    """
-    raw_data = journal.raw_json
-    if not raw_data:
-        raise ValueError("Journal raw_json is empty. Cannot process fields.")
-
+def _set_journal_values(journal, raw_data):
+    """Copy the journal-level fields from raw_json onto the instance."""
     # Adjust keys to match the underscore-prefixed structure you provided
     xero_id = raw_data.get("_journal_id")
     created_date_utc = raw_data.get("_created_date_utc")
-    journal_number = raw_data.get("_journal_number")
-    journal_date = raw_data.get("_journal_date")
-    reference = raw_data.get("_reference")
-    source_id = raw_data.get("_source_id")
-    source_type = raw_data.get("_source_type")
-
-    # Use created_date_utc as xero_last_modified if no separate field
-    # Keeping consistent with other models
-    xero_last_modified = created_date_utc
 
     # Verify xero_id matches the journal's stored xero_id
     if xero_id and str(journal.xero_id) != str(xero_id):
@@ -429,97 +583,229 @@ def set_journal_fields(journal: XeroJournal):
             f"but raw_json has {xero_id}."
         )
 
-    journal.journal_date = journal_date
+    journal.journal_date = raw_data.get("_journal_date")
     journal.created_date_utc = created_date_utc
-    journal.journal_number = journal_number
-    journal.reference = reference
-    journal.source_id = source_id
-    journal.source_type = source_type
-    journal.xero_last_modified = xero_last_modified
+    journal.journal_number = raw_data.get("_journal_number")
+    journal.reference = raw_data.get("_reference")
+    journal.source_id = raw_data.get("_source_id")
+    journal.source_type = raw_data.get("_source_type")
+    # Use created_date_utc as xero_last_modified if no separate field
+    # Keeping consistent with other models
+    journal.xero_last_modified = created_date_utc
+
+
+def _get_journal_line_values(line_item_data, accounts_by_code):
+    """Field values for a XeroJournalLineItem, from one entry of _journal_lines."""
+    return {
+        "account": accounts_by_code.get(line_item_data.get("_account_code")),
+        "description": line_item_data.get("_description"),
+        "net_amount": Decimal(str(line_item_data.get("_net_amount", "0"))),
+        "gross_amount": Decimal(str(line_item_data.get("_gross_amount", "0"))),
+        "tax_amount": Decimal(str(line_item_data.get("_tax_amount", "0"))),
+        "tax_type": line_item_data.get("_tax_type"),
+        "tax_name": line_item_data.get("_tax_name"),
+        # The parent journal already holds every line in its own raw_json
+        "raw_json": (
+            line_item_data if settings.XERO_STORE_JOURNAL_LINE_RAW_JSON else None
+        ),
+    }
+
+
+def set_journal_fields(journal: XeroJournal):
+    """
+    Read the raw_json from a XeroJournal record and set all fields and line items.
+    Similar to set_invoice_or_bill_fields, but for journals.
+    """
+    raw_data = journal.raw_json
+    if not raw_data:
+        raise ValueError("Journal raw_json is empty. Cannot process fields.")
+
+    _set_journal_values(journal, raw_data)
 
     # Save changes to the journal before processing line items
     journal.save()
 
     # Handle JournalLines
     line_items_data = raw_data.get("_journal_lines", [])
+    accounts_by_code = _preload_accounts(
+        line_item_data.get("_account_code") for line_item_data in line_items_data
+    )
 
     for line_item_data in line_items_data:
-        line_id = line_item_data.get("_journal_line_id")
+        XeroJournalLineItem.objects.update_or_create(
+            xero_line_id=line_item_data.get("_journal_line_id"),
+            journal=journal,
+            defaults=_get_journal_line_values(line_item_data, accounts_by_code),
+        )
+
+
+def create_journals_batch(journals):
+    """
+    Insert a page of new journals and all of their lines.
 
-        # Convert amounts from strings to Decimal
-        net_amount_str = line_item_data.get("_net_amount", "0")
-        gross_amount_str = line_item_data.get("_gross_amount", "0")
-        tax_amount_str = line_item_data.get("_tax_amount", "0")
+    Journals are immutable once issued in Xero, so there is nothing to diff:
+    both tables are written with bulk_create inside one transaction, and
+    accounts come from a code -> account map loaded with a single query.
 
-        # Convert to Decimal
-        net_amount = Decimal(net_amount_str)
-        gross_amount = Decimal(gross_amount_str)
-        tax_amount = Decimal(tax_amount_str)
+    Args:
+        journals: Unsaved XeroJournal instances with raw_json already populated
+    """
+    if not journals:
+        return
 
-        account_code = line_item_data.get("_account_code")
-        description = line_item_data.get("_description")
-        tax_type = line_item_data.get("_tax_type")
-        tax_name = line_item_data.get("_tax_name")
+    for journal in journals:
+        if not journal.raw_json:
+            raise ValueError("Journal raw_json is empty. Cannot process fields.")
+        _set_journal_values(journal, journal.raw_json)
 
-        # Fetch the account if available
-        account = XeroAccount.objects.filter(account_code=account_code).first()
+    accounts_by_code = _preload_accounts(
+        line_item_data.get("_account_code")
+        for journal in journals
+        for line_item_data in journal.raw_json.get("_journal_lines", [])
+    )
 
-        XeroJournalLineItem.objects.update_or_create(
-            xero_line_id=line_id,
+    lines = [
+        XeroJournalLineItem(
             journal=journal,
-            defaults={
-                "account": account,
-                "description": description,
-                "net_amount": net_amount,
-                "gross_amount": gross_amount,
-                "tax_amount": tax_amount,
-                "tax_type": tax_type,
-                "tax_name": tax_name,
-                "raw_json": line_item_data,
-            },
+            xero_line_id=line_item_data.get("_journal_line_id"),
+            **_get_journal_line_values(line_item_data, accounts_by_code),
+        )
+        for journal in journals
+        for line_item_data in journal.raw_json.get("_journal_lines", [])
+    ]
+
+    with transaction.atomic():
+        XeroJournal.objects.bulk_create(journals, batch_size=BULK_BATCH_SIZE)
+        XeroJournalLineItem.objects.bulk_create(lines, batch_size=BULK_BATCH_SIZE)
+
+    logger.debug(f"Inserted {len(journals)} journals with {len(lines)} lines")
+
+
+def _reprocess_documents(documents, document_type):
+    """Reprocess a chunk of invoices/bills/credit notes, falling back to one by one."""
+    try:
+        failures = set_invoice_or_bill_fields_batch(documents, document_type)
+        return len(documents) - len(failures), len(failures)
+    except Exception as e:
+        logger.error(
+            f"Error reprocessing {document_type.lower()} batch, "
+            f"retrying individually: {str(e)}"
         )
 
+    processed = failed = 0
+    for document in documents:
+        try:
+            set_invoice_or_bill_fields(document, document_type)
+            processed += 1
+        except Exception as e:
+            failed += 1
+            logger.error(
+                f"Error reprocessing {document_type.lower()} "
+                f"{document.number}: {str(e)}"
+            )
+    return processed, failed
+
 
-def reprocess_invoices():
-    """Reprocess all existing invoices to set fields based on raw JSON."""
-    for invoice in Invoice.objects.all():
+def _reprocess_each(records, set_fields, describe):
+    processed = failed = 0
+    for record in records:
         try:
-            set_invoice_or_bill_fields(invoice, "INVOICE")
-            logger.info(f"Reprocessed invoice: {invoice.number}")
+            set_fields(record)
+            processed += 1
         except Exception as e:
-            logger.error(f"Error reprocessing invoice {invoice.number}: {str(e)}")
+            failed += 1
+            logger.error(f"Error reprocessing {describe(record)}: {str(e)}")
+    return processed, failed
+
+
+# What reprocess_records knows how to rebuild from raw_json, in the order
+# reprocess_all runs them (documents need their clients in place first).
+REPROCESS_MODELS = {
+    "clients": Client,
+    "invoices": Invoice,
+    "bills": Bill,
+    "credit_notes": CreditNote,
+    "journals": XeroJournal,
+}
+
+
+def reprocess_records(model_name, pks):
+    """
+    Re-derive fields for one chunk of records from their stored raw_json.
+
+    Safe to run in a worker process: it only needs the primary keys, and
+    loads and writes the chunk itself.
+
+    Returns:
+        (processed, failed) counts for the chunk.
+    """
+    records = list(REPROCESS_MODELS[model_name].objects.filter(pk__in=pks))
+
+    if model_name == "clients":
+        return _reprocess_each(
+            records, set_client_fields, lambda client: f"client {client.name}"
+        )
+    if model_name == "journals":
+        return _reprocess_each(
+            records,
+            set_journal_fields,
+            lambda jrnl: f"journal {jrnl.journal_number or jrnl.xero_id}",
+        )
+
+    document_type = {
+        "invoices": "INVOICE",
+        "bills": "BILL",
+        "credit_notes": "CREDIT_NOTE",
+    }[model_name]
+    return _reprocess_documents(records, document_type)
+
+
+def iter_pk_chunks(model, chunk_size=BULK_BATCH_SIZE, after_pk=None):
+    """
+    Yield lists of primary keys in pk order, chunk_size at a time, without
+    loading the table. Each chunk is its own short keyset query (pk > last),
+    so no cursor is held open while the chunks are being written, and a run
+    can start after after_pk to pick up where an interrupted one left off.
+    """
+    queryset = model.objects.order_by("pk").values_list("pk", flat=True)
+    while True:
+        chunk_queryset = queryset
+        if after_pk is not None:
+            chunk_queryset = chunk_queryset.filter(pk__gt=after_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        after_pk = chunk[-1]
+
+
+def _reprocess_model(model_name):
+    processed = failed = 0
+    for pks in iter_pk_chunks(REPROCESS_MODELS[model_name]):
+        chunk_processed, chunk_failed = reprocess_records(model_name, pks)
+        processed += chunk_processed
+        failed += chunk_failed
+    logger.info(f"Reprocessed {processed} {model_name} ({failed} failed)")
+
+
+def reprocess_invoices():
+    """Reprocess all existing invoices to set fields based on raw JSON."""
+    _reprocess_model("invoices")
 
 
 def reprocess_bills():
     """Reprocess all existing bills to set fields based on raw JSON."""
-    for bill in Bill.objects.all():
-        try:
-            set_invoice_or_bill_fields(bill, "BILL")
-            logger.info(f"Reprocessed bill: {bill.number}")
-        except Exception as e:
-            logger.error(f"Error reprocessing bill {bill.number}: {str(e)}")
+    _reprocess_model("bills")
 
 
 def reprocess_credit_notes():
     """Reprocess all existing credit notes to set fields based on raw JSON."""
-    for credit_note in CreditNote.objects.all():
-        try:
-            set_invoice_or_bill_fields(credit_note, "CREDIT NOTE")
-            logger.info(f"Reprocessed credit note: {credit_note.number}")
-        except Exception as e:
-            logger.error(
-                f"Error reprocessing credit note {credit_note.number}: {str(e)}"
-            )
+    _reprocess_model("credit_notes")
 
 
 def reprocess_clients():
     """Reprocess all existing clients to set fields based on raw JSON."""
-    for client in Client.objects.all():
-        try:
-            set_client_fields(client)
-            logger.info(f"Reprocessed client: {client.name}")
-        except Exception as e:
-            logger.error(f"Error reprocessing client {client.name}: {str(e)}")
+    _reprocess_model("clients")
 
 
 def reprocess_journals():
@@ -527,25 +813,16 @@ def reprocess_journals():
     Iterate over all XeroJournal records and re-run the set_journal_fields().
     Useful if we've tweaked mapping logic and want to re-derive fields from stored raw_json.
     """
-    from apps.workflow.models import XeroJournal
-
-    for jrnl in XeroJournal.objects.all():
-        try:
-            set_journal_fields(jrnl)
-            logger.info(f"Reprocessed journal: {jrnl.journal_number or jrnl.xero_id}")
-        except Exception as e:
-            logger.error(
-                f"Error reprocessing journal "
-                f"{jrnl.journal_number or jrnl.xero_id}: {str(e)}"
-            )
+    _reprocess_model("journals")
 
 
 def reprocess_all():
-    """Reprocesses all data to set fields based on raw JSON."""
+    """
+    Reprocesses all data to set fields based on raw JSON.
+    For large tables use the reprocess_xero management command, which runs in
+    parallel and can resume.
+    """
     # NOte, we don't have a reprocess accounts because it just feels too weird.
     # If you break accounts, you probably want to handle it manually
-    reprocess_clients()
-    reprocess_invoices()
-    reprocess_bills()
-    reprocess_credit_notes()
-    reprocess_journals()
+    for model_name in REPROCESS_MODELS:
+        _reprocess_model(model_name)
@@ -0,0 +1,150 @@
+"""
+Turns xero_python SDK objects into the raw_json we store against each record.
+
+SDK models keep their data in underscore-prefixed instance attributes
+(_invoice_id, _line_items, ...), so the stored JSON mirrors those names.
+Every synced record goes through here, so the walk is done in a single pass:
+the handler for each type and the list of attributes to read for each model
+class are worked out once and cached, and enum internals and unwanted keys
+are skipped as we go rather than stripped from a full copy afterwards.
+"""
+
+import hashlib
+import json
+from datetime import date, datetime
+from enum import Enum
+from uuid import UUID
+
+# Enum machinery that shows up in an enum member's __dict__
+ENUM_INTERNAL_KEYS = frozenset(
+    {
+        "__objclass__",
+        "_sort_order_",
+        "_value2member_map_",
+        "_generate_next_value_",
+        "_member_names_",
+    }
+)
+
+# Really bulky and repeated on every document, so contacts drop them
+CURRENCY_KEYS = frozenset({"_currency_code", "_currency_rate"})
+
+_ENUM_AND_CURRENCY_KEYS = ENUM_INTERNAL_KEYS | CURRENCY_KEYS
+
+# type -> handler(obj, exclude_keys)
+_handlers = {}
+
+# (model class, exclude_keys) -> tuple of attribute names to serialise
+_field_plans = {}
+
+
+def _serialise_primitive(obj, exclude_keys):
+    return obj
+
+
+def _serialise_temporal(obj, exclude_keys):
+    return obj.isoformat()
+
+
+def _serialise_uuid(obj, exclude_keys):
+    return str(obj)
+
+
+def _serialise_enum(obj, exclude_keys):
+    # Keep the shape existing readers expect (raw_json["_status"]["_value_"])
+    return {
+        "_value_": _serialise(obj.value, exclude_keys),
+        "_name_": obj.name,
+    }
+
+
+def _serialise_list(obj, exclude_keys):
+    return [_serialise(item, exclude_keys) for item in obj]
+
+
+def _serialise_dict(obj, exclude_keys):
+    return {
+        key: _serialise(value, exclude_keys)
+        for key, value in obj.items()
+        if key not in exclude_keys
+    }
+
+
+def _get_field_plan(cls, attributes, exclude_keys):
+    plan_key = (cls, exclude_keys)
+    plan = _field_plans.get(plan_key)
+    if plan is None:
+        # SDK models set every attribute in __init__, so the first instance
+        # tells us the layout for the whole class
+        plan = tuple(name for name in attributes if name not in exclude_keys)
+        _field_plans[plan_key] = plan
+    return plan
+
+
+def _serialise_model(obj, exclude_keys):
+    attributes = obj.__dict__
+    return {
+        name: _serialise(attributes[name], exclude_keys)
+        for name in _get_field_plan(type(obj), attributes, exclude_keys)
+        if name in attributes
+    }
+
+
+def _serialise_other(obj, exclude_keys):
+    return str(obj)
+
+
+def _get_handler(obj):
+    cls = type(obj)
+    handler = _handlers.get(cls)
+    if handler is not None:
+        return handler
+
+    # Enum first: some enums also subclass str
+    if issubclass(cls, Enum):
+        handler = _serialise_enum
+    elif issubclass(cls, (str, int, float, bool, type(None))):
+        handler = _serialise_primitive
+    elif issubclass(cls, (datetime, date)):
+        handler = _serialise_temporal
+    elif issubclass(cls, UUID):
+        handler = _serialise_uuid
+    elif issubclass(cls, (list, tuple)):
+        handler = _serialise_list
+    elif issubclass(cls, dict):
+        handler = _serialise_dict
+    elif hasattr(obj, "__dict__"):
+        handler = _serialise_model
+    else:
+        handler = _serialise_other
+
+    _handlers[cls] = handler
+    return handler
+
+
+def _serialise(obj, exclude_keys):
+    return _get_handler(obj)(obj, exclude_keys)
+
+
+def serialise_xero_object(obj, exclude_currency=False):
+    """
+    Convert an SDK object (or list/dict of them) into JSON-safe data.
+
+    Args:
+        obj: The xero_python model, or any nesting of lists/dicts of them
+        exclude_currency: Also drop _currency_code/_currency_rate everywhere
+
+    Returns:
+        Plain dicts/lists/scalars ready to store in a JSONField.
+    """
+    exclude_keys = _ENUM_AND_CURRENCY_KEYS if exclude_currency else ENUM_INTERNAL_KEYS
+    return _serialise(obj, exclude_keys)
+
+
+def get_raw_json_hash(raw_json):
+    """
+    Compact digest of serialised raw_json, independent of key order.
+    Stored alongside each record so a sync can tell Xero sent it back unchanged.
+    """
+    payload = json.dumps(raw_json, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
@@ -1,12 +1,14 @@
 from decimal import Decimal
 import logging
-import time
-from datetime import date, datetime, timedelta
-from uuid import UUID
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
-from django.db import models, transaction
+from django.db import connections, models, transaction
 from django.db.utils import IntegrityError
 from django.utils import timezone
 from django.conf import settings
@@ -16,10 +18,16 @@ from xero_python.exceptions.http_status_exceptions import RateLimitException
 from apps.workflow.utils import get_machine_id
 from apps.workflow.models import CompanyDefaults
 from apps.workflow.api.xero.reprocess_xero import (
+    create_journals_batch,
     set_client_fields,
-    set_invoice_or_bill_fields,
+    set_invoice_or_bill_fields_batch,
     set_journal_fields,
 )
+from apps.workflow.api.xero.rate_limit import get_headroom, get_retry_after
+from apps.workflow.api.xero.serialisation import (
+    get_raw_json_hash,
+    serialise_xero_object,
+)
 from apps.workflow.api.xero.xero import (
     api_client,
     get_tenant_id,
@@ -44,16 +52,28 @@ from apps.client.models import Client
 
 logger = logging.getLogger("xero")
 
+# How many pages the background fetcher may get ahead of the DB writes
+PREFETCH_QUEUE_SIZE = 2
+
+# How many entity streams _sync_all_xero_data runs at once once contacts and
+# accounts are in. Each stream also has its own prefetch thread; the rate
+# governor caps actual concurrent calls to Xero.
+ENTITY_SYNC_WORKERS = 3
+
+# Clients kept by the contact resolver during a sync run, and how many
+# missing contacts to ask Xero for per get_contacts call
+CONTACT_CACHE_SIZE = 2000
+CONTACT_FETCH_BATCH_SIZE = 50
+
 
 def apply_rate_limit_delay(response_headers):
     """
-    Applies a dynamic delay based on the 'Retry-After' header returned by Xero.
-    This is needed in case we get a 429 error (rate limit exceeded).
+    The api_client's rate governor has already recorded the 429, and the
+    next call through it waits out the 'Retry-After' period, so every caller
+    backs off together instead of sleeping independently.
+    Returns the number of seconds Xero asked us to wait.
     """
-    retry_after = int(response_headers.get("Retry-After", 0))
-    if retry_after > 0:
-        logger.warning(f"Rate limit reached. Retrying after {retry_after} seconds...")
-        time.sleep(retry_after)
+    return get_retry_after(response_headers)
 
 
 def sync_xero_data(
@@ -113,8 +133,6 @@ def sync_xero_data(
         "lastSync": last_modified_time,
     }
 
-    offset = 0
-    page = 1
     page_size = 20
     total_processed = 0
     total_items = None
@@ -138,151 +156,119 @@ def sync_xero_data(
     if additional_params:
         base_params.update(additional_params)
 
-    while True:
-        # Prepare the API parameters for this iteration.
-        params = dict(base_params)
-        if pagination_mode == "offset":
-            params["offset"] = offset
-        elif pagination_mode == "page":
-            params["page"] = page
-
-        try:
-            # Fetch the entities from the API based on the prepared parameters.
-            logger.debug(
-                f"Making API call for {xero_entity_type} with params: {params}"
-            )
-            entities = xero_api_fetch_function(**params)
-            if entities is None:
-                logger.error(f"API call returned None for {xero_entity_type}")
-                raise ValueError(f"API call returned None for {xero_entity_type}")
-            # Extract the relevant data. For some entities (like 'items'), the API directly returns a list.
-            # For others (like 'accounts'), it returns an object with an attribute containing the list.
-            if isinstance(entities, list):
-                logger.warning(
-                    "Xero entities is a list, using it directly! Workaround fo Xero Items"
-                )
-                items = entities
-            else:
-                items = getattr(entities, xero_entity_type)
+    # Page N+1 is fetched in the background while page N is written to the DB
+    for kind, entities, items in prefetch_xero_pages(
+        xero_entity_type,
+        xero_api_fetch_function,
+        base_params,
+        pagination_mode,
+        page_size,
+    ):
+        if kind == "rate_limit":
+            # The fetcher has hit the limit and is waiting for Retry-After
+            retry_after = get_retry_after(entities.headers)
+            yield {
+                "datetime": timezone.now().isoformat(),
+                "entity": our_entity_type,
+                "severity": "warning",
+                "message": f"Rate limit hit, waiting {retry_after} seconds",
+                "progress": None,
+                "lastSync": last_modified_time,
+            }
+            continue
 
-            if not items:
-                logger.info("No items to sync.")
+        if not items:
+            logger.info("No items to sync.")
+            yield {
+                "datetime": timezone.now().isoformat(),
+                "entity": our_entity_type,
+                "severity": "info",
+                "message": "No items to sync",
+                "progress": 1.0,
+                "lastSync": timezone.now().isoformat(),
+            }
+            return
+
+        # Get total items for progress tracking
+        match xero_entity_type:
+            case entity if entity in [
+                "contacts",
+                "invoices",
+                "credit_notes",
+                "purchase_orders",
+            ]:
+                total_items = entities.pagination.item_count
                 yield {
                     "datetime": timezone.now().isoformat(),
                     "entity": our_entity_type,
                     "severity": "info",
-                    "message": "No items to sync",
-                    "progress": 1.0,
-                    "lastSync": timezone.now().isoformat(),
+                    "message": f"Found {total_items} {our_entity_type} to sync",
+                    "progress": 0.0,
+                    "totalItems": total_items,
                 }
-                return
+            case "accounts":
+                total_items = len(items)  # For accounts, we get all items at once
+                yield {
+                    "datetime": timezone.now().isoformat(),
+                    "entity": our_entity_type,
+                    "severity": "info",
+                    "message": f"Found {total_items} accounts to sync",
+                    "progress": 0.0,
+                    "totalItems": total_items,
+                }
+            case "journals":
+                total_items = len(items)  # For journals, we get all items at once
+                yield {
+                    "datetime": timezone.now().isoformat(),
+                    "entity": our_entity_type,
+                    "severity": "info",
+                    "message": f"Found {total_items} journals to sync",
+                    "progress": 0.0,
+                    "totalItems": total_items,
+                }
+            case "quotes":
+                total_items = len(items)  # For quotes, we get all items at once
+                yield {
+                    "datetime": timezone.now().isoformat(),
+                    "entity": our_entity_type,
+                    "severity": "info",
+                    "message": f"Found {total_items} quotes to sync",
+                    "progress": 0.0,
+                    "totalItems": total_items,
+                }
+            case "items":
+                total_items = len(items)
+                yield {
+                    "datetime": timezone.now().isoformat(),
+                    "entity": our_entity_type,
+                    "severity": "info",
+                    "message": f"Found {total_items} items to sync",
+                    "progress": 0.0,
+                    "totalItems": total_items,
+                }
+            case _:
+                raise ValueError(f"Unexpected entity type: {xero_entity_type}")
 
-            # Get total items for progress tracking
-            match xero_entity_type:
-                case entity if entity in [
-                    "contacts",
-                    "invoices",
-                    "credit_notes",
-                    "purchase_orders",
-                ]:
-                    total_items = entities.pagination.item_count
-                    yield {
-                        "datetime": timezone.now().isoformat(),
-                        "entity": our_entity_type,
-                        "severity": "info",
-                        "message": f"Found {total_items} {our_entity_type} to sync",
-                        "progress": 0.0,
-                        "totalItems": total_items,
-                    }
-                case "accounts":
-                    total_items = len(items)  # For accounts, we get all items at once
-                    yield {
-                        "datetime": timezone.now().isoformat(),
-                        "entity": our_entity_type,
-                        "severity": "info",
-                        "message": f"Found {total_items} accounts to sync",
-                        "progress": 0.0,
-                        "totalItems": total_items,
-                    }
-                case "journals":
-                    total_items = len(items)  # For journals, we get all items at once
-                    yield {
-                        "datetime": timezone.now().isoformat(),
-                        "entity": our_entity_type,
-                        "severity": "info",
-                        "message": f"Found {total_items} journals to sync",
-                        "progress": 0.0,
-                        "totalItems": total_items,
-                    }
-                case "quotes":
-                    total_items = len(items)  # For quotes, we get all items at once
-                    yield {
-                        "datetime": timezone.now().isoformat(),
-                        "entity": our_entity_type,
-                        "severity": "info",
-                        "message": f"Found {total_items} quotes to sync",
-                        "progress": 0.0,
-                        "totalItems": total_items,
-                    }
-                case "items":
-                    total_items = len(items)
-                    yield {
-                        "datetime": timezone.now().isoformat(),
-                        "entity": our_entity_type,
-                        "severity": "info",
-                        "message": f"Found {total_items} items to sync",
-                        "progress": 0.0,
-                        "totalItems": total_items,
-                    }
-                case _:
-                    raise ValueError(f"Unexpected entity type: {xero_entity_type}")
-
-            # Process the current batch of items
+        # Process the current batch of items
+        while True:
             try:
                 sync_function(items)
-                total_processed += len(items)
-
-                # Calculate progress based on entity type
-                progress = None
-                if total_items:
-                    progress = min(
-                        total_processed / total_items, 0.99
-                    )  # Cap at 99% until complete
-
-                # Prepare progress message based on entity type
-                match xero_entity_type:
-                    case "journals":
-                        current_batch_end = max(item.journal_number for item in items)
-                        message = f"Processed journals {current_batch_start} to {current_batch_end}"
-                    case entity if entity in [
-                        "contacts",
-                        "invoices",
-                        "credit_notes",
-                        "purchase_orders",
-                    ]:
-                        message = f"Processed {total_processed} of {total_items} {our_entity_type}"
-                    case "quotes":
-                        message = f"Processed {total_processed} of {total_items} quotes"
-                    case "accounts":
-                        message = (
-                            f"Processed {total_processed} of {total_items} accounts"
-                        )
-                    case "items":
-                        message = f"Processed {total_processed} of {total_items} items"
-                    case _:
-                        raise ValueError(f"Unexpected entity type: {xero_entity_type}")
-
+                break
+            except RateLimitException as e:
+                # Pushing back to Xero (e.g. contacts) can also be rate limited.
+                # Wait as instructed and retry the same page.
+                logger.warning(
+                    f"Rate limit hit when syncing {our_entity_type}. Applying dynamic delay."
+                )
+                retry_after = apply_rate_limit_delay(e.headers)
                 yield {
                     "datetime": timezone.now().isoformat(),
                     "entity": our_entity_type,
-                    "severity": "info",
-                    "message": message,
-                    "progress": progress,
-                    "lastSync": timezone.now().isoformat(),
-                    "processedCount": total_processed,
-                    "totalCount": total_items,
+                    "severity": "warning",
+                    "message": f"Rate limit hit, waiting {retry_after} seconds",
+                    "progress": None,
+                    "lastSync": last_modified_time,
                 }
-
             except Exception as e:
                 logger.error(f"Error in sync function for {our_entity_type}: {str(e)}")
                 yield {
@@ -295,6 +281,140 @@ def sync_xero_data(
                 }
                 raise
 
+        total_processed += len(items)
+
+        # Calculate progress based on entity type
+        progress = None
+        if total_items:
+            progress = min(
+                total_processed / total_items, 0.99
+            )  # Cap at 99% until complete
+
+        # Prepare progress message based on entity type
+        match xero_entity_type:
+            case "journals":
+                current_batch_end = max(item.journal_number for item in items)
+                message = (
+                    f"Processed journals {current_batch_start} to {current_batch_end}"
+                )
+            case entity if entity in [
+                "contacts",
+                "invoices",
+                "credit_notes",
+                "purchase_orders",
+            ]:
+                message = (
+                    f"Processed {total_processed} of {total_items} {our_entity_type}"
+                )
+            case "quotes":
+                message = f"Processed {total_processed} of {total_items} quotes"
+            case "accounts":
+                message = f"Processed {total_processed} of {total_items} accounts"
+            case "items":
+                message = f"Processed {total_processed} of {total_items} items"
+            case _:
+                raise ValueError(f"Unexpected entity type: {xero_entity_type}")
+
+        yield {
+            "datetime": timezone.now().isoformat(),
+            "entity": our_entity_type,
+            "severity": "info",
+            "message": message,
+            "progress": progress,
+            "lastSync": timezone.now().isoformat(),
+            "processedCount": total_processed,
+            "totalCount": total_items,
+            "rateLimit": get_headroom(),
+        }
+
+        # Terminate if last batch was smaller than page size or if it's accounts
+        if len(items) < page_size or pagination_mode == "single":
+            logger.info("Finished processing all items.")
+            yield {
+                "datetime": timezone.now().isoformat(),
+                "entity": our_entity_type,
+                "severity": "info",
+                "message": f"Completed sync of {total_processed} {our_entity_type}",
+                "progress": 1.0,
+                "lastSync": timezone.now().isoformat(),
+                "processedCount": total_processed,
+                "totalCount": total_items,
+            }
+            break
+
+
+def _fetch_xero_pages(
+    xero_entity_type,
+    xero_api_fetch_function,
+    base_params,
+    pagination_mode,
+    page_size,
+    page_queue,
+    stop_event,
+):
+    """
+    Producer side of prefetch_xero_pages. Runs in its own thread, fetching
+    pages from Xero and putting (kind, entities, items) tuples on page_queue.
+    """
+
+    def put(entry):
+        # Block while the consumer is busy, but give up if it has gone away
+        while not stop_event.is_set():
+            try:
+                page_queue.put(entry, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    offset = 0
+    page = 1
+
+    try:
+        while not stop_event.is_set():
+            # Prepare the API parameters for this iteration.
+            params = dict(base_params)
+            if pagination_mode == "offset":
+                params["offset"] = offset
+            elif pagination_mode == "page":
+                params["page"] = page
+
+            try:
+                # Fetch the entities from the API based on the prepared parameters.
+                logger.debug(
+                    f"Making API call for {xero_entity_type} with params: {params}"
+                )
+                entities = xero_api_fetch_function(**params)
+            except RateLimitException as e:
+                logger.warning(
+                    f"Rate limit hit when fetching {xero_entity_type}. Applying dynamic delay."
+                )
+                apply_rate_limit_delay(e.headers)
+                if not put(("rate_limit", e, None)):
+                    return
+                # Retry the same page; the governor holds the call until Retry-After
+                continue
+
+            if entities is None:
+                logger.error(f"API call returned None for {xero_entity_type}")
+                raise ValueError(f"API call returned None for {xero_entity_type}")
+            # Extract the relevant data. For some entities (like 'items'), the API directly returns a list.
+            # For others (like 'accounts'), it returns an object with an attribute containing the list.
+            if isinstance(entities, list):
+                logger.warning(
+                    "Xero entities is a list, using it directly! Workaround fo Xero Items"
+                )
+                items = entities
+            else:
+                items = getattr(entities, xero_entity_type)
+
+            if not put(("page", entities, items)):
+                return
+
+            # Same termination rule as the consumer: a short page is the last one
+            if not items or len(items) < page_size or pagination_mode == "single":
+                return
+
             # Update parameters to ensure progress in pagination.
             if pagination_mode == "page":
                 # Increment page for page mode.
@@ -303,42 +423,60 @@ def sync_xero_data(
                 # Use JournalNumber for offset progression for journals.
                 max_journal_number = max(item.journal_number for item in items)
                 offset = max_journal_number + 1
+    except Exception as e:
+        put(("error", e, None))
+    finally:
+        put(("done", None, None))
+        # Token lookups may have opened a DB connection on this thread
+        connections.close_all()
 
-            # Terminate if last batch was smaller than page size or if it's accounts
-            if len(items) < page_size or pagination_mode == "single":
-                logger.info("Finished processing all items.")
-                yield {
-                    "datetime": timezone.now().isoformat(),
-                    "entity": our_entity_type,
-                    "severity": "info",
-                    "message": f"Completed sync of {total_processed} {our_entity_type}",
-                    "progress": 1.0,
-                    "lastSync": timezone.now().isoformat(),
-                    "processedCount": total_processed,
-                    "totalCount": total_items,
-                }
-                break
-            else:
-                # Avoid hitting API rate limits
-                time.sleep(5)
 
-        except RateLimitException as e:
-            # Use the apply_rate_limit_delay function to handle rate limiting
-            logger.warning(
-                f"Rate limit hit when syncing {our_entity_type}. Applying dynamic delay."
-            )
-            retry_after = int(e.response_headers.get("Retry-After", 0))
-            yield {
-                "datetime": timezone.now().isoformat(),
-                "entity": our_entity_type,
-                "severity": "warning",
-                "message": f"Rate limit hit, waiting {retry_after} seconds",
-                "progress": None,
-                "lastSync": last_modified_time,
-            }
-            apply_rate_limit_delay(e.response_headers)
-            # Continue the loop to retry after the delay
-            continue
+def prefetch_xero_pages(
+    xero_entity_type,
+    xero_api_fetch_function,
+    base_params,
+    pagination_mode,
+    page_size,
+):
+    """
+    Yield pages from Xero while the next page is already being fetched.
+
+    A fetcher thread pulls pages into a bounded queue so network time overlaps
+    with whatever the caller does with the current page. Yields
+    ("page", entities, items) for each page and ("rate_limit", exception, None)
+    whenever the fetcher is backing off. Errors raised by the fetcher are
+    re-raised here.
+    """
+    page_queue = queue.Queue(maxsize=PREFETCH_QUEUE_SIZE)
+    stop_event = threading.Event()
+    fetcher = threading.Thread(
+        target=_fetch_xero_pages,
+        args=(
+            xero_entity_type,
+            xero_api_fetch_function,
+            base_params,
+            pagination_mode,
+            page_size,
+            page_queue,
+            stop_event,
+        ),
+        name=f"xero-prefetch-{xero_entity_type}",
+        daemon=True,
+    )
+    fetcher.start()
+
+    try:
+        while True:
+            kind, entities, items = page_queue.get()
+            if kind == "done":
+                return
+            if kind == "error":
+                raise entities
+            yield kind, entities, items
+    finally:
+        # Stops the fetcher early if the consumer bailed out
+        stop_event.set()
+        fetcher.join()
 
 
 def get_last_modified_time(model):
@@ -365,64 +503,93 @@ def get_last_modified_time(model):
     return last_modified_str
 
 
-def serialise_xero_object(obj):
-    if isinstance(obj, (str, int, float, bool, type(None))):
-        return obj
-    elif isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    elif isinstance(obj, UUID):
-        return str(obj)
-    elif isinstance(obj, (list, tuple)):
-        return [serialise_xero_object(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {key: serialise_xero_object(value) for key, value in obj.items()}
-    elif hasattr(obj, "__dict__"):
-        return serialise_xero_object(obj.__dict__)
-    else:
-        return str(obj)
-
+class ContactResolver:
+    """
+    Resolves Xero contact IDs to Clients for the duration of one sync run.
 
-def remove_junk_json_fields(data):
-    """We delete currency fields because they're really bulky and repeated on every invoice"""
-    exclude_keys = {"_currency_code", "_currency_rate"}
+    Documents are resolved a page at a time: the whole page is looked up with
+    one Client query, any contacts we don't have yet are fetched with a single
+    get_contacts(i_ds=[...]) call, and the results are kept in an LRU so later
+    pages referencing the same customers and suppliers don't hit the DB again.
+    Shared by the entity streams, which run in parallel.
+    """
 
-    if isinstance(data, dict):
-        # Recursively remove currency fields from the dictionary
+    def __init__(self, max_size=CONTACT_CACHE_SIZE):
+        self.max_size = max_size
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+        # Two streams can miss the same contact; only one may fetch and create it
+        self._fetch_lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def _get_cached(self, contact_ids):
+        found = {}
+        with self._lock:
+            for contact_id in contact_ids:
+                client = self._clients.get(contact_id)
+                if client is not None:
+                    self._clients.move_to_end(contact_id)
+                    found[contact_id] = client
+        return found
+
+    def _cache(self, clients_by_contact_id):
+        with self._lock:
+            for contact_id, client in clients_by_contact_id.items():
+                self._clients[contact_id] = client
+                self._clients.move_to_end(contact_id)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+
+    def _get_local(self, contact_ids):
         return {
-            key: remove_junk_json_fields(value)
-            for key, value in data.items()
-            if key not in exclude_keys
+            client.xero_contact_id: client
+            for client in Client.objects.filter(xero_contact_id__in=contact_ids)
         }
-    elif isinstance(data, list):
-        # Recursively apply this function for lists of items
-        return [remove_junk_json_fields(item) for item in data]
-    else:
-        return data  # Base case: return data as-is if it's not a dict or list
 
+    def _fetch_missing(self, contact_ids):
+        """Fetch contacts we don't hold yet from Xero and create their Clients."""
+        with self._fetch_lock:
+            found = self._get_local(contact_ids)
+            missing = [
+                contact_id for contact_id in contact_ids if contact_id not in found
+            ]
+            accounting_api = AccountingApi(api_client)
+            for start in range(0, len(missing), CONTACT_FETCH_BATCH_SIZE):
+                batch = missing[start : start + CONTACT_FETCH_BATCH_SIZE]
+                logger.info(f"Fetching {len(batch)} missing contacts from Xero")
+                response = accounting_api.get_contacts(
+                    get_tenant_id(), i_ds=batch, include_archived=True
+                )
+                contacts = response.contacts if response and response.contacts else []
+                for client in sync_clients(contacts, sync_back_to_xero=False):
+                    found[client.xero_contact_id] = client
+        return found
+
+    def resolve(self, contact_ids):
+        """
+        Return a map of contact_id -> Client for every ID we could resolve.
+        Contacts Xero doesn't know about are simply absent from the result.
+        """
+        contact_ids = list(dict.fromkeys(str(cid) for cid in contact_ids if cid))
+        found = self._get_cached(contact_ids)
 
-def clean_raw_json(data):
-    def is_unwanted_field(key, value):
-        unwanted_patterns = [
-            "_value2member_map_",
-            "_generate_next_value_",
-            "_member_names_",
-            "__objclass__",
-        ]
-        return any(pattern in key for pattern in unwanted_patterns)
-
-    def recursively_clean(data):
-        if isinstance(data, dict):
-            return {
-                k: recursively_clean(v)
-                for k, v in data.items()
-                if not is_unwanted_field(k, v)
-            }
-        elif isinstance(data, list):
-            return [recursively_clean(i) for i in data]
-        else:
-            return data
+        missing = [cid for cid in contact_ids if cid not in found]
+        if missing:
+            local = self._get_local(missing)
+            missing = [cid for cid in missing if cid not in local]
+            if missing:
+                local.update(self._fetch_missing(missing))
+            self._cache(local)
+            found.update(local)
+
+        return found
 
-    return recursively_clean(data)
+
+# Scoped to one sync run: _sync_all_xero_data clears it at the start and end
+contact_resolver = ContactResolver()
 
 
 def get_or_fetch_client_by_contact_id(contact_id, invoice_number=None):
@@ -438,29 +605,80 @@ def get_or_fetch_client_by_contact_id(contact_id, invoice_number=None):
     Raises:
         ValueError: If the client is not found in Xero.
     """
-    client = Client.objects.filter(xero_contact_id=contact_id).first()
+    client = contact_resolver.resolve([contact_id]).get(str(contact_id))
     if client:
         return client
 
     entity_ref = (
         f"invoice {invoice_number}" if invoice_number else f"contact ID {contact_id}"
     )
+    logger.warning(f"Client not found for {entity_ref}")
+    raise ValueError(f"Client not found for {entity_ref}")
+
+
+def _resolve_page_contacts(items):
+    """Resolve every contact referenced on a page up front, in one go."""
+    contact_resolver.resolve(
+        [item.contact.contact_id for item in items if getattr(item, "contact", None)]
+    )
+
+
+def _serialise_changed(
+    model, items, id_attr, id_field="xero_id", exclude_currency=False
+):
+    """
+    Serialise a page of Xero objects and drop the ones whose raw_json digest
+    matches the one we already hold, using a single IN query for the page.
+
+    Deep syncs mostly re-pull records that haven't changed, so this saves the
+    field mapping, saves and line-item writes for all of those.
+
+    Returns:
+        list of (item, raw_json, raw_json_hash) for new or changed items,
+        in their original order.
+    """
+    serialised = []
+    for item in items:
+        raw_json = serialise_xero_object(item, exclude_currency=exclude_currency)
+        serialised.append((item, raw_json, get_raw_json_hash(raw_json)))
+
+    stored_hashes = {
+        str(xero_id): raw_json_hash
+        for xero_id, raw_json_hash in model.objects.filter(
+            **{f"{id_field}__in": [getattr(item, id_attr) for item in items]}
+        ).values_list(id_field, "raw_json_hash")
+    }
+
+    changed = [
+        (item, raw_json, raw_json_hash)
+        for item, raw_json, raw_json_hash in serialised
+        if stored_hashes.get(str(getattr(item, id_attr))) != raw_json_hash
+    ]
 
-    missing_client = AccountingApi(api_client).get_contact(get_tenant_id(), contact_id)
-    if not missing_client:
-        logger.warning(f"Client not found for {entity_ref}")
-        raise ValueError(f"Client not found for {entity_ref}")
+    skipped = len(serialised) - len(changed)
+    if skipped:
+        logger.info(f"{model.__name__}: skipped {skipped} unchanged records")
+    return changed
 
-    synced_clients = sync_clients([missing_client], sync_back_to_xero=False)
-    if not synced_clients:
-        logger.warning(f"Client not found for {entity_ref}")
-        raise ValueError(f"Client not found for {entity_ref}")
-    return synced_clients[0]
+
+def _get_existing_documents(model, xero_ids):
+    """Return a map of str(xero_id) -> instance for the given Xero IDs."""
+    return {
+        str(document.xero_id): document
+        for document in model.objects.filter(xero_id__in=xero_ids)
+    }
 
 
 def sync_invoices(invoices):
     """Sync Xero invoices (ACCREC)."""
-    for inv in invoices:
+    changed = _serialise_changed(Invoice, invoices, "invoice_id")
+    _resolve_page_contacts([inv for inv, _, _ in changed])
+    existing_invoices = _get_existing_documents(
+        Invoice, [getattr(inv, "invoice_id") for inv, _, _ in changed]
+    )
+
+    page = []
+    for inv, raw_json, raw_json_hash in changed:
         xero_id = getattr(inv, "invoice_id")
 
         # Retrieve the client for the invoice first
@@ -468,23 +686,26 @@ def sync_invoices(invoices):
             inv.contact.contact_id, inv.invoice_number
         )
 
-        dirty_raw_json = serialise_xero_object(inv)
-        raw_json = clean_raw_json(dirty_raw_json)
-
         # Retrieve or create the invoice (without saving initially)
-        try:
-            invoice = Invoice.objects.get(xero_id=xero_id)
-            created = False
-        except Invoice.DoesNotExist:
+        invoice = existing_invoices.get(str(xero_id))
+        created = invoice is None
+        if created:
             invoice = Invoice(xero_id=xero_id, client=client)
-            created = True
 
         # Update raw_json
         invoice.raw_json = raw_json
+        invoice.raw_json_hash = raw_json_hash
+        page.append((invoice, created))
 
-        # Set other fields from raw_json using set_invoice_fields
-        set_invoice_or_bill_fields(invoice, "INVOICE")
+    # Set other fields from raw_json and write the whole page in one go
+    failures = set_invoice_or_bill_fields_batch(
+        [invoice for invoice, _ in page], "INVOICE"
+    )
+    skipped = {id(document) for document, _ in failures}
 
+    for invoice, created in page:
+        if id(invoice) in skipped:
+            continue
         # Log whether the invoice was created or updated
         if created:
             logger.info(
@@ -500,10 +721,15 @@ def sync_invoices(invoices):
 
 def sync_bills(bills):
     """Sync Xero bills (ACCPAY)."""
-    for bill_data in bills:
+    changed = _serialise_changed(Bill, bills, "invoice_id")
+    _resolve_page_contacts([bill_data for bill_data, _, _ in changed])
+    existing_bills = _get_existing_documents(
+        Bill, [getattr(bill_data, "invoice_id") for bill_data, _, _ in changed]
+    )
+
+    page = []
+    for bill_data, raw_json, raw_json_hash in changed:
         xero_id = getattr(bill_data, "invoice_id")
-        dirty_raw_json = serialise_xero_object(bill_data)
-        raw_json = clean_raw_json(dirty_raw_json)
         bill_number = raw_json["_invoice_number"]
         status = raw_json.get("_status")
         date = raw_json.get("_date")
@@ -520,25 +746,29 @@ def sync_bills(bills):
         )
 
         # Retrieve or create the bill without saving immediately
-        try:
-            bill = Bill.objects.get(xero_id=xero_id)
-            created = False
-        except Bill.DoesNotExist:
-            bill = Bill(xero_id=xero_id, client=client)
-            created = True
+        bill = existing_bills.get(str(xero_id))
+        created = bill is None
+        if created:
             # If the bill does not exist locally AND is deleted in Xero, skip creation
             if bill_data.status == "DELETED":
                 logger.info(
                     f"Skipping creation of deleted bill with Xero ID {getattr(bill_data, 'invoice_id', 'N/A')} that does not exist locally."
                 )
                 continue  # Skip to the next bill
+            bill = Bill(xero_id=xero_id, client=client)
 
         # Update raw_json and other necessary fields
         bill.raw_json = raw_json
+        bill.raw_json_hash = raw_json_hash
+        page.append((bill, created))
 
-        # Set other fields using set_bill_fields (which also saves the bill)
-        set_invoice_or_bill_fields(bill, "BILL")
+    # Set other fields from raw_json and write the whole page in one go
+    failures = set_invoice_or_bill_fields_batch([bill for bill, _ in page], "BILL")
+    skipped = {id(document) for document, _ in failures}
 
+    for bill, created in page:
+        if id(bill) in skipped:
+            continue
         # Log whether the bill was created or updated
         if created:
             logger.info(
@@ -554,12 +784,11 @@ def sync_bills(bills):
 def sync_items(items_data):
     """Sync Xero Inventory Items to the Stock model."""
     logger.info(f"Starting sync for {len(items_data)} Xero Items.")
-    for item_data in items_data:
+    for item_data, raw_json, raw_json_hash in _serialise_changed(
+        Stock, items_data, "item_id"
+    ):
         xero_id = getattr(item_data, "item_id")
 
-        dirty_raw_json = serialise_xero_object(item_data)
-        raw_json = clean_raw_json(dirty_raw_json)
-
         try:
             stock_item = Stock.objects.get(xero_id=xero_id)
             created = False
@@ -614,6 +843,7 @@ def sync_items(items_data):
 
         # Store raw JSON and last modified date
         stock_item.raw_json = raw_json
+        stock_item.raw_json_hash = raw_json_hash
         if hasattr(item_data, "updated_date_utc") and item_data.updated_date_utc:
             stock_item.xero_last_modified = item_data.updated_date_utc
         else:
@@ -645,10 +875,16 @@ def sync_items(items_data):
 
 def sync_credit_notes(notes):
     """Sync Xero credit notes."""
-    for note_data in notes:
+    changed = _serialise_changed(CreditNote, notes, "credit_note_id")
+    _resolve_page_contacts([note_data for note_data, _, _ in changed])
+    existing_notes = _get_existing_documents(
+        CreditNote,
+        [getattr(note_data, "credit_note_id") for note_data, _, _ in changed],
+    )
+
+    page = []
+    for note_data, raw_json, raw_json_hash in changed:
         xero_id = getattr(note_data, "credit_note_id")
-        dirty_raw_json = serialise_xero_object(note_data)
-        raw_json = clean_raw_json(dirty_raw_json)
         note_number = raw_json["_credit_note_number"]
 
         # Retrieve the client for the credit note
@@ -657,19 +893,25 @@ def sync_credit_notes(notes):
         )
 
         # Retrieve or create the credit note without saving immediately
-        try:
-            note = CreditNote.objects.get(xero_id=xero_id)
-            created = False
-        except CreditNote.DoesNotExist:
+        note = existing_notes.get(str(xero_id))
+        created = note is None
+        if created:
             note = CreditNote(xero_id=xero_id, client=client)
-            created = True
 
         # Update raw_json and other necessary fields
         note.raw_json = raw_json
+        note.raw_json_hash = raw_json_hash
+        page.append((note, created))
 
-        # Set other fields using set_invoice_or_bill_fields
-        set_invoice_or_bill_fields(note, "CREDIT_NOTE")
+    # Set other fields from raw_json and write the whole page in one go
+    failures = set_invoice_or_bill_fields_batch(
+        [note for note, _ in page], "CREDIT_NOTE"
+    )
+    skipped = {id(document) for document, _ in failures}
 
+    for note, created in page:
+        if id(note) in skipped:
+            continue
         # Log whether the credit note was created or updated
         if created:
             logger.info(
@@ -686,40 +928,49 @@ def sync_credit_notes(notes):
 
 
 def sync_journals(journals):
-    """Sync Xero journals."""
-    for jrnl_data in journals:
-        xero_id = getattr(jrnl_data, "journal_id")
-        dirty_raw_json = serialise_xero_object(jrnl_data)
-        raw_json = clean_raw_json(dirty_raw_json)
+    """
+    Sync Xero journals.
 
-        # Retrieve the journal_number from raw_json
-        journal_number = raw_json["_journal_number"]
+    Journals are append-only, so new ones (almost every journal on an offset
+    page) are inserted with their lines in bulk. A journal we already hold
+    whose payload differs goes through set_journal_fields as before.
+    """
+    changed = _serialise_changed(XeroJournal, journals, "journal_id")
+    changed_ids = [getattr(jrnl_data, "journal_id") for jrnl_data, _, _ in changed]
+    existing_ids = {
+        str(xero_id)
+        for xero_id in XeroJournal.objects.filter(
+            xero_id__in=changed_ids
+        ).values_list("xero_id", flat=True)
+    }
 
-        # Retrieve or create the journal without saving immediately
-        try:
-            journal = XeroJournal.objects.get(xero_id=xero_id)
-            created = False
-        except XeroJournal.DoesNotExist:
-            journal = XeroJournal(xero_id=xero_id)
-            created = True
+    new_journals = []
+    for jrnl_data, raw_json, raw_json_hash in changed:
+        xero_id = getattr(jrnl_data, "journal_id")
 
-        # Update raw_json
-        journal.raw_json = raw_json
+        if str(xero_id) not in existing_ids:
+            new_journals.append(
+                XeroJournal(
+                    xero_id=xero_id, raw_json=raw_json, raw_json_hash=raw_json_hash
+                )
+            )
+            continue
 
-        # Set other fields using set_journal_fields
+        journal = XeroJournal.objects.get(xero_id=xero_id)
+        journal.raw_json = raw_json
+        journal.raw_json_hash = raw_json_hash
         set_journal_fields(journal)
+        logger.info(
+            f"Updated journal: {journal.journal_number} "
+            f"updated_at={journal.xero_last_modified}"
+        )
 
-        # Log whether the journal was created or updated
-        if created:
-            logger.info(
-                f"New journal added: {journal_number} "
-                f"updated_at={journal.xero_last_modified}"
-            )
-        else:
-            logger.info(
-                f"Updated journal: {journal_number} "
-                f"updated_at={journal.xero_last_modified}"
-            )
+    create_journals_batch(new_journals)
+    if new_journals:
+        logger.info(
+            f"New journals added: {len(new_journals)} "
+            f"({new_journals[0].journal_number}-{new_journals[-1].journal_number})"
+        )
 
 
 def sync_clients(xero_contacts, sync_back_to_xero=True):
@@ -729,17 +980,27 @@ def sync_clients(xero_contacts, sync_back_to_xero=True):
     """
     client_instances = []
 
-    for contact_data in xero_contacts:
-        xero_contact_id = getattr(contact_data, "contact_id", None)
+    # Serialize the JSON received from the API, minus the bulky currency fields
+    changed = _serialise_changed(
+        Client,
+        xero_contacts,
+        "contact_id",
+        id_field="xero_contact_id",
+        exclude_currency=True,
+    )
 
-        # Serialize and clean the JSON received from the API
-        raw_json_with_currency = serialise_xero_object(contact_data)
-        raw_json = remove_junk_json_fields(raw_json_with_currency)
+    for contact_data, raw_json, raw_json_hash in changed:
+        xero_contact_id = getattr(contact_data, "contact_id", None)
 
         client = Client.objects.filter(xero_contact_id=xero_contact_id).first()
 
+        # When pushing back to Xero, the digest is only recorded once the push
+        # succeeds. A page retried after a rate limit would otherwise skip the
+        # clients saved before it, and their push would be lost.
         if client:
             client.raw_json = raw_json
+            if not sync_back_to_xero:
+                client.raw_json_hash = raw_json_hash
             set_client_fields(client, new_from_xero=False)
             logger.info(
                 f"Updated client: {client.name} "
@@ -750,6 +1011,7 @@ def sync_clients(xero_contacts, sync_back_to_xero=True):
                 xero_contact_id=xero_contact_id,
                 xero_last_modified=timezone.now(),
                 raw_json=raw_json,
+                raw_json_hash=None if sync_back_to_xero else raw_json_hash,
             )
             set_client_fields(client, new_from_xero=True)
             logger.info(
@@ -759,8 +1021,22 @@ def sync_clients(xero_contacts, sync_back_to_xero=True):
 
         if sync_back_to_xero:
             sync_client_to_xero(client)
+            client.raw_json_hash = raw_json_hash
+            client.save(update_fields=["raw_json_hash"])
         client_instances.append(client)
 
+    # Callers still expect every contact back, unchanged ones included
+    changed_ids = {getattr(contact, "contact_id") for contact, _, _ in changed}
+    unchanged_ids = [
+        getattr(contact_data, "contact_id")
+        for contact_data in xero_contacts
+        if getattr(contact_data, "contact_id") not in changed_ids
+    ]
+    if unchanged_ids:
+        client_instances.extend(
+            Client.objects.filter(xero_contact_id__in=unchanged_ids)
+        )
+
     return client_instances
 
 
@@ -815,7 +1091,10 @@ def sync_quotes(quotes):
     """
     Sync Quotes fetched from Xero API.
     """
-    for quote_data in quotes:
+    changed = _serialise_changed(Quote, quotes, "quote_id")
+    _resolve_page_contacts([quote_data for quote_data, _, _ in changed])
+
+    for quote_data, raw_json, raw_json_hash in changed:
         xero_id = getattr(quote_data, "quote_id")
 
         # Retrieve the client for the quote
@@ -823,9 +1102,6 @@ def sync_quotes(quotes):
             quote_data.contact.contact_id, f"quote {xero_id}"
         )
 
-        # Serialize the quote data first
-        raw_json = serialise_xero_object(quote_data)
-
         # Extract status - should always be a dict with _value_ from Xero API
         status_data = raw_json.get("_status")
         if not isinstance(status_data, dict) or "_value_" not in status_data:
@@ -850,6 +1126,7 @@ def sync_quotes(quotes):
                 "xero_last_synced": timezone.now(),
                 "online_url": f"https://go.xero.com/app/quotes/edit/{xero_id}",
                 "raw_json": raw_json,
+                "raw_json_hash": raw_json_hash,
             },
         )
 
@@ -862,7 +1139,10 @@ def sync_purchase_orders(purchase_orders):
     """
     Sync Purchase Orders fetched from Xero API.
     """
-    for po_data in purchase_orders:
+    changed = _serialise_changed(PurchaseOrder, purchase_orders, "purchase_order_id")
+    _resolve_page_contacts([po_data for po_data, _, _ in changed])
+
+    for po_data, raw_json, raw_json_hash in changed:
         xero_id = getattr(po_data, "purchase_order_id")
 
         # Retrieve the supplier for the purchase order
@@ -870,9 +1150,6 @@ def sync_purchase_orders(purchase_orders):
             po_data.contact.contact_id, po_data.purchase_order_number
         )
 
-        # Serialize and clean the JSON received from the API
-        raw_json = serialise_xero_object(po_data)
-
         # Retrieve or create the purchase order
         try:
             purchase_order = PurchaseOrder.objects.get(xero_id=xero_id)
@@ -889,6 +1166,7 @@ def sync_purchase_orders(purchase_orders):
         # Set Xero sync fields
         purchase_order.xero_last_modified = raw_json.get("_updated_date_utc")
         purchase_order.xero_last_synced = timezone.now()
+        purchase_order.raw_json_hash = raw_json_hash
 
         # Map Xero status to our status
         xero_status = po_data.status
@@ -962,9 +1240,6 @@ def sync_client_to_xero(client):
         return False  # Exit early if validation fails
 
     # Step 4: Create or update the client in Xero
-    # Add a small delay before making the API call to avoid rate limits
-    time.sleep(1)
-
     try:
         if client.xero_contact_id:
             # Update existing contact
@@ -994,7 +1269,7 @@ def sync_client_to_xero(client):
         logger.warning(
             f"Rate limit hit when syncing client {client.name}. Applying dynamic delay."
         )
-        apply_rate_limit_delay(e.response_headers)
+        apply_rate_limit_delay(e.headers)
         # Re-raise the exception to be handled by the outer function
         raise
     except Exception as e:
@@ -1181,6 +1456,9 @@ def _sync_all_xero_data(use_latest_timestamps=True, days_back=30):
     accounting_api = AccountingApi(api_client)
     logger.info("Created accounting_api")
 
+    # Start the run with an empty contact cache
+    contact_resolver.clear()
+
     # Determine timestamps based on sync type
     if use_latest_timestamps:
         # Use latest timestamps from our database for normal sync
@@ -1216,6 +1494,7 @@ def _sync_all_xero_data(use_latest_timestamps=True, days_back=30):
 
     logger.info("Starting first sync_xero_data call for accounts")
 
+    # Everything else references accounts and contacts, so those go first
     yield from sync_xero_data(
         xero_entity_type="accounts",
         our_entity_type="accounts",
@@ -1234,70 +1513,126 @@ def _sync_all_xero_data(use_latest_timestamps=True, days_back=30):
         pagination_mode="page",
     )
 
-    yield from sync_xero_data(
-        xero_entity_type="invoices",
-        our_entity_type="invoices",
-        xero_api_fetch_function=accounting_api.get_invoices,
-        sync_function=sync_invoices,
-        last_modified_time=timestamps["invoice"],
-        additional_params={"where": 'Type=="ACCREC"'},
-        pagination_mode="page",
+    # The remaining entities are independent of each other
+    yield from merge_sync_streams(
+        [
+            sync_xero_data(
+                xero_entity_type="invoices",
+                our_entity_type="invoices",
+                xero_api_fetch_function=accounting_api.get_invoices,
+                sync_function=sync_invoices,
+                last_modified_time=timestamps["invoice"],
+                additional_params={"where": 'Type=="ACCREC"'},
+                pagination_mode="page",
+            ),
+            sync_xero_data(
+                xero_entity_type="invoices",  # Note: Still "invoices" in Xero
+                our_entity_type="bills",  # But "bills" in our system
+                xero_api_fetch_function=accounting_api.get_invoices,
+                sync_function=sync_bills,
+                last_modified_time=timestamps["bill"],
+                additional_params={"where": 'Type=="ACCPAY"'},
+                pagination_mode="page",
+            ),
+            sync_xero_data(
+                xero_entity_type="quotes",
+                our_entity_type="quotes",
+                xero_api_fetch_function=accounting_api.get_quotes,
+                sync_function=sync_quotes,
+                last_modified_time=timestamps["quote"],
+                pagination_mode="single",
+            ),
+            sync_xero_data(
+                xero_entity_type="credit_notes",
+                our_entity_type="credit_notes",
+                xero_api_fetch_function=accounting_api.get_credit_notes,
+                sync_function=sync_credit_notes,
+                last_modified_time=timestamps["credit_note"],
+                pagination_mode="page",
+            ),
+            sync_xero_data(
+                xero_entity_type="purchase_orders",
+                our_entity_type="purchase_orders",
+                xero_api_fetch_function=accounting_api.get_purchase_orders,
+                sync_function=sync_purchase_orders,
+                last_modified_time=timestamps["purchase_order"],
+                pagination_mode="page",
+            ),
+            sync_xero_data(
+                xero_entity_type="items",
+                our_entity_type="stock",
+                xero_api_fetch_function=get_xero_items,
+                sync_function=sync_items,
+                last_modified_time=timestamps["stock"],
+                pagination_mode="single",
+            ),
+            sync_xero_data(
+                xero_entity_type="journals",
+                our_entity_type="journals",
+                xero_api_fetch_function=accounting_api.get_journals,
+                sync_function=sync_journals,
+                last_modified_time=timestamps["journal"],
+                pagination_mode="offset",
+            ),
+        ]
     )
 
-    yield from sync_xero_data(
-        xero_entity_type="invoices",  # Note: Still "invoices" in Xero
-        our_entity_type="bills",  # But "bills" in our system
-        xero_api_fetch_function=accounting_api.get_invoices,
-        sync_function=sync_bills,
-        last_modified_time=timestamps["bill"],
-        additional_params={"where": 'Type=="ACCPAY"'},
-        pagination_mode="page",
-    )
+    contact_resolver.clear()
 
-    yield from sync_xero_data(
-        xero_entity_type="quotes",
-        our_entity_type="quotes",
-        xero_api_fetch_function=accounting_api.get_quotes,
-        sync_function=sync_quotes,
-        last_modified_time=timestamps["quote"],
-        pagination_mode="single",
-    )
 
-    yield from sync_xero_data(
-        xero_entity_type="credit_notes",
-        our_entity_type="credit_notes",
-        xero_api_fetch_function=accounting_api.get_credit_notes,
-        sync_function=sync_credit_notes,
-        last_modified_time=timestamps["credit_note"],
-        pagination_mode="page",
-    )
+def _drain_sync_stream(stream, message_queue, stop_event):
+    """Worker side of merge_sync_streams: forward one stream's messages."""
+    try:
+        if stop_event.is_set():
+            return
+        for message in stream:
+            message_queue.put(("message", message))
+            if stop_event.is_set():
+                break
+    except Exception as e:
+        message_queue.put(("error", e))
+    finally:
+        # Runs the stream's own cleanup (e.g. stopping its prefetch thread)
+        stream.close()
+        connections.close_all()
+        message_queue.put(("done", None))
 
-    yield from sync_xero_data(
-        xero_entity_type="purchase_orders",
-        our_entity_type="purchase_orders",
-        xero_api_fetch_function=accounting_api.get_purchase_orders,
-        sync_function=sync_purchase_orders,
-        last_modified_time=timestamps["purchase_order"],
-        pagination_mode="page",
-    )
 
-    yield from sync_xero_data(
-        xero_entity_type="items",
-        our_entity_type="stock",
-        xero_api_fetch_function=get_xero_items,
-        sync_function=sync_items,
-        last_modified_time=timestamps["stock"],
-        pagination_mode="single",
-    )
+def merge_sync_streams(streams, max_workers=ENTITY_SYNC_WORKERS):
+    """
+    Run several sync_xero_data generators concurrently on a small thread pool
+    and yield their progress messages as a single stream, in arrival order.
 
-    yield from sync_xero_data(
-        xero_entity_type="journals",
-        our_entity_type="journals",
-        xero_api_fetch_function=accounting_api.get_journals,
-        sync_function=sync_journals,
-        last_modified_time=timestamps["journal"],
-        pagination_mode="offset",
-    )
+    If any stream fails the others are asked to stop at their next message and
+    the first error is re-raised once they have all finished.
+    """
+    message_queue = queue.Queue()
+    stop_event = threading.Event()
+    first_error = None
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="xero-sync"
+    ) as executor:
+        for stream in streams:
+            executor.submit(_drain_sync_stream, stream, message_queue, stop_event)
+
+        pending = len(streams)
+        try:
+            while pending:
+                kind, payload = message_queue.get()
+                if kind == "done":
+                    pending -= 1
+                elif kind == "error":
+                    if first_error is None:
+                        first_error = payload
+                    stop_event.set()
+                else:
+                    yield payload
+        finally:
+            stop_event.set()
+
+    if first_error is not None:
+        raise first_error
 
 
 def one_way_sync_all_xero_data():
@@ -1473,10 +1808,6 @@ def archive_clients_in_xero(clients, batch_size=50):
             )
             success_count += len(contacts_data["contacts"])
 
-            # Add a small delay between batches to avoid rate limits
-            if i + batch_size < len(clients):
-                time.sleep(0.5)
-
         except Exception as e:
             logger.error(f"Failed to archive batch of clients in Xero: {str(e)}")
             error_count += len(contacts_data["contacts"])
@@ -1509,9 +1840,6 @@ def delete_clients_from_xero(clients):
             success_count += 1
             logger.info(f"Successfully deleted client {client.name} from Xero")
 
-            # Add a small delay between deletions to avoid rate limits
-            time.sleep(1)
-
         except Exception as e:
             error_count += 1
             logger.error(f"Failed to delete client {client.name} from Xero: {str(e)}")
@@ -14,6 +14,7 @@ from xero_python.accounting import AccountingApi
 
 from apps.workflow.models import XeroToken
 from apps.workflow.models import CompanyDefaults
+from apps.workflow.api.xero.rate_limit import governor
 
 logger = logging.getLogger("xero")
 
@@ -27,6 +28,9 @@ api_client = ApiClient(
     ),
 )
 
+# Every call through api_client shares one Xero rate budget
+governor.install(api_client)
+
 token_api = TokenApi(
     api_client,
     client_id=settings.XERO_CLIENT_ID,
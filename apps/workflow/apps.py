@@ -4,6 +4,7 @@ from django.apps import AppConfig
 from django.conf import settings
 
 # Import standalone job functions
+from apps.job.scheduler_jobs import compact_kanban_ranks_job
 from apps.workflow.scheduler_jobs import (
     xero_heartbeat_job,
     xero_regular_sync_job,
@@ -91,6 +92,20 @@ class WorkflowConfig(AppConfig):
             )
             logger.info("Added 'xero_30_day_sync' job to scheduler (Saturday morning).")
 
+            # Kanban ranks: respace columns nightly so card drops stay one-row writes
+            scheduler.add_job(
+                compact_kanban_ranks_job,
+                trigger="cron",
+                hour=3,
+                minute=0,
+                id="compact_kanban_ranks",
+                max_instances=1,
+                replace_existing=True,
+                misfire_grace_time=24 * 60 * 60,  # 24 hour grace time
+                coalesce=True,
+            )
+            logger.info("Added 'compact_kanban_ranks' job to scheduler.")
+
             try:
                 scheduler.start()
                 logger.info("APScheduler started successfully (for Xero related jobs).")
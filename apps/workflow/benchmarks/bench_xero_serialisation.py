@@ -0,0 +1,127 @@
+"""
+Micro-benchmark for serialise_xero_object against recorded Xero payloads.
+
+Run with:
+    python -m pytest apps/workflow/benchmarks/bench_xero_serialisation.py
+
+Needs pytest and pytest-benchmark. The payloads in xero_payloads.json are
+anonymised API responses; each is deserialised into SDK models exactly as the
+sync does and then repeated to make up a full page.
+"""
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from xero_python.accounting import models as accounting_models
+from xero_python.api_client import ModelFinder
+from xero_python.api_client.deserializer import deserialize
+
+from apps.workflow.api.xero.serialisation import (
+    CURRENCY_KEYS,
+    ENUM_INTERNAL_KEYS,
+    serialise_xero_object,
+)
+
+PAYLOADS_PATH = Path(__file__).with_name("xero_payloads.json")
+PAGE_SIZE = 100
+
+# (response model, payload key, attribute holding the list)
+ENTITIES = [
+    ("Invoices", "Invoices", "invoices"),
+    ("Contacts", "Contacts", "contacts"),
+    ("Journals", "Journals", "journals"),
+]
+
+
+def _legacy_serialise(obj):
+    """The previous recursive __dict__ walk, kept here as the baseline."""
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    elif isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    elif isinstance(obj, UUID):
+        return str(obj)
+    elif isinstance(obj, (list, tuple)):
+        return [_legacy_serialise(item) for item in obj]
+    elif isinstance(obj, dict):
+        return {key: _legacy_serialise(value) for key, value in obj.items()}
+    elif hasattr(obj, "__dict__"):
+        return _legacy_serialise(obj.__dict__)
+    else:
+        return str(obj)
+
+
+def _legacy_clean(data, exclude_keys):
+    if isinstance(data, dict):
+        return {
+            key: _legacy_clean(value, exclude_keys)
+            for key, value in data.items()
+            if key not in exclude_keys
+        }
+    elif isinstance(data, list):
+        return [_legacy_clean(item, exclude_keys) for item in data]
+    return data
+
+
+def _load_page(model_name, payload_key, attribute):
+    with PAYLOADS_PATH.open() as f:
+        payload = json.load(f)[payload_key]
+    response = deserialize(
+        model_name,
+        {payload_key: payload * (PAGE_SIZE // len(payload))},
+        ModelFinder(accounting_models),
+    )
+    return getattr(response, attribute)
+
+
+@pytest.fixture(scope="module", params=ENTITIES, ids=[e[0] for e in ENTITIES])
+def page(request):
+    return _load_page(*request.param)
+
+
+def _walk_keys(data):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield key
+            yield from _walk_keys(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _walk_keys(item)
+
+
+def test_output_is_clean(page):
+    raw_json = serialise_xero_object(page, exclude_currency=True)
+    keys = set(_walk_keys(raw_json))
+
+    assert not keys & ENUM_INTERNAL_KEYS
+    assert not keys & CURRENCY_KEYS
+    json.dumps(raw_json)
+
+
+def test_matches_legacy_output(page):
+    # Enum members now only carry _value_ and _name_
+    legacy_exclude = ENUM_INTERNAL_KEYS | {"_sort_order_"}
+    assert serialise_xero_object(page) == _legacy_clean(
+        _legacy_serialise(page), legacy_exclude
+    )
+
+
+def test_enums_keep_value_shape():
+    invoice = _load_page(*ENTITIES[0])[0]
+    raw_json = serialise_xero_object(invoice)
+
+    assert raw_json["_status"] == "AUTHORISED"
+    assert raw_json["_line_amount_types"]["_value_"] == "Exclusive"
+
+
+@pytest.mark.benchmark(group="serialise")
+def test_bench_serialise(benchmark, page):
+    benchmark(serialise_xero_object, page)
+
+
+@pytest.mark.benchmark(group="serialise")
+def test_bench_legacy_serialise(benchmark, page):
+    benchmark(lambda: _legacy_clean(_legacy_serialise(page), ENUM_INTERNAL_KEYS))
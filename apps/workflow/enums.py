@@ -4,3 +4,14 @@ from django.db import models
 class AIProviderTypes(models.TextChoices):
     ANTHROPIC = "Claude"
     GOOGLE = "Gemini"
+
+
+class BackgroundRunStatus(models.TextChoices):
+    """
+    Progress of a batched task run in the background
+    """
+
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
@@ -0,0 +1,222 @@
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+# Worker processes import this module before Django is set up, so models and
+# services are imported inside the functions that need them
+logger = logging.getLogger("xero")
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(
+    settings.BASE_DIR, "logs", "reprocess_xero_checkpoint.json"
+)
+
+
+# Matches the bulk write batch size in reprocess_xero
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _init_worker():
+    """Each worker is a fresh process with its own Django setup and DB connection."""
+    django.setup()
+
+
+def _reprocess_chunk(model_name, pks):
+    from apps.workflow.api.xero.reprocess_xero import reprocess_records
+
+    try:
+        return reprocess_records(model_name, pks)
+    finally:
+        close_old_connections()
+
+
+def _get_model_names():
+    from apps.workflow.api.xero.reprocess_xero import REPROCESS_MODELS
+
+    return list(REPROCESS_MODELS)
+
+
+class Checkpoint:
+    """
+    Last fully reprocessed pk per model, saved to a JSON file after every chunk.
+
+    Chunks finish out of order across the pool, so the pk only advances past
+    a chunk once it and every chunk before it are done.
+    """
+
+    DONE = "done"
+
+    def __init__(self, path):
+        self.path = path
+        self.positions = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.positions = json.load(f)
+
+    def is_done(self, model_name):
+        return self.positions.get(model_name) == self.DONE
+
+    def last_pk(self, model_name):
+        position = self.positions.get(model_name)
+        return None if position == self.DONE else position
+
+    def save(self, model_name, position):
+        self.positions[model_name] = position
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.positions, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.positions = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-derive Xero-backed records from their stored raw_json in parallel. "
+        "Progress is checkpointed, so an interrupted run resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--models",
+            nargs="+",
+            choices=_get_model_names(),
+            default=_get_model_names(),
+            help="Which record types to reprocess (default: all, in dependency order)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 2,
+            help="Worker processes, each with its own DB connection",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Records per chunk handed to a worker",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=DEFAULT_CHECKPOINT_PATH,
+            help="Where to keep the resume checkpoint",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore any saved checkpoint and start from the beginning",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--workers and --chunk-size must be at least 1")
+
+        checkpoint = Checkpoint(options["checkpoint"])
+        if options["restart"]:
+            checkpoint.clear()
+        elif checkpoint.positions:
+            self.stdout.write(f"Resuming from checkpoint {checkpoint.path}")
+
+        # Spawned (not forked) workers never share the parent's DB connection
+        with ProcessPoolExecutor(
+            max_workers=options["workers"],
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as executor:
+            for model_name in _get_model_names():
+                if model_name not in options["models"]:
+                    continue
+                if checkpoint.is_done(model_name):
+                    self.stdout.write(f"{model_name}: already done, skipping")
+                    continue
+                self._reprocess_model(
+                    executor,
+                    model_name,
+                    checkpoint,
+                    options["chunk_size"],
+                    options["workers"],
+                )
+
+        checkpoint.clear()
+        close_old_connections()
+        self.stdout.write(self.style.SUCCESS("Reprocessing complete."))
+
+    def _reprocess_model(self, executor, model_name, checkpoint, chunk_size, workers):
+        from apps.workflow.api.xero.reprocess_xero import (
+            REPROCESS_MODELS,
+            iter_pk_chunks,
+        )
+
+        model = REPROCESS_MODELS[model_name]
+        after_pk = checkpoint.last_pk(model_name)
+        queryset = model.objects.all()
+        if after_pk is not None:
+            queryset = queryset.filter(pk__gt=after_pk)
+        total = queryset.count()
+        self.stdout.write(f"{model_name}: {total} records to reprocess")
+
+        started = time.monotonic()
+        processed = failed = 0
+        # Chunks in submission order, as [last pk, finished]
+        in_order = []
+        pending = {}
+
+        def collect(futures):
+            nonlocal processed, failed
+            for future in futures:
+                chunk = pending.pop(future)
+                chunk_processed, chunk_failed = future.result()
+                processed += chunk_processed
+                failed += chunk_failed
+                chunk[1] = True
+
+            # Advance the checkpoint over the finished prefix
+            last_done = None
+            while in_order and in_order[0][1]:
+                last_done = in_order.pop(0)[0]
+            if last_done is not None:
+                checkpoint.save(model_name, str(last_done))
+
+            elapsed = time.monotonic() - started
+            rate = (processed + failed) / elapsed if elapsed else 0
+            percent = (processed + failed) / total * 100 if total else 100
+            self.stdout.write(
+                f"{model_name}: {processed + failed}/{total} ({percent:.1f}%), "
+                f"{failed} failed, {rate:.0f} records/s"
+            )
+
+        for pks in iter_pk_chunks(model, chunk_size=chunk_size, after_pk=after_pk):
+            chunk = [pks[-1], False]
+            in_order.append(chunk)
+            pending[executor.submit(_reprocess_chunk, model_name, pks)] = chunk
+
+            # Keep a couple of chunks queued per worker, no more
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        if pending:
+            done, _ = wait(pending)
+            collect(done)
+
+        checkpoint.save(model_name, Checkpoint.DONE)
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{model_name}: reprocessed {processed} ({failed} failed) "
+                f"in {elapsed:.1f}s"
+            )
+        )
+        logger.info(
+            f"Reprocessed {processed} {model_name} ({failed} failed) in {elapsed:.1f}s"
+        )
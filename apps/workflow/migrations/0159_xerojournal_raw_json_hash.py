@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workflow", "0158_delete_bill_delete_billlineitem_delete_creditnote_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="xerojournal",
+            name="raw_json_hash",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+    ]
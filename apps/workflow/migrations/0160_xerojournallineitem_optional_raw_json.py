@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workflow", "0159_xerojournal_raw_json_hash"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="xerojournallineitem",
+            name="raw_json",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
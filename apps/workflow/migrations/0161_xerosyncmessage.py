@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workflow", "0160_xerojournallineitem_optional_raw_json"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="XeroSyncMessage",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("task_id", models.CharField(max_length=36)),
+                ("payload", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["task_id", "id"], name="workflow_xe_task_id_a1546e_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,16 +1,20 @@
 # This file is autogenerated by update_init.py script
 
 from .ai_provider import AIProvider
+from .background_run import BackgroundRun
 from .company_defaults import CompanyDefaults
 from .xero_account import XeroAccount
 from .xero_journal import XeroJournal, XeroJournalLineItem
+from .xero_sync_message import XeroSyncMessage
 from .xero_token import XeroToken
 
 __all__ = [
     'AIProvider',
+    'BackgroundRun',
     'CompanyDefaults',
     'XeroAccount',
     'XeroJournal',
     'XeroJournalLineItem',
+    'XeroSyncMessage',
     'XeroToken',
 ]
@@ -0,0 +1,87 @@
+import uuid
+from datetime import timedelta
+
+from django.db import models
+from django.utils import timezone
+
+from apps.workflow.enums import BackgroundRunStatus
+
+
+class BackgroundRun(models.Model):
+    """
+    A batched task processed in a background thread (see
+    apps.workflow.services.background_run_service).
+
+    The run writes its progress here after each batch it commits, so the
+    page that started it can follow it from any web worker. Subclasses add
+    the run's selection and counts, listing the counts in PROGRESS_FIELDS.
+    """
+
+    # A run that hasn't reported for this long is taken to have died with
+    # its process
+    STALE_AFTER = timedelta(minutes=10)
+    PROGRESS_FIELDS = ()
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(
+        max_length=20,
+        choices=BackgroundRunStatus.choices,
+        default=BackgroundRunStatus.PENDING,
+    )
+    # True while the run is pending or running and NULL after, so the unique
+    # index lets only one run of each kind be active, across every process
+    active_slot = models.BooleanField(
+        null=True, blank=True, unique=True, editable=False
+    )
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
+        ordering = ["-created_at"]
+
+    @classmethod
+    def get_active_run(cls):
+        """The run in progress, if any."""
+        return cls.objects.filter(
+            active_slot=True, updated_at__gte=timezone.now() - cls.STALE_AFTER
+        ).first()
+
+    @classmethod
+    def release_stale_runs(cls) -> int:
+        """Mark active runs that stopped reporting as failed, freeing the slot."""
+        return cls.objects.filter(
+            active_slot=True, updated_at__lt=timezone.now() - cls.STALE_AFTER
+        ).update(
+            active_slot=None,
+            status=BackgroundRunStatus.FAILED,
+            error="Stopped reporting progress",
+            updated_at=timezone.now(),
+            finished_at=timezone.now(),
+        )
+
+    @property
+    def is_finished(self):
+        return self.status in (
+            BackgroundRunStatus.COMPLETED,
+            BackgroundRunStatus.FAILED,
+        )
+
+    def record_progress(self, **fields):
+        """Commit the given fields, marking the run as still alive."""
+        type(self).objects.filter(pk=self.pk).update(
+            updated_at=timezone.now(), **fields
+        )
+
+    def get_progress(self) -> dict:
+        """The run's status as its polling endpoint returns it."""
+        return {
+            "id": str(self.id),
+            "status": self.status,
+            **{field: getattr(self, field) for field in self.PROGRESS_FIELDS},
+            "is_finished": self.is_finished,
+            "error": self.error,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -104,6 +104,10 @@ class CompanyDefaults(models.Model):
         self.is_primary = True
         super().save(*args, **kwargs)
 
+        from apps.accounting.services import KPIService
+
+        KPIService.clear_company_thresholds()
+
     @classmethod
     def get_instance(cls):
         """
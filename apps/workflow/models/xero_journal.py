@@ -19,6 +19,8 @@ class XeroJournal(models.Model):
     source_id = models.UUIDField(null=True, blank=True)
     source_type = models.CharField(max_length=50, null=True, blank=True)
     raw_json = models.JSONField()
+    # Digest of raw_json, so syncs can skip records Xero sends back unchanged
+    raw_json_hash = models.CharField(max_length=32, null=True, blank=True)
     xero_last_modified = models.DateTimeField()
     django_created_at = models.DateTimeField(auto_now_add=True)
     django_updated_at = models.DateTimeField(auto_now=True)
@@ -49,7 +51,8 @@ class XeroJournalLineItem(models.Model):
     tax_amount = models.DecimalField(max_digits=10, decimal_places=2)
     tax_type = models.CharField(max_length=50, null=True, blank=True)
     tax_name = models.CharField(max_length=255, null=True, blank=True)
-    raw_json = models.JSONField()
+    # Optional: the parent journal's raw_json already includes this line
+    raw_json = models.JSONField(null=True, blank=True)
     django_created_at = models.DateTimeField(auto_now_add=True)
     django_updated_at = models.DateTimeField(auto_now=True)
 
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class XeroSyncMessage(models.Model):
+    """
+    Append-only log of the progress messages emitted by a Xero sync run.
+
+    Every message is its own row, so writing one is O(1) however long the
+    sync runs, and any web worker can read it. The auto-incrementing id is
+    the cursor SSE readers pass back to get only newer messages.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    task_id = models.CharField(max_length=36)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [models.Index(fields=["task_id", "id"])]
+
+    def __str__(self):
+        return f"Sync {self.task_id} #{self.id}: {self.payload.get('message')}"
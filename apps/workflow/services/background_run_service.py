@@ -0,0 +1,78 @@
+"""
+Running batched tasks, such as month-end, in a background thread.
+
+The task's progress is recorded on a BackgroundRun, so the page that started
+it can poll for it from any web worker. Only one run of each kind is active
+at a time, which the database enforces so it holds across web workers.
+"""
+
+import logging
+import threading
+
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from apps.workflow.enums import BackgroundRunStatus
+
+logger = logging.getLogger(__name__)
+
+
+def start_background_run(run_model, process, **fields):
+    """
+    Create a run of run_model with the given fields and call process(run)
+    with it in a background thread.
+
+    process should commit its work a batch at a time, reporting each with
+    run.record_progress(). If it raises, the run is marked failed; batches
+    already committed stay done.
+
+    Returns:
+        (run, is_new), where is_new is False if a run was already in
+        progress, which is returned instead
+    """
+    run_model.release_stale_runs()
+    try:
+        with transaction.atomic():
+            run = run_model.objects.create(active_slot=True, **fields)
+    except IntegrityError:
+        # Another run holds the slot, perhaps just started by another worker
+        active_run = run_model.objects.filter(active_slot=True).first()
+        if active_run is None:
+            raise
+        logger.info(f"{active_run} already in progress")
+        return active_run, False
+
+    thread = threading.Thread(
+        target=_run_in_background, args=[run_model, run.pk, process], daemon=True
+    )
+    thread.start()
+
+    logger.info(f"Started {run}")
+    return run, True
+
+
+def _run_in_background(run_model, run_id, process):
+    runs = run_model.objects.filter(pk=run_id)
+    try:
+        runs.update(status=BackgroundRunStatus.RUNNING, updated_at=timezone.now())
+        process(runs.get())
+
+        runs.update(
+            status=BackgroundRunStatus.COMPLETED,
+            active_slot=None,
+            updated_at=timezone.now(),
+            finished_at=timezone.now(),
+        )
+        logger.info(f"{runs.get()} completed")
+    except Exception as e:
+        logger.exception(f"{run_model._meta.verbose_name} {run_id} failed: {str(e)}")
+        runs.update(
+            status=BackgroundRunStatus.FAILED,
+            active_slot=None,
+            error=str(e),
+            updated_at=timezone.now(),
+            finished_at=timezone.now(),
+        )
+    finally:
+        # No request ends to close the thread's connection
+        connection.close()
@@ -2,12 +2,16 @@
 
 import logging
 import threading
+import time
 import uuid
+from datetime import timedelta
+
 from django.core.cache import cache
 from django.utils import timezone
 
 from apps.workflow.api.xero.sync import synchronise_xero_data
 from apps.workflow.api.xero.xero import get_valid_token
+from apps.workflow.models import XeroSyncMessage
 
 logger = logging.getLogger("xero")
 
@@ -16,10 +20,21 @@ class XeroSyncService:
     """
     Service to handle Xero synchronization as a background process.
     Ensures only one sync runs at a time via a cache-based lock.
+
+    Progress messages go to an append-only XeroSyncMessage log rather than the
+    cache, so readers in other processes see them and fetch only what is new.
     """
 
     LOCK_TIMEOUT = 60 * 60 * 4  # 4 hours
     SYNC_STATUS_KEY = "xero_sync_status"
+    STREAM_END_MESSAGE = "Sync stream ended"
+    # How long progress logs are kept once a new sync starts
+    MESSAGE_RETENTION = timedelta(days=7)
+    # Readers in the syncing process are woken as soon as a message lands;
+    # readers in other processes re-check the log this often
+    POLL_INTERVAL = 1.0
+
+    _new_messages = threading.Condition()
 
     @staticmethod
     def start_sync():
@@ -52,8 +67,10 @@ class XeroSyncService:
             )  # Release lock if token is invalid
             return None, False
 
-        # Prepare task (message and progress keys still use task_id)
-        cache.set(f"xero_sync_messages_{task_id}", [], timeout=86400)
+        # Prepare task (progress keys still use task_id)
+        XeroSyncMessage.objects.filter(
+            created_at__lt=timezone.now() - XeroSyncService.MESSAGE_RETENTION
+        ).delete()
         cache.set(f"xero_sync_current_entity_{task_id}", None, timeout=86400)
         cache.set(f"xero_sync_entity_progress_{task_id}", 0.0, timeout=86400)
 
@@ -72,12 +89,10 @@ class XeroSyncService:
         Execute the Xero sync process and store progress messages.
         Releases lock on completion.
         """
-        messages_key = f"xero_sync_messages_{task_id}"
         current_key = f"xero_sync_current_entity_{task_id}"
         progress_key = f"xero_sync_entity_progress_{task_id}"
 
         try:
-            msgs = cache.get(messages_key, [])
             for message in synchronise_xero_data():
                 message["task_id"] = task_id
 
@@ -88,27 +103,26 @@ class XeroSyncService:
                     if message.get("progress") is not None:
                         cache.set(progress_key, message["progress"], timeout=86400)
 
-                msgs.append(message)
-                cache.set(messages_key, msgs, timeout=86400)
+                XeroSyncService.append_message(task_id, message)
 
             # Final marker
-            msgs.append(
+            XeroSyncService.append_message(
+                task_id,
                 {
                     "datetime": timezone.now().isoformat(),
                     "entity": "sync",
                     "severity": "info",
-                    "message": "Sync stream ended",
+                    "message": XeroSyncService.STREAM_END_MESSAGE,
                     "progress": 1.0,
                     "task_id": task_id,
-                }
+                },
             )
-            cache.set(messages_key, msgs, timeout=86400)
             logger.info(f"Completed Xero sync task {task_id}")
 
         except Exception as e:
             logger.error(f"Error during Xero sync task {task_id}: {e}", exc_info=True)
-            msgs = cache.get(messages_key, [])
-            msgs.append(
+            XeroSyncService.append_message(
+                task_id,
                 {
                     "datetime": timezone.now().isoformat(),
                     "entity": "sync",
@@ -116,19 +130,19 @@ class XeroSyncService:
                     "message": f"Error during sync: {e}",
                     "progress": None,
                     "task_id": task_id,
-                }
+                },
             )
-            msgs.append(
+            XeroSyncService.append_message(
+                task_id,
                 {
                     "datetime": timezone.now().isoformat(),
                     "entity": "sync",
                     "severity": "info",
-                    "message": "Sync stream ended",
+                    "message": XeroSyncService.STREAM_END_MESSAGE,
                     "progress": None,
                     "task_id": task_id,
-                }
+                },
             )
-            cache.set(messages_key, msgs, timeout=86400)
             # Re-raise the exception to ensure the calling process is aware of the failure
             # We are about to crash, so we need to clean up the lock
             cache.delete(current_key)
@@ -146,9 +160,40 @@ class XeroSyncService:
             )  # Release lock and clear task ID
 
     @staticmethod
-    def get_messages(task_id, since_index=0):
-        msgs = cache.get(f"xero_sync_messages_{task_id}", [])
-        return msgs[since_index:] if since_index < len(msgs) else []
+    def append_message(task_id, message):
+        """Add one message to the task's progress log and wake waiting readers."""
+        XeroSyncMessage.objects.create(task_id=task_id, payload=message)
+        with XeroSyncService._new_messages:
+            XeroSyncService._new_messages.notify_all()
+
+    @staticmethod
+    def get_messages(task_id, cursor=0):
+        """
+        Return the task's messages logged after cursor, as (cursor, message)
+        pairs in order. Pass the last cursor back to continue from there.
+        """
+        return list(
+            XeroSyncMessage.objects.filter(task_id=task_id, id__gt=cursor)
+            .order_by("id")
+            .values_list("id", "payload")
+        )
+
+    @staticmethod
+    def wait_for_messages(task_id, cursor=0, timeout=15.0):
+        """
+        Block until the task logs messages after cursor, or timeout seconds
+        pass. Returns the new (cursor, message) pairs, possibly none.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            messages = XeroSyncService.get_messages(task_id, cursor)
+            remaining = deadline - time.monotonic()
+            if messages or remaining <= 0:
+                return messages
+            with XeroSyncService._new_messages:
+                XeroSyncService._new_messages.wait(
+                    min(remaining, XeroSyncService.POLL_INTERVAL)
+                )
 
     @staticmethod
     def get_current_entity(task_id):
@@ -160,6 +205,21 @@ class XeroSyncService:
 
     @staticmethod
     def get_active_task_id():
-        return cache.get(
+        task_id = cache.get(
             XeroSyncService.SYNC_STATUS_KEY
         )  # Retrieve active task ID directly from the status key
+        if task_id:
+            return task_id
+
+        # The cache may be per-process, so fall back to the progress log:
+        # the latest run is still going if it hasn't logged its end marker
+        last_message = XeroSyncMessage.objects.order_by("-id").first()
+        if (
+            last_message
+            and last_message.payload.get("message")
+            != XeroSyncService.STREAM_END_MESSAGE
+            and last_message.created_at
+            > timezone.now() - timedelta(seconds=XeroSyncService.LOCK_TIMEOUT)
+        ):
+            return last_message.task_id
+        return None
@@ -22,6 +22,28 @@ function formatEntityName(entity) {
     .join(" "); // Join words back together
 }
 
+function formatRateLimit(rateLimit) {
+  if (!rateLimit) {
+    return "";
+  }
+  const day =
+    rateLimit.day_remaining === null
+      ? "unknown"
+      : `${rateLimit.day_remaining}/${rateLimit.day_limit}`;
+  let text = `Xero API budget: ${rateLimit.minute_remaining}/${rateLimit.minute_limit} this minute, ${day} today`;
+  if (rateLimit.blocked_for > 0) {
+    text += ` (rate limited, resuming in ${Math.ceil(rateLimit.blocked_for)}s)`;
+  }
+  return text;
+}
+
+function updateRateLimit(rateLimit) {
+  const headroom = document.getElementById("rate-limit-headroom");
+  if (headroom && rateLimit) {
+    headroom.textContent = formatRateLimit(rateLimit);
+  }
+}
+
 class XeroSyncProgress {
   constructor() {
     this.overallProgress = 0;
@@ -40,24 +62,25 @@ class XeroSyncProgress {
     // Check if a sync is already running
     const response = await fetch("/api/xero/sync-info/");
     const data = await response.json();
+    updateRateLimit(data.rate_limit);
 
     if (data.sync_in_progress) {
       // If a sync is running, connect to its stream
-      this.connectToStream();
+      this.connectToStream(data.task_id);
     } else {
-      // Start a new sync and wait for it to be ready
+      // Start a new sync and follow its progress log
       const syncResponse = await fetch("/api/xero/sync/");
       if (!syncResponse.ok) {
         throw new Error("Failed to start sync");
       }
-      // Wait a moment for the sync to be ready
-      await new Promise((resolve) => setTimeout(resolve, 1000));
-      this.connectToStream();
+      const syncData = await syncResponse.json();
+      this.connectToStream(syncData.task_id);
     }
   }
 
-  connectToStream() {
-    this.eventSource = new EventSource("/api/xero/sync-stream/");
+  connectToStream(taskId) {
+    const query = taskId ? `?task_id=${encodeURIComponent(taskId)}` : "";
+    this.eventSource = new EventSource(`/api/xero/sync-stream/${query}`);
 
     this.eventSource.onmessage = (event) => {
       const data = JSON.parse(event.data);
@@ -74,6 +97,7 @@ class XeroSyncProgress {
   handleSyncEvent(data) {
     // Add message to log
     this.addLogMessage(data);
+    updateRateLimit(data.rateLimit);
 
     // Update current entity if this is an entity-specific event
     if (data.entity && data.entity !== "sync") {
@@ -17,6 +17,7 @@ from django.views.decorators.http import require_POST
 
 from xero_python.identity import IdentityApi
 
+from apps.workflow.api.xero.rate_limit import get_headroom
 from apps.workflow.api.xero.xero import (
     api_client,
     exchange_code_for_token,
@@ -136,16 +137,24 @@ from apps.workflow.api.xero.xero import get_valid_token
 
 logger = logging.getLogger("xero.events")
 
+# While a sync is quiet the SSE stream sends a keepalive this often, and
+# gives up if nothing at all has been logged for SSE_IDLE_TIMEOUT
+SSE_KEEPALIVE_INTERVAL = 15
+SSE_IDLE_TIMEOUT = 60 * 10
 
-def generate_xero_sync_events():
+
+def generate_xero_sync_events(task_id=None, cursor=0):
     """
     SSE generator yielding JSON-encoded sync progress messages.
 
     Steps:
     1) Authenticate: ensure a valid Xero OAuth token is available.
-    2) Emit an initial 'Starting Xero sync' event.
-    3) Poll the XeroSyncService cache for new messages, streaming each one.
-    4) Once no lock and no new messages, emit a final 'Sync stream ended' event.
+    2) Emit an initial 'Starting Xero sync' event (fresh connections only).
+    3) Block on the XeroSyncService progress log for messages after our
+       cursor, streaming each one with its cursor as the SSE event id so a
+       reconnecting EventSource resumes where it left off.
+    4) Stop after the run's 'Sync stream ended' marker, or if the run goes
+       quiet for too long.
     5) Handle unexpected errors by logging and emitting a single error event,
        then a final end-of-stream event without re-raising exceptions.
     """
@@ -163,41 +172,47 @@ def generate_xero_sync_events():
             return
 
         # 2) Starting event
-        start_payload = {
+        if not cursor:
+            start_payload = {
+                "datetime": timezone.now().isoformat(),
+                "entity": "sync",
+                "severity": "info",
+                "message": "Starting Xero sync",
+                "progress": 0.0,
+            }
+            yield f"data: {json.dumps(start_payload)}\n\n"
+
+        # 3) Stream the run's progress log from our cursor
+        task_id = task_id or XeroSyncService.get_active_task_id()
+        idle_since = time.monotonic()
+
+        while task_id:
+            messages = XeroSyncService.wait_for_messages(
+                task_id, cursor, timeout=SSE_KEEPALIVE_INTERVAL
+            )
+            if not messages:
+                # 4a) Nothing logged for too long → assume the run died
+                if time.monotonic() - idle_since > SSE_IDLE_TIMEOUT:
+                    break
+                # Comment line keeps proxies from closing the connection
+                yield ": keepalive\n\n"
+                continue
+
+            idle_since = time.monotonic()
+            for cursor, msg in messages:
+                yield f"id: {cursor}\ndata: {json.dumps(msg)}\n\n"
+                # 4b) The run has finished and said so
+                if msg.get("message") == XeroSyncService.STREAM_END_MESSAGE:
+                    return
+
+        end_payload = {
             "datetime": timezone.now().isoformat(),
             "entity": "sync",
             "severity": "info",
-            "message": "Starting Xero sync",
-            "progress": 0.0,
+            "message": "Sync stream ended",
+            "progress": 1.0,
         }
-        yield f"data: {json.dumps(start_payload)}\n\n"
-
-        # 3) Begin streaming cached messages
-        task_id = XeroSyncService.get_active_task_id()
-        last_index = 0
-
-        while True:
-            messages = XeroSyncService.get_messages(task_id, last_index)
-
-            # 4a) If sync lock released and no pending messages → end
-            if not cache.get("xero_sync_lock", False) and not messages:
-                end_payload = {
-                    "datetime": timezone.now().isoformat(),
-                    "entity": "sync",
-                    "severity": "info",
-                    "message": "Sync stream ended",
-                    "progress": 1.0,
-                }
-                yield f"data: {json.dumps(end_payload)}\n\n"
-                break
-
-            # 4b) Stream each new message
-            for msg in messages:
-                yield f"data: {json.dumps(msg)}\n\n"
-                last_index += 1
-
-            # 4c) Sleep to reduce CPU load
-            time.sleep(0.5)
+        yield f"data: {json.dumps(end_payload)}\n\n"
 
     except Exception:
         # 5) Unexpected error
@@ -226,8 +241,14 @@ def stream_xero_sync(request: HttpRequest) -> StreamingHttpResponse:
     """
     HTTP endpoint to serve an EventSource stream of Xero sync events.
     """
+    # EventSource sends the id of the last event it saw when it reconnects
+    try:
+        cursor = int(request.headers.get("Last-Event-ID", 0))
+    except ValueError:
+        cursor = 0
     response = StreamingHttpResponse(
-        generate_xero_sync_events(), content_type="text/event-stream"
+        generate_xero_sync_events(request.GET.get("task_id"), cursor),
+        content_type="text/event-stream",
     )
     # Prevent Django or proxies from buffering
     response["Cache-Control"] = "no-cache"
@@ -650,12 +671,15 @@ def get_xero_sync_info(request):
             ),
         }
         sync_range = "Syncing data since last successful sync"
-        sync_in_progress = cache.get("xero_sync_lock", False)
+        # Read from the progress log, which every worker process can see
+        task_id = XeroSyncService.get_active_task_id()
         return JsonResponse(
             {
                 "last_syncs": last_syncs,
                 "sync_range": sync_range,
-                "sync_in_progress": sync_in_progress,
+                "sync_in_progress": task_id is not None,
+                "task_id": task_id,
+                "rate_limit": get_headroom(),
             }
         )
     except Exception as e:
@@ -357,6 +357,12 @@ DEFAULT_XERO_SCOPES = " ".join(
 )
 XERO_SCOPES = os.getenv("XERO_SCOPES", DEFAULT_XERO_SCOPES).split()
 
+# Each journal line's raw_json is also held in its parent journal's raw_json.
+# Set to False to stop storing the second copy on every line.
+XERO_STORE_JOURNAL_LINE_RAW_JSON = (
+    os.getenv("XERO_STORE_JOURNAL_LINE_RAW_JSON", "True").lower() == "true"
+)
+
 # Hardcoded production Xero tenant ID
 # THIS IS TO ENSURE WE CANNOT SYNC NON-PRODUCTION DATA TO PRODUCTION XERO
 PRODUCTION_XERO_TENANT_ID = "75e57cfd-302d-4f84-8734-8aae354e76a7"